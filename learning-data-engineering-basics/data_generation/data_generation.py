@@ -7,23 +7,38 @@ This script:
 - Generates daily attendance only for active employees on working days
 - Generates monthly payroll based on base salary and salary structure
 - Applies simple rule-based deductions (PF, tax, professional tax)
-- Inserts rows in batches with periodic commits
-- Performs basic validation checks at the end
+- Streams rows from generators in fixed-size blocks into sinks (Postgres COPY,
+  CSV, Parquet, DuckDB; see sinks.py), committing per block, so memory stays
+  flat regardless of employee count or date range
+- Performs set-based validation checks at the end (see validation.py)
 
 Configure the PostgreSQL connection via environment variables or edit DEFAULT_DB_CONFIG.
+The rows generated by a run can also be written to CSV, Parquet or DuckDB:
+
+    python data_generation.py --parquet-dir out/ --duckdb-path out/payroll.duckdb
 """
 
+import argparse
 import os
 import random
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import psycopg2
-from psycopg2.extras import execute_batch
 from faker import Faker
 from tqdm import tqdm
 
+from sinks import (
+    CsvSink,
+    DuckDBSink,
+    ParquetSink,
+    PostgresCopySink,
+    blocks,
+    write_blocks,
+)
+from validation import print_report, run_validation
+
 
 DEFAULT_DB_CONFIG = {
     "host": os.getenv("PGHOST", "localhost"),
@@ -196,16 +211,102 @@ def daterange(start: date, end: date):
         yield start + timedelta(days=n)
 
 
+# column -> SQL type as in create_schema(); typed sinks (ParquetSink) need them
+EMPLOYEE_COLUMN_TYPES = {
+    "employee_id": "INT",
+    "full_name": "TEXT",
+    "department_id": "INT",
+    "designation_id": "INT",
+    "base_salary": "NUMERIC",
+    "join_date": "DATE",
+    "exit_date": "DATE",
+}
+ATTENDANCE_COLUMN_TYPES = {"employee_id": "INT", "att_date": "DATE", "status": "TEXT"}
+PAYROLL_COLUMN_TYPES = {
+    "employee_id": "INT",
+    "year_month": "DATE",
+    "base_salary": "NUMERIC",
+    "hra_amount": "NUMERIC",
+    "da_amount": "NUMERIC",
+    "allowance_amt": "NUMERIC",
+    "gross_salary": "NUMERIC",
+    "pf_deduction": "NUMERIC",
+    "tax_deduction": "NUMERIC",
+    "prof_tax": "NUMERIC",
+    "net_salary": "NUMERIC",
+}
+EMPLOYEE_COLUMNS = list(EMPLOYEE_COLUMN_TYPES)
+ATTENDANCE_COLUMNS = list(ATTENDANCE_COLUMN_TYPES)
+PAYROLL_COLUMNS = list(PAYROLL_COLUMN_TYPES)
+
+
+def employee_rows(
+    departments: List[int],
+    designations: List[int],
+    num_employees: int,
+    start_join_date: date,
+    end_join_date: date,
+    exit_probability: float,
+    first_id: int = 1,
+) -> Iterator[Tuple]:
+    """Yield employee rows (EMPLOYEE_COLUMNS) one at a time.
+
+    Ids are assigned here, counting up from first_id, so every sink gets
+    the same employee_id the attendance and payroll rows refer to.
+    Some employees get an exit_date after join_date; others remain active.
+    """
+
+    for employee_id in range(first_id, first_id + num_employees):
+        dept_id = random.choice(departments)
+        desig_id = random.choice(designations)
+
+        # Base salary by designation seniority (rough heuristic)
+        base_salary = random.randint(25000, 90000)
+
+        join_dt_ordinal = random.randint(
+            start_join_date.toordinal(), end_join_date.toordinal()
+        )
+        join_dt = date.fromordinal(join_dt_ordinal)
+
+        if random.random() < exit_probability:
+            # Exit between 6 months and 3 years after join
+            min_exit = join_dt + timedelta(days=180)
+            max_exit = join_dt + timedelta(days=365 * 3)
+            if max_exit > end_join_date:
+                max_exit = end_join_date
+            if min_exit >= max_exit:
+                exit_dt = None
+            else:
+                exit_dt = min_exit + timedelta(
+                    days=random.randint(0, (max_exit - min_exit).days)
+                )
+        else:
+            exit_dt = None
+
+        yield (
+            employee_id,
+            random_name(),
+            dept_id,
+            desig_id,
+            float(base_salary),
+            join_dt,
+            exit_dt,
+        )
+
+
 def generate_employees(
     conn,
     num_employees: int = 10_000,
     start_join_date: date = date(2018, 1, 1),
     end_join_date: date = date(2024, 12, 31),
     exit_probability: float = 0.3,
+    block_size: int = 1000,
+    extra_sinks: Sequence = (),
 ) -> None:
-    """Generate employees with random departments/designations/base salaries.
+    """Stream generated employees into the employee table (plus extra_sinks).
 
-    Some employees get an exit_date after join_date; others remain active.
+    New ids continue after the highest existing one; the SERIAL sequence is
+    moved past them afterwards.
     """
 
     with conn.cursor() as cur:
@@ -215,62 +316,66 @@ def generate_employees(
         cur.execute("SELECT designation_id FROM designation")
         designations = [row[0] for row in cur.fetchall()]
 
-        if not departments or not designations:
-            raise RuntimeError("Master data not seeded correctly")
+        cur.execute("SELECT COALESCE(MAX(employee_id), 0) FROM employee")
+        first_id = cur.fetchone()[0] + 1
+
+    if not departments or not designations:
+        raise RuntimeError("Master data not seeded correctly")
+
+    rows = employee_rows(
+        departments,
+        designations,
+        num_employees,
+        start_join_date,
+        end_join_date,
+        exit_probability,
+        first_id,
+    )
+    with tqdm(total=num_employees, desc="Generating employees") as progress:
+        write_blocks(
+            blocks(rows, block_size),
+            PostgresCopySink(conn, "employee", EMPLOYEE_COLUMNS),
+            *extra_sinks,
+            progress=progress,
+        )
 
-        employees_batch = []
-        for _ in tqdm(range(num_employees), desc="Generating employees"):
-            dept_id = random.choice(departments)
-            desig_id = random.choice(designations)
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT setval(pg_get_serial_sequence('employee', 'employee_id'), "
+            "(SELECT MAX(employee_id) FROM employee))"
+        )
+    conn.commit()
 
-            # Base salary by designation seniority (rough heuristic)
-            base_salary = random.randint(25000, 90000)
 
-            join_dt_ordinal = random.randint(
-                start_join_date.toordinal(), end_join_date.toordinal()
-            )
-            join_dt = date.fromordinal(join_dt_ordinal)
-
-            if random.random() < exit_probability:
-                # Exit between 6 months and 3 years after join
-                min_exit = join_dt + timedelta(days=180)
-                max_exit = join_dt + timedelta(days=365 * 3)
-                if max_exit > end_join_date:
-                    max_exit = end_join_date
-                if min_exit >= max_exit:
-                    exit_dt = None
-                else:
-                    exit_dt = min_exit + timedelta(
-                        days=random.randint(0, (max_exit - min_exit).days)
-                    )
-            else:
-                exit_dt = None
+def attendance_rows(
+    employees: List[Tuple[int, date, Optional[date]]],
+    start_date: date,
+    end_date: date,
+) -> Iterator[Tuple[int, date, str]]:
+    """Yield daily attendance rows for active employees on working days only.
 
-            employees_batch.append(
-                (
-                    random_name(),
-                    dept_id,
-                    desig_id,
-                    float(base_salary),
-                    join_dt,
-                    exit_dt,
-                )
-            )
+    employees are (employee_id, join_date, exit_date) tuples.
+    status: 'P' (present), 'A' (absent), 'L' (leave). Weekends are skipped.
+    """
 
-        execute_batch(
-            cur,
-            """
-			INSERT INTO employee(
-				full_name, department_id, designation_id,
-				base_salary, join_date, exit_date
-			)
-			VALUES (%s, %s, %s, %s, %s, %s)
-			""",
-            employees_batch,
-            page_size=1000,
-        )
+    for day in daterange(start_date, end_date):
+        # Skip weekends
+        if day.weekday() >= 5:
+            continue
 
-    conn.commit()
+        for emp_id, join_dt, exit_dt in employees:
+            if day < join_dt or (exit_dt and day > exit_dt):
+                continue
+
+            r = random.random()
+            if r < 0.88:
+                status = "P"
+            elif r < 0.96:
+                status = "A"
+            else:
+                status = "L"
+
+            yield (emp_id, day, status)
 
 
 def generate_attendance(
@@ -278,75 +383,26 @@ def generate_attendance(
     start_date: date = date(2020, 1, 1),
     end_date: date = date(2024, 12, 31),
     batch_size: int = 5000,
+    extra_sinks: Sequence = (),
 ) -> None:
-    """Generate daily attendance for active employees on working days only.
+    """Stream attendance into the attendance table (plus extra_sinks).
 
-    status: 'P' (present), 'A' (absent), 'L' (leave).
-    Weekends are skipped.
+    Existing (employee_id, att_date) rows are skipped, as before.
     """
 
     with conn.cursor() as cur:
         cur.execute("SELECT employee_id, join_date, exit_date FROM employee")
         employees = cur.fetchall()
 
-    def is_active(emp_join: date, emp_exit: Optional[date], day: date) -> bool:
-        if day < emp_join:
-            return False
-        if emp_exit and day > emp_exit:
-            return False
-        return True
-
-    total_days = (end_date - start_date).days + 1
-
-    batch: List[Tuple[int, date, str]] = []
-    with conn.cursor() as cur:
-        for day in tqdm(
-            daterange(start_date, end_date),
-            total=total_days,
-            desc="Generating attendance (per day)",
-        ):
-            # Skip weekends
-            if day.weekday() >= 5:
-                continue
-
-            for emp_id, join_dt, exit_dt in employees:
-                if not is_active(join_dt, exit_dt, day):
-                    continue
-
-                r = random.random()
-                if r < 0.88:
-                    status = "P"
-                elif r < 0.96:
-                    status = "A"
-                else:
-                    status = "L"
-
-                batch.append((emp_id, day, status))
-
-                if len(batch) >= batch_size:
-                    execute_batch(
-                        cur,
-                        """
-						INSERT INTO attendance(employee_id, att_date, status)
-						VALUES (%s, %s, %s)
-						ON CONFLICT (employee_id, att_date) DO NOTHING
-						""",
-                        batch,
-                    )
-                    conn.commit()
-                    batch.clear()
-
-        if batch:
-            execute_batch(
-                cur,
-                """
-				INSERT INTO attendance(employee_id, att_date, status)
-				VALUES (%s, %s, %s)
-				ON CONFLICT (employee_id, att_date) DO NOTHING
-				""",
-                batch,
-            )
-            conn.commit()
+    with tqdm(desc="Generating attendance (rows)", unit="rows") as progress:
+        write_blocks(
+            blocks(attendance_rows(employees, start_date, end_date), batch_size),
+            PostgresCopySink(
+                conn, "attendance", ATTENDANCE_COLUMNS, on_conflict_do_nothing=True
+            ),
+            *extra_sinks,
+            progress=progress,
+        )
 
 
 def compute_deductions(gross: float) -> Tuple[float, float, float]:
@@ -370,18 +426,84 @@ def compute_deductions(gross: float) -> Tuple[float, float, float]:
     return pf, tax, prof_tax
 
 
+def month_start_end(y: int, m: int) -> Tuple[date, date]:
+    start = date(y, m, 1)
+    if m == 12:
+        end = date(y + 1, 1, 1) - timedelta(days=1)
+    else:
+        end = date(y, m + 1, 1) - timedelta(days=1)
+    return start, end
+
+
+def payroll_rows(
+    employees: List[Tuple],
+    struct_by_designation: Dict[int, Tuple[float, float, float]],
+    present_days_in: Callable[[date, date], Dict[int, int]],
+    months: List[Tuple[int, int]],
+) -> Iterator[Tuple]:
+    """Yield monthly payroll rows (PAYROLL_COLUMNS) for months with presence.
+
+    - Uses salary structure percentages tied to designation
+    - Considers only employees active in that month
+    - Yields a row only when the employee has at least 1 present day,
+      as reported by present_days_in(month_start, month_end)
+    """
+
+    for year, month in months:
+        m_start, m_end = month_start_end(year, month)
+        attendance_present = present_days_in(m_start, m_end)
+
+        for emp_id, desig_id, base_salary, join_dt, exit_dt in employees:
+            if desig_id not in struct_by_designation:
+                continue
+
+            # Active in month?
+            if m_end < join_dt:
+                continue
+            if exit_dt and m_start > exit_dt:
+                continue
+
+            present_days = attendance_present.get(emp_id, 0)
+            if present_days <= 0:
+                # No payroll if never present in the month
+                continue
+
+            hra_pct, da_pct, allow_pct = struct_by_designation[desig_id]
+
+            base = float(base_salary)
+            hra = round(base * hra_pct / 100.0, 2)
+            da = round(base * da_pct / 100.0, 2)
+            allow = round(base * allow_pct / 100.0, 2)
+            gross = round(base + hra + da + allow, 2)
+            pf, tax, prof_tax = compute_deductions(gross)
+            net = round(gross - (pf + tax + prof_tax), 2)
+
+            yield (
+                emp_id,
+                m_start,
+                base,
+                hra,
+                da,
+                allow,
+                gross,
+                pf,
+                tax,
+                prof_tax,
+                net,
+            )
+
+
 def generate_monthly_payroll(
     conn,
     start_year: int = 2020,
     end_year: int = 2024,
     batch_size: int = 2000,
+    extra_sinks: Sequence = (),
 ) -> None:
-    """Generate monthly payroll only for months with presence.
+    """Stream monthly payroll into payroll_monthly (plus extra_sinks).
 
-    - Uses salary structure percentages tied to designation
-    - Considers only employees active in that month
-    - Inserts payroll rows only when the employee has at least 1 present day
-    - Covers all months from start_year through end_year (inclusive)
+    Covers all months from start_year through end_year (inclusive); present
+    days are read per month from the attendance table.
     """
 
     with conn.cursor() as cur:
@@ -408,23 +530,8 @@ def generate_monthly_payroll(
         )
         employees = cur.fetchall()
 
-    def month_start_end(y: int, m: int) -> Tuple[date, date]:
-        start = date(y, m, 1)
-        if m == 12:
-            end = date(y + 1, 1, 1) - timedelta(days=1)
-        else:
-            end = date(y, m + 1, 1) - timedelta(days=1)
-        return start, end
-
-    # Precompute all (year, month) pairs so tqdm can track total progress
-    months = [(y, m) for y in range(start_year, end_year + 1) for m in range(1, 13)]
-
-    batch: List[Tuple] = []
-    with conn.cursor() as cur:
-        for year, month in tqdm(months, desc="Generating monthly payroll"):
-            m_start, m_end = month_start_end(year, month)
-
-            # Preload attendance counts for the month for efficiency
+    def present_days_in(m_start: date, m_end: date) -> Dict[int, int]:
+        with conn.cursor() as cur:
             cur.execute(
                 """
 				SELECT employee_id,
@@ -435,148 +542,97 @@ def generate_monthly_payroll(
 				""",
                 (m_start, m_end),
             )
-            attendance_present: Dict[int, int] = {
-                emp_id: int(present) for emp_id, present in cur.fetchall()
-            }
-
-            for emp_id, desig_id, base_salary, join_dt, exit_dt in employees:
-                if desig_id not in struct_by_designation:
-                    continue
-
-                # Active in month?
-                if m_end < join_dt:
-                    continue
-                if exit_dt and m_start > exit_dt:
-                    continue
-
-                present_days = attendance_present.get(emp_id, 0)
-                if present_days <= 0:
-                    # No payroll if never present in the month
-                    continue
-
-                hra_pct, da_pct, allow_pct = struct_by_designation[desig_id]
-
-                base = float(base_salary)
-                hra = round(base * hra_pct / 100.0, 2)
-                da = round(base * da_pct / 100.0, 2)
-                allow = round(base * allow_pct / 100.0, 2)
-                gross = round(base + hra + da + allow, 2)
-                pf, tax, prof_tax = compute_deductions(gross)
-                net = round(gross - (pf + tax + prof_tax), 2)
-
-                ym_date = date(year, month, 1)
-                batch.append(
-                    (
-                        emp_id,
-                        ym_date,
-                        base,
-                        hra,
-                        da,
-                        allow,
-                        gross,
-                        pf,
-                        tax,
-                        prof_tax,
-                        net,
-                    )
-                )
+            return {emp_id: int(present) for emp_id, present in cur.fetchall()}
 
-                if len(batch) >= batch_size:
-                    execute_batch(
-                        cur,
-                        """
-						INSERT INTO payroll_monthly(
-							employee_id, year_month,
-							base_salary, hra_amount, da_amount, allowance_amt,
-							gross_salary, pf_deduction, tax_deduction,
-							prof_tax, net_salary
-						)
-						VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-						ON CONFLICT (employee_id, year_month) DO NOTHING
-						""",
-                        batch,
-                    )
-                    conn.commit()
-                    batch.clear()
-
-        if batch:
-            execute_batch(
-                cur,
-                """
-				INSERT INTO payroll_monthly(
-					employee_id, year_month,
-					base_salary, hra_amount, da_amount, allowance_amt,
-					gross_salary, pf_deduction, tax_deduction,
-					prof_tax, net_salary
-				)
-				VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-				ON CONFLICT (employee_id, year_month) DO NOTHING
-				""",
-                batch,
-            )
-            conn.commit()
+    months = [(y, m) for y in range(start_year, end_year + 1) for m in range(1, 13)]
+    rows = payroll_rows(employees, struct_by_designation, present_days_in, months)
+
+    with tqdm(desc="Generating monthly payroll (rows)", unit="rows") as progress:
+        write_blocks(
+            blocks(rows, batch_size),
+            PostgresCopySink(
+                conn, "payroll_monthly", PAYROLL_COLUMNS, on_conflict_do_nothing=True
+            ),
+            *extra_sinks,
+            progress=progress,
+        )
 
 
 def validate_data(conn) -> None:
-    """Basic validation checks:
+    """Run the declarative rule set from validation.py and print the report.
 
-    - salary breakup sums (base + components == gross)
-    - employee-month consistency (only for active employees)
-    - FK-like integrity via join counts
+    Covers salary breakup sums, employee-month consistency, FK integrity,
+    duplicates, and attendance on weekends or outside the employee's active
+    range, with one scan per source table.
     """
 
-    with conn.cursor() as cur:
-        # 1) salary breakup check
-        cur.execute(
-            """
-			SELECT COUNT(*)
-			FROM payroll_monthly
-			WHERE ROUND(base_salary + hra_amount + da_amount + allowance_amt, 2)
-				  != ROUND(gross_salary, 2)
-			"""
-        )
-        mismatches = cur.fetchone()[0]
+    print_report(run_validation(conn))
 
-        # 2) employee-month: payroll only for employees existing at that month
-        cur.execute(
-            """
-			SELECT COUNT(*)
-			FROM payroll_monthly p
-			JOIN employee e ON p.employee_id = e.employee_id
-			WHERE (p.year_month < e.join_date)
-			   OR (e.exit_date IS NOT NULL AND p.year_month > e.exit_date)
-			"""
-        )
-        invalid_emp_month = cur.fetchone()[0]
 
-        # 3) FK-like integrity: any payroll rows with missing employee?
-        cur.execute(
-            """
-			SELECT COUNT(*)
-			FROM payroll_monthly p
-			LEFT JOIN employee e ON p.employee_id = e.employee_id
-			WHERE e.employee_id IS NULL
-			"""
-        )
-        orphan_payroll = cur.fetchone()[0]
+def output_sinks(
+    table: str,
+    column_types: Dict[str, str],
+    csv_dir: Optional[str] = None,
+    parquet_dir: Optional[str] = None,
+    duckdb_conn=None,
+) -> List:
+    """Extra sinks for one table, one per requested output."""
 
-    print("Validation Report:")
-    print(f"  Payroll rows with inconsistent gross totals: {mismatches}")
-    print(f"  Payroll rows with invalid employee-month: {invalid_emp_month}")
-    print(f"  Payroll rows with missing employee FK: {orphan_payroll}")
+    sinks = []
+    if csv_dir:
+        sinks.append(CsvSink(os.path.join(csv_dir, f"{table}.csv"), column_types))
+    if parquet_dir:
+        sinks.append(
+            ParquetSink(os.path.join(parquet_dir, f"{table}.parquet"), column_types)
+        )
+    if duckdb_conn is not None:
+        sinks.append(DuckDBSink(duckdb_conn, table, column_types))
+    return sinks
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv-dir", help="also write this run's rows as CSV here")
+    parser.add_argument(
+        "--parquet-dir", help="also write this run's rows as Parquet here"
+    )
+    parser.add_argument(
+        "--duckdb-path", help="also insert this run's rows into this DuckDB file"
+    )
+    args = parser.parse_args()
+
+    for directory in (args.csv_dir, args.parquet_dir):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    duckdb_conn = None
+    if args.duckdb_path:
+        import duckdb
+
+        duckdb_conn = duckdb.connect(args.duckdb_path)
+
+    def sinks_for(table: str, column_types: Dict[str, str]) -> List:
+        return output_sinks(
+            table, column_types, args.csv_dir, args.parquet_dir, duckdb_conn
+        )
+
     conn = get_connection()
     try:
         create_schema(conn)
         seed_master_data(conn)
-        generate_employees(conn)
-        generate_attendance(conn)
-        generate_monthly_payroll(conn)
+        generate_employees(
+            conn, extra_sinks=sinks_for("employee", EMPLOYEE_COLUMN_TYPES)
+        )
+        generate_attendance(
+            conn, extra_sinks=sinks_for("attendance", ATTENDANCE_COLUMN_TYPES)
+        )
+        generate_monthly_payroll(
+            conn, extra_sinks=sinks_for("payroll_monthly", PAYROLL_COLUMN_TYPES)
+        )
         validate_data(conn)
     finally:
         conn.close()
+        if duckdb_conn is not None:
+            duckdb_conn.close()
 
 
 if __name__ == "__main__":
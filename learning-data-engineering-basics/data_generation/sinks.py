@@ -0,0 +1,213 @@
+"""Row-block sinks for the streaming data generators.
+
+Generators in data_generation.py yield lists of row tuples ("blocks"); a sink
+writes one block at a time. `write_blocks()` pulls the next block only after
+every sink has finished the current one, so at most one block per pipeline
+is held in memory however many rows are generated.
+"""
+
+import csv
+import io
+from datetime import date
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Row = Tuple
+Block = List[Row]
+
+
+def blocks(rows: Iterable[Row], block_size: int) -> Iterator[Block]:
+    """Group a row iterator into lists of at most block_size rows."""
+
+    rows = iter(rows)
+    while True:
+        block = list(islice(rows, block_size))
+        if not block:
+            return
+        yield block
+
+
+def _copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+class PostgresCopySink:
+    """COPY FROM STDIN each block into a table, committing per block.
+
+    With on_conflict_do_nothing, blocks are COPYed into a temp staging table
+    and moved with INSERT ... ON CONFLICT DO NOTHING, so reruns skip rows
+    that already exist instead of failing the whole COPY.
+    """
+
+    def __init__(
+        self,
+        conn,
+        table: str,
+        columns: Sequence[str],
+        on_conflict_do_nothing: bool = False,
+    ) -> None:
+        self.conn = conn
+        self.table = table
+        self.columns = ", ".join(columns)
+        self.on_conflict_do_nothing = on_conflict_do_nothing
+        self.staging = f"staging_{table}"
+        if on_conflict_do_nothing:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {self.staging} "
+                    f"AS SELECT {self.columns} FROM {table} WITH NO DATA"
+                )
+            conn.commit()
+
+    def write(self, block: Block) -> None:
+        buffer = io.StringIO()
+        for row in block:
+            buffer.write("\t".join(_copy_value(value) for value in row) + "\n")
+        buffer.seek(0)
+
+        with self.conn.cursor() as cur:
+            if not self.on_conflict_do_nothing:
+                cur.copy_expert(
+                    f"COPY {self.table} ({self.columns}) FROM STDIN", buffer
+                )
+            else:
+                cur.execute(f"TRUNCATE {self.staging}")
+                cur.copy_expert(
+                    f"COPY {self.staging} ({self.columns}) FROM STDIN", buffer
+                )
+                cur.execute(
+                    f"INSERT INTO {self.table} ({self.columns}) "
+                    f"SELECT {self.columns} FROM {self.staging} "
+                    "ON CONFLICT DO NOTHING"
+                )
+        self.conn.commit()
+
+    def close(self) -> None:
+        if self.on_conflict_do_nothing:
+            with self.conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {self.staging}")
+            self.conn.commit()
+
+
+class CsvSink:
+    """Append blocks to a CSV file (header written on open)."""
+
+    def __init__(self, path: str, columns: Iterable[str]) -> None:
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, block: Block) -> None:
+        self.writer.writerows(block)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def arrow_schema(column_types: Dict[str, str]):
+    """pyarrow schema for {column: SQL type}, e.g. PAYROLL_COLUMN_TYPES."""
+
+    import pyarrow as pa
+
+    arrow_types = {
+        "TEXT": pa.string(),
+        "INT": pa.int32(),
+        "DATE": pa.date32(),
+        # the generators compute money as floats rounded to cents
+        "NUMERIC": pa.float64(),
+    }
+    return pa.schema(
+        [(column, arrow_types[sql_type]) for column, sql_type in column_types.items()]
+    )
+
+
+def arrow_table(block: Block, schema):
+    """A block as a pyarrow table of the given schema."""
+
+    import pyarrow as pa
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(column, type=field.type)
+            for column, field in zip(zip(*block), schema)
+        ],
+        schema=schema,
+    )
+
+
+class ParquetSink:
+    """Write each block as a row group of a single Parquet file.
+
+    The schema comes from the declared column types, not from the data, so a
+    first block whose exit_date is all NULL cannot pin that column to null.
+    """
+
+    def __init__(self, path: str, column_types: Dict[str, str]) -> None:
+        import pyarrow.parquet as pq
+
+        self.schema = arrow_schema(column_types)
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, block: Block) -> None:
+        self.writer.write_table(arrow_table(block, self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class DuckDBSink:
+    """Insert blocks into a DuckDB table via a registered Arrow table.
+
+    The table is created from the column types if it does not exist.
+    """
+
+    def __init__(self, conn, table: str, column_types: Dict[str, str]) -> None:
+        self.conn = conn
+        self.table = table
+        self.columns = list(column_types)
+        self.schema = arrow_schema(column_types)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            + ", ".join(f"{c} {sql_type}" for c, sql_type in column_types.items())
+            + ")"
+        )
+
+    def write(self, block: Block) -> None:
+        arrow_block = arrow_table(block, self.schema)
+        self.conn.register("sink_block", arrow_block)
+        try:
+            self.conn.execute(
+                f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+                f"SELECT {', '.join(self.columns)} FROM sink_block"
+            )
+        finally:
+            self.conn.unregister("sink_block")
+
+    def close(self) -> None:
+        pass
+
+
+def write_blocks(
+    row_blocks: Iterable[Block], *sinks, progress: Optional[object] = None
+) -> int:
+    """Drain row_blocks into every sink; returns the number of rows written.
+
+    Sinks are closed even if generation or a write fails.
+    """
+
+    written = 0
+    try:
+        for block in row_blocks:
+            for sink in sinks:
+                sink.write(block)
+            written += len(block)
+            if progress is not None:
+                progress.update(len(block))
+    finally:
+        for sink in sinks:
+            sink.close()
+    return written
@@ -0,0 +1,149 @@
+from datetime import date
+
+import pytest
+
+from sinks import CsvSink, DuckDBSink, ParquetSink, blocks, write_blocks
+
+EMPLOYEE_TYPES = {
+    "employee_id": "INT",
+    "full_name": "TEXT",
+    "base_salary": "NUMERIC",
+    "join_date": "DATE",
+    "exit_date": "DATE",
+}
+# the first block has no exit dates at all
+EMPLOYEE_BLOCKS = [
+    [
+        (1, "Asha", 30000.0, date(2020, 1, 6), None),
+        (2, "Ravi", 45000.5, date(2021, 3, 1), None),
+    ],
+    [(3, "Meera", 52000.0, date(2019, 7, 15), date(2022, 7, 14))],
+]
+
+
+class RecordingSink:
+    def __init__(self, fail_on_block: int = -1) -> None:
+        self.blocks = []
+        self.closed = False
+        self.fail_on_block = fail_on_block
+
+    def write(self, block) -> None:
+        if len(self.blocks) == self.fail_on_block:
+            raise RuntimeError("disk full")
+        self.blocks.append(block)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestBlocks:
+    def test_groups_rows_with_a_short_last_block(self) -> None:
+        assert list(blocks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_empty_input_yields_nothing(self) -> None:
+        assert list(blocks([], 3)) == []
+
+    def test_pulls_rows_lazily(self) -> None:
+        """Only one block is drawn from the generator at a time."""
+
+        pulled = []
+
+        def rows():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        first = next(blocks(rows(), 4))
+
+        assert first == [0, 1, 2, 3]
+        assert pulled == [0, 1, 2, 3]
+
+
+class TestWriteBlocks:
+    def test_every_sink_sees_every_block(self) -> None:
+        first, second = RecordingSink(), RecordingSink()
+
+        written = write_blocks(blocks(range(5), 2), first, second)
+
+        assert written == 5
+        assert first.blocks == second.blocks == [[0, 1], [2, 3], [4]]
+        assert first.closed and second.closed
+
+    def test_sinks_are_closed_when_a_write_fails(self) -> None:
+        healthy, failing = RecordingSink(), RecordingSink(fail_on_block=1)
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            write_blocks(blocks(range(5), 2), healthy, failing)
+
+        assert healthy.closed and failing.closed
+
+    def test_sinks_are_closed_when_generation_fails(self) -> None:
+        def rows():
+            yield 1
+            raise ValueError("bad row")
+
+        sink = RecordingSink()
+
+        with pytest.raises(ValueError):
+            write_blocks(blocks(rows(), 1), sink)
+
+        assert sink.closed
+
+    def test_csv_sink_writes_header_and_rows(self, tmp_path) -> None:
+        path = tmp_path / "employee.csv"
+
+        write_blocks(EMPLOYEE_BLOCKS, CsvSink(str(path), EMPLOYEE_TYPES))
+
+        lines = path.read_text().splitlines()
+        assert lines[0] == "employee_id,full_name,base_salary,join_date,exit_date"
+        assert lines[1:] == [
+            "1,Asha,30000.0,2020-01-06,",
+            "2,Ravi,45000.5,2021-03-01,",
+            "3,Meera,52000.0,2019-07-15,2022-07-14",
+        ]
+
+
+class TestParquetSink:
+    def test_schema_comes_from_the_column_types(self, tmp_path) -> None:
+        """An all-NULL exit_date in the first block still types the column."""
+
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = tmp_path / "employee.parquet"
+        write_blocks(EMPLOYEE_BLOCKS, ParquetSink(str(path), EMPLOYEE_TYPES))
+
+        table = pq.read_table(path)
+        assert table.schema.field("exit_date").type == pa.date32()
+        assert table.schema.field("employee_id").type == pa.int32()
+        assert table.schema.field("base_salary").type == pa.float64()
+        assert table.column("exit_date").to_pylist() == [
+            None,
+            None,
+            date(2022, 7, 14),
+        ]
+        assert pq.ParquetFile(path).num_row_groups == 2
+
+    def test_no_blocks_still_writes_an_empty_typed_file(self, tmp_path) -> None:
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        path = tmp_path / "employee.parquet"
+        write_blocks([], ParquetSink(str(path), EMPLOYEE_TYPES))
+
+        table = pq.read_table(path)
+        assert table.num_rows == 0
+        assert table.column_names == list(EMPLOYEE_TYPES)
+
+
+class TestDuckDBSink:
+    def test_creates_the_table_and_keeps_employee_ids(self) -> None:
+        duckdb = pytest.importorskip("duckdb")
+        pytest.importorskip("pyarrow")
+
+        conn = duckdb.connect()
+        write_blocks(EMPLOYEE_BLOCKS, DuckDBSink(conn, "employee", EMPLOYEE_TYPES))
+
+        assert conn.execute(
+            "SELECT COUNT(employee_id), COUNT(exit_date), SUM(base_salary) "
+            "FROM employee"
+        ).fetchone() == (3, 1, 127000.5)
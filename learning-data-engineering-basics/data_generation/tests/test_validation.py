@@ -0,0 +1,137 @@
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from validation import RULES, compile_rules, run_validation  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE employee (employee_id INT, join_date DATE, exit_date DATE);
+CREATE TABLE payroll_monthly (
+    payroll_id INT, employee_id INT, year_month DATE,
+    base_salary DECIMAL(12,2), hra_amount DECIMAL(12,2), da_amount DECIMAL(12,2),
+    allowance_amt DECIMAL(12,2), gross_salary DECIMAL(12,2),
+    pf_deduction DECIMAL(12,2), tax_deduction DECIMAL(12,2),
+    prof_tax DECIMAL(12,2), net_salary DECIMAL(12,2)
+);
+CREATE TABLE attendance (
+    attendance_id INT, employee_id INT, att_date DATE, status TEXT
+);
+INSERT INTO employee VALUES
+    (1, '2023-01-01', NULL),
+    (2, '2023-01-01', '2023-03-31');
+"""
+
+# one clean row per table
+CLEAN_PAYROLL = "(1, 1, '2023-01-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)"
+CLEAN_ATTENDANCE = "(1, 1, '2023-01-02', 'P')"
+
+# exactly one violation of every rule, each with a known sample key
+SEEDED_PAYROLL = [
+    CLEAN_PAYROLL,
+    # gross != base + hra + da + allowance (net is consistent with gross)
+    "(2, 1, '2023-02-01', 10, 1, 1, 1, 14, 1, 1, 1, 11)",
+    # net != gross - deductions
+    "(3, 1, '2023-03-01', 10, 1, 1, 1, 13, 1, 1, 1, 9)",
+    # employee 2 left in March
+    "(4, 2, '2023-05-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)",
+    # no such employee
+    "(5, 99, '2023-01-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)",
+    # three rows for one employee-month are one duplicate group
+    "(6, 1, '2023-04-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)",
+    "(7, 1, '2023-04-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)",
+    "(8, 1, '2023-04-01', 10, 1, 1, 1, 13, 1, 1, 1, 10)",
+]
+SEEDED_ATTENDANCE = [
+    CLEAN_ATTENDANCE,
+    # a Saturday
+    "(2, 1, '2023-01-07', 'P')",
+    # after employee 2's exit
+    "(3, 2, '2023-04-03', 'P')",
+    "(4, 1, '2023-01-03', 'X')",
+    "(5, 99, '2023-01-04', 'P')",
+    "(6, 1, '2023-01-05', 'P')",
+    "(7, 1, '2023-01-05', 'A')",
+]
+EXPECTED_SAMPLES = {
+    "payroll_gross_breakup": ["2"],
+    "payroll_net_breakup": ["3"],
+    "payroll_outside_employment": ["4"],
+    "payroll_missing_employee": ["5"],
+    "payroll_duplicate_month": ["1:2023-04-01"],
+    "attendance_weekend": ["2"],
+    "attendance_outside_employment": ["3"],
+    "attendance_invalid_status": ["4"],
+    "attendance_missing_employee": ["5"],
+    "attendance_duplicate_day": ["1:2023-01-05"],
+}
+
+
+def open_warehouse(payroll, attendance):
+    conn = duckdb.connect()
+    conn.execute(SCHEMA)
+    conn.execute(f"INSERT INTO payroll_monthly VALUES {', '.join(payroll)}")
+    conn.execute(f"INSERT INTO attendance VALUES {', '.join(attendance)}")
+    return conn
+
+
+@pytest.fixture
+def seeded():
+    conn = open_warehouse(SEEDED_PAYROLL, SEEDED_ATTENDANCE)
+    yield conn
+    conn.close()
+
+
+class TestRules:
+    def test_every_rule_is_covered(self) -> None:
+        assert sorted(EXPECTED_SAMPLES) == sorted(rule.name for rule in RULES)
+
+    def test_each_seeded_violation_is_caught_once(self, seeded) -> None:
+        results = run_validation(seeded)
+
+        assert {r.name: r.violations for r in results} == {
+            name: 1 for name in EXPECTED_SAMPLES
+        }
+        assert {r.name: r.samples for r in results} == EXPECTED_SAMPLES
+
+    def test_clean_data_has_no_violations(self) -> None:
+        conn = open_warehouse([CLEAN_PAYROLL], [CLEAN_ATTENDANCE])
+
+        results = run_validation(conn)
+
+        assert [r.violations for r in results] == [0] * len(RULES)
+        assert all(r.samples == [] for r in results)
+
+    def test_samples_are_capped(self) -> None:
+        conn = open_warehouse(
+            [CLEAN_PAYROLL],
+            [CLEAN_ATTENDANCE]
+            + [f"({i}, 1, DATE '2023-01-07' + {7 * i}, 'P')" for i in range(2, 12)],
+        )
+
+        (weekend,) = [
+            r
+            for r in run_validation(conn, sample_size=3)
+            if r.name == "attendance_weekend"
+        ]
+
+        assert weekend.violations == 10
+        assert len(weekend.samples) == 3
+
+
+class TestScans:
+    def test_one_query_per_table(self) -> None:
+        assert sorted(compile_rules(RULES)) == ["attendance", "payroll"]
+
+    def test_rules_on_a_table_share_its_scan_time(self, seeded) -> None:
+        results = run_validation(seeded)
+
+        for source in ("payroll", "attendance"):
+            assert len({r.scan_ms for r in results if r.source == source}) == 1
+        assert all(r.rule_ms is None for r in results)
+
+    def test_time_rules_times_each_rule_alone(self, seeded) -> None:
+        results = run_validation(seeded, time_rules=True)
+
+        assert all(r.rule_ms is not None and r.rule_ms >= 0 for r in results)
+        # the extra scans do not change what is reported
+        assert {r.name: r.samples for r in results} == EXPECTED_SAMPLES
@@ -0,0 +1,297 @@
+"""Set-based validation of the generated payroll dataset.
+
+Rules are declared as (source, violation predicate, row key). Rules that read
+the same source are compiled into a single aggregate query, so each table is
+scanned once no matter how many rules it carries:
+
+    SELECT COUNT(*) FILTER (WHERE <rule 1>), (ARRAY_AGG(<key>) FILTER (WHERE <rule 1>))[1:5],
+           COUNT(*) FILTER (WHERE <rule 2>), ...
+    FROM <source>
+
+Duplicate checks ride along in the same scan: each source row carries a window
+count of the rows sharing its employee-month (or employee-day), and the rule
+counts the first row of every group with more than one.
+
+The SQL sticks to what PostgreSQL and DuckDB both accept, so the same rules run
+against the OLTP database and the DuckDB warehouse.
+
+Each rule reports the time of the shared scan it ran in. The scan cannot be
+split by rule, so --time-rules additionally runs every rule on its own and
+reports that as the rule's time (one extra scan per rule).
+
+Usage:
+    python validation.py --engine postgres
+    python validation.py --engine postgres --time-rules
+    python validation.py --engine duckdb --duckdb-path ../learning_etl/warehouse.test_db
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+SAMPLE_SIZE = 5
+
+# FROM clauses the rules can be evaluated over; group_rows and group_rank
+# number each row within its employee-month / employee-day
+SOURCES: Dict[str, str] = {
+    "payroll": """
+        (
+            SELECT
+                payroll_monthly.*,
+                COUNT(*) OVER (PARTITION BY employee_id, year_month) AS group_rows,
+                ROW_NUMBER() OVER (
+                    PARTITION BY employee_id, year_month ORDER BY payroll_id
+                ) AS group_rank
+            FROM payroll_monthly
+        ) p
+        LEFT JOIN employee e ON p.employee_id = e.employee_id
+    """,
+    "attendance": """
+        (
+            SELECT
+                attendance.*,
+                COUNT(*) OVER (PARTITION BY employee_id, att_date) AS group_rows,
+                ROW_NUMBER() OVER (
+                    PARTITION BY employee_id, att_date ORDER BY attendance_id
+                ) AS group_rank
+            FROM attendance
+        ) a
+        LEFT JOIN employee e ON a.employee_id = e.employee_id
+    """,
+}
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    source: str
+    # predicate that is TRUE for a violating row
+    condition: str
+    # expression identifying the offending row in samples
+    key: str
+    description: str
+
+
+@dataclass
+class RuleResult:
+    name: str
+    description: str
+    violations: int
+    samples: List[str] = field(default_factory=list)
+    source: str = ""
+    # time of the shared scan the rule was evaluated in
+    scan_ms: float = 0.0
+    # time of a scan evaluating only this rule, when asked for
+    rule_ms: Optional[float] = None
+
+
+PAYROLL_KEY = "CAST(p.payroll_id AS TEXT)"
+ATTENDANCE_KEY = "CAST(a.attendance_id AS TEXT)"
+
+RULES: List[Rule] = [
+    Rule(
+        "payroll_gross_breakup",
+        "payroll",
+        "ROUND(p.base_salary + p.hra_amount + p.da_amount + p.allowance_amt, 2)"
+        " != ROUND(p.gross_salary, 2)",
+        PAYROLL_KEY,
+        "Payroll rows with inconsistent gross totals",
+    ),
+    Rule(
+        "payroll_net_breakup",
+        "payroll",
+        "ROUND(p.gross_salary - p.pf_deduction - p.tax_deduction - p.prof_tax, 2)"
+        " != ROUND(p.net_salary, 2)",
+        PAYROLL_KEY,
+        "Payroll rows with inconsistent net totals",
+    ),
+    Rule(
+        "payroll_outside_employment",
+        "payroll",
+        "e.employee_id IS NOT NULL AND ("
+        "p.year_month < date_trunc('month', e.join_date)"
+        " OR (e.exit_date IS NOT NULL AND p.year_month > e.exit_date))",
+        PAYROLL_KEY,
+        "Payroll rows with invalid employee-month",
+    ),
+    Rule(
+        "payroll_missing_employee",
+        "payroll",
+        "e.employee_id IS NULL",
+        PAYROLL_KEY,
+        "Payroll rows with missing employee FK",
+    ),
+    Rule(
+        "payroll_duplicate_month",
+        "payroll",
+        "p.group_rows > 1 AND p.group_rank = 1",
+        "CAST(p.employee_id AS TEXT) || ':' || CAST(p.year_month AS TEXT)",
+        "Employee-months with more than one payroll row",
+    ),
+    Rule(
+        "attendance_weekend",
+        "attendance",
+        "EXTRACT(ISODOW FROM a.att_date) >= 6",
+        ATTENDANCE_KEY,
+        "Attendance rows on weekends",
+    ),
+    Rule(
+        "attendance_outside_employment",
+        "attendance",
+        "e.employee_id IS NOT NULL AND ("
+        "a.att_date < e.join_date"
+        " OR (e.exit_date IS NOT NULL AND a.att_date > e.exit_date))",
+        ATTENDANCE_KEY,
+        "Attendance rows outside the employee's active range",
+    ),
+    Rule(
+        "attendance_invalid_status",
+        "attendance",
+        "a.status NOT IN ('P', 'A', 'L')",
+        ATTENDANCE_KEY,
+        "Attendance rows with unknown status",
+    ),
+    Rule(
+        "attendance_missing_employee",
+        "attendance",
+        "e.employee_id IS NULL",
+        ATTENDANCE_KEY,
+        "Attendance rows with missing employee FK",
+    ),
+    Rule(
+        "attendance_duplicate_day",
+        "attendance",
+        "a.group_rows > 1 AND a.group_rank = 1",
+        "CAST(a.employee_id AS TEXT) || ':' || CAST(a.att_date AS TEXT)",
+        "Employee-days with more than one attendance row",
+    ),
+]
+
+
+def compile_rules(rules: List[Rule], sample_size: int = SAMPLE_SIZE) -> Dict[str, str]:
+    """One aggregate query per source, covering every rule on that source.
+
+    Column 2i is rule i's violation count, column 2i + 1 its sample keys.
+    """
+
+    by_source: Dict[str, List[Rule]] = {}
+    for rule in rules:
+        by_source.setdefault(rule.source, []).append(rule)
+
+    queries = {}
+    for source, source_rules in by_source.items():
+        columns = []
+        for rule in source_rules:
+            columns.append(f"COUNT(*) FILTER (WHERE {rule.condition})")
+            columns.append(
+                f"(ARRAY_AGG({rule.key}) FILTER (WHERE {rule.condition}))"
+                f"[1:{sample_size}]"
+            )
+        queries[source] = (
+            "SELECT\n    " + ",\n    ".join(columns) + f"\nFROM {SOURCES[source]}"
+        )
+    return queries
+
+
+def run_validation(
+    conn,
+    rules: List[Rule] = RULES,
+    sample_size: int = SAMPLE_SIZE,
+    time_rules: bool = False,
+) -> List[RuleResult]:
+    """Run the rules against a psycopg2 or DuckDB connection.
+
+    Both expose cursor().execute()/fetchone(), which is all this needs.
+    With time_rules, each rule is also run alone to fill in rule_ms.
+    """
+
+    queries = compile_rules(rules, sample_size)
+    results: Dict[str, RuleResult] = {}
+
+    cur = conn.cursor()
+    try:
+        for source, query in queries.items():
+            start = time.perf_counter()
+            cur.execute(query)
+            row = cur.fetchone()
+            scan_ms = (time.perf_counter() - start) * 1000
+
+            source_rules = [rule for rule in rules if rule.source == source]
+            for i, rule in enumerate(source_rules):
+                results[rule.name] = RuleResult(
+                    name=rule.name,
+                    description=rule.description,
+                    violations=int(row[2 * i] or 0),
+                    samples=list(row[2 * i + 1] or []),
+                    source=source,
+                    scan_ms=round(scan_ms, 2),
+                )
+
+        if time_rules:
+            for rule in rules:
+                (query,) = compile_rules([rule], sample_size).values()
+                start = time.perf_counter()
+                cur.execute(query)
+                cur.fetchone()
+                results[rule.name].rule_ms = round(
+                    (time.perf_counter() - start) * 1000, 2
+                )
+    finally:
+        cur.close()
+
+    return [results[rule.name] for rule in rules]
+
+
+def print_report(results: List[RuleResult]) -> None:
+    print("Validation Report:")
+    for result in results:
+        line = f"  {result.description}: {result.violations}"
+        if result.samples:
+            line += f" (e.g. {', '.join(map(str, result.samples))})"
+        print(line)
+
+    print("Scan timings:")
+    timings = {result.source: result.scan_ms for result in results}
+    for source, scan_ms in timings.items():
+        names = [r.name for r in results if r.source == source]
+        print(f"  {source:<16} {scan_ms:>10.2f} ms  ({', '.join(names)})")
+
+    timed = [result for result in results if result.rule_ms is not None]
+    if timed:
+        print("Rule timings (each rule scanned alone):")
+        for result in timed:
+            print(f"  {result.name:<32} {result.rule_ms:>10.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=["postgres", "duckdb"], default="postgres")
+    parser.add_argument("--duckdb-path", default="../learning_etl/warehouse.test_db")
+    parser.add_argument("--samples", type=int, default=SAMPLE_SIZE)
+    parser.add_argument(
+        "--time-rules",
+        action="store_true",
+        help="also time each rule in a scan of its own",
+    )
+    args = parser.parse_args()
+
+    if args.engine == "postgres":
+        from data_generation import get_connection
+
+        conn = get_connection()
+    else:
+        import duckdb
+
+        conn = duckdb.connect(database=args.duckdb_path, read_only=True)
+
+    try:
+        print_report(
+            run_validation(conn, sample_size=args.samples, time_rules=args.time_rules)
+        )
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
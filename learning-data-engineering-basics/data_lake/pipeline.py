@@ -0,0 +1,250 @@
+"""Data-lake ingestion: local CSVs -> raw-data -> partitioned Parquet in processed-data.
+
+Works against the MinIO from docker-compose.yaml (or any S3 API):
+- uploads every CSV under a source directory to `raw-data/<table>/<file>`,
+  in parallel and with multipart uploads for large files
+- streams each table's raw CSVs into zstd-compressed Parquet, hive partitioned
+  by year/month for the date-keyed tables, under `processed-data/<table>/`
+
+The DuckDB ETL (`learning_etl/main.py lake`) reads the processed objects.
+
+Usage:
+    python pipeline.py --source ../learning_etl/raw_data
+"""
+
+import argparse
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+
+S3_CONFIG = {
+    "endpoint_url": os.getenv("S3_ENDPOINT_URL", "http://localhost:9000"),
+    "aws_access_key_id": os.getenv("S3_ACCESS_KEY_ID", "minioadmin"),
+    "aws_secret_access_key": os.getenv("S3_SECRET_ACCESS_KEY", "minioadmin"),
+    "region_name": os.getenv("S3_REGION", "us-east-1"),
+}
+RAW_BUCKET = "raw-data"
+PROCESSED_BUCKET = "processed-data"
+
+# date column each table is partitioned on; tables not listed stay unpartitioned
+PARTITION_DATE_COLUMNS: Dict[str, str] = {
+    "attendance": "att_date",
+    "payroll_monthly": "year_month",
+}
+
+# CSV column types (pyarrow aliases), matching learning_etl's create_tables();
+# declared so a block of empty values cannot be inferred as the null type
+COLUMN_TYPES: Dict[str, Dict[str, str]] = {
+    "department": {"department_id": "int32", "name": "string"},
+    "salary_structure": {
+        "structure_id": "int32",
+        "code": "string",
+        "hra_pct": "double",
+        "da_pct": "double",
+        "allowance_pct": "double",
+    },
+    "designation": {
+        "designation_id": "int32",
+        "title": "string",
+        "structure_id": "int32",
+    },
+    "employee": {
+        "employee_id": "int32",
+        "full_name": "string",
+        "department_id": "int32",
+        "designation_id": "int32",
+        "base_salary": "double",
+        "join_date": "date32",
+        "exit_date": "date32",
+    },
+    "payroll_monthly": {
+        "payroll_id": "int32",
+        "employee_id": "int32",
+        "year_month": "date32",
+        "base_salary": "double",
+        "hra_amount": "double",
+        "da_amount": "double",
+        "allowance_amt": "double",
+        "gross_salary": "double",
+        "pf_deduction": "double",
+        "tax_deduction": "double",
+        "prof_tax": "double",
+        "net_salary": "double",
+    },
+    "attendance": {
+        "attendance_id": "int32",
+        "employee_id": "int32",
+        "att_date": "date32",
+        "status": "string",
+    },
+}
+
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=4,
+)
+DEFAULT_UPLOAD_WORKERS = 8
+
+
+def get_s3_client():
+    return boto3.client("s3", **S3_CONFIG)
+
+
+def ensure_buckets(client, buckets=(RAW_BUCKET, PROCESSED_BUCKET)) -> None:
+    """Create the buckets if the `mc` init container has not already."""
+
+    existing = {b["Name"] for b in client.list_buckets().get("Buckets", [])}
+    for bucket in buckets:
+        if bucket not in existing:
+            client.create_bucket(Bucket=bucket)
+
+
+def table_name(file_name: str) -> str:
+    """attendance_part2.csv -> attendance"""
+
+    return re.sub(r"_part\d+$", "", Path(file_name).stem)
+
+
+def list_keys(client, bucket: str, prefix: str) -> List[str]:
+    keys = []
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys.extend(obj["Key"] for obj in page.get("Contents", []))
+    return keys
+
+
+def upload_raw_files(
+    client,
+    source_dir: str,
+    bucket: str = RAW_BUCKET,
+    max_workers: int = DEFAULT_UPLOAD_WORKERS,
+) -> List[str]:
+    """Upload every CSV in source_dir to `<bucket>/<table>/<file>`.
+
+    Files upload in parallel; each large file is itself split into parallel
+    multipart chunks by TRANSFER_CONFIG.
+    """
+
+    files = sorted(Path(source_dir).glob("*.csv"))
+
+    def upload(path: Path) -> str:
+        key = f"{table_name(path.name)}/{path.name}"
+        client.upload_file(str(path), bucket, key, Config=TRANSFER_CONFIG)
+        return key
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        keys = list(executor.map(upload, files))
+
+    print(f"Uploaded {len(keys)} files to s3://{bucket}")
+    return keys
+
+
+def _with_partition_columns(batches, date_column: str):
+    """Append year/month columns derived from date_column to each batch."""
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for batch in batches:
+        dates = batch.column(date_column)
+        yield pa.RecordBatch.from_arrays(
+            batch.columns + [pc.year(dates), pc.month(dates)],
+            names=batch.schema.names + ["year", "month"],
+        )
+
+
+def convert_table(
+    client,
+    table: str,
+    raw_bucket: str = RAW_BUCKET,
+    processed_bucket: str = PROCESSED_BUCKET,
+) -> int:
+    """Convert one table's raw CSV objects to Parquet in processed_bucket.
+
+    CSVs are streamed batch by batch, so a file never has to fit in memory.
+    Columns are read with the table's COLUMN_TYPES; only tables not listed
+    there fall back to type inference.
+    Returns the number of Parquet objects written.
+    """
+
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.dataset as ds
+
+    date_column: Optional[str] = PARTITION_DATE_COLUMNS.get(table)
+    convert_options = pacsv.ConvertOptions(
+        column_types={
+            column: pa.type_for_alias(alias)
+            for column, alias in COLUMN_TYPES.get(table, {}).items()
+        }
+    )
+    file_options = ds.ParquetFileFormat().make_write_options(compression="zstd")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_dir = Path(tmp_dir) / "out"
+        for key in list_keys(client, raw_bucket, f"{table}/"):
+            local_csv = Path(tmp_dir) / Path(key).name
+            client.download_file(raw_bucket, key, str(local_csv))
+
+            reader = pacsv.open_csv(local_csv, convert_options=convert_options)
+            schema = reader.schema
+            batches = (batch for batch in reader)
+            partitioning = None
+            if date_column:
+                batches = _with_partition_columns(batches, date_column)
+                schema = schema.append(pa.field("year", pa.int64())).append(
+                    pa.field("month", pa.int64())
+                )
+                partitioning = ds.partitioning(
+                    pa.schema([("year", pa.int64()), ("month", pa.int64())]),
+                    flavor="hive",
+                )
+
+            ds.write_dataset(
+                batches,
+                out_dir,
+                schema=schema,
+                format="parquet",
+                partitioning=partitioning,
+                file_options=file_options,
+                basename_template=f"{local_csv.stem}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+            local_csv.unlink()
+
+        written = 0
+        for path in sorted(out_dir.rglob("*.parquet")):
+            key = f"{table}/{path.relative_to(out_dir).as_posix()}"
+            client.upload_file(str(path), processed_bucket, key, Config=TRANSFER_CONFIG)
+            written += 1
+
+    print(f"Converted {table}: {written} Parquet objects in s3://{processed_bucket}")
+    return written
+
+
+def run_pipeline(client, source_dir: str) -> Dict[str, int]:
+    """Upload source_dir to raw-data, then convert every table it contained."""
+
+    ensure_buckets(client)
+    keys = upload_raw_files(client, source_dir)
+    tables = sorted({key.split("/", 1)[0] for key in keys})
+    return {table: convert_table(client, table) for table in tables}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default="../learning_etl/raw_data")
+    args = parser.parse_args()
+    run_pipeline(get_s3_client(), args.source)
+
+
+if __name__ == "__main__":
+    main()
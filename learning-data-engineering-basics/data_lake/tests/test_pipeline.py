@@ -0,0 +1,106 @@
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pipeline import (  # noqa: E402
+    PROCESSED_BUCKET,
+    RAW_BUCKET,
+    list_keys,
+    run_pipeline,
+    table_name,
+)
+
+
+@pytest.fixture
+def s3_client():
+    """In-process S3 stand-in for the MinIO service."""
+
+    with moto.mock_aws():
+        yield boto3.client("s3", region_name="us-east-1")
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    (tmp_path / "department.csv").write_text('"department_id","name"\n1,Sales\n2,HR\n')
+    (tmp_path / "attendance_part1.csv").write_text(
+        "attendance_id,employee_id,att_date,status\n"
+        "1,1,2023-01-02,P\n"
+        "2,1,2023-02-01,A\n"
+    )
+    (tmp_path / "attendance_part2.csv").write_text(
+        "attendance_id,employee_id,att_date,status\n" "3,2,2023-02-02,P\n"
+    )
+    return tmp_path
+
+
+class TestTableName:
+    def test_strips_part_suffix(self) -> None:
+        assert table_name("attendance_part3.csv") == "attendance"
+        assert table_name("employee.csv") == "employee"
+
+
+class TestRunPipeline:
+    def test_uploads_raw_files(self, s3_client, source_dir) -> None:
+        run_pipeline(s3_client, str(source_dir))
+
+        assert sorted(list_keys(s3_client, RAW_BUCKET, "")) == [
+            "attendance/attendance_part1.csv",
+            "attendance/attendance_part2.csv",
+            "department/department.csv",
+        ]
+
+    def test_partitions_date_tables(self, s3_client, source_dir, tmp_path) -> None:
+        written = run_pipeline(s3_client, str(source_dir))
+
+        keys = list_keys(s3_client, PROCESSED_BUCKET, "attendance/")
+        assert written["attendance"] == len(keys) == 3
+        assert {key.rsplit("/", 1)[0] for key in keys} == {
+            "attendance/year=2023/month=1",
+            "attendance/year=2023/month=2",
+        }
+
+        local = tmp_path / "part.parquet"
+        s3_client.download_file(PROCESSED_BUCKET, keys[0], str(local))
+        table = pq.read_table(local)
+        assert table.column_names == [
+            "attendance_id",
+            "employee_id",
+            "att_date",
+            "status",
+        ]
+
+    def test_unpartitioned_table(self, s3_client, source_dir, tmp_path) -> None:
+        run_pipeline(s3_client, str(source_dir))
+
+        keys = list_keys(s3_client, PROCESSED_BUCKET, "department/")
+        assert keys == ["department/department-0.parquet"]
+
+        local = tmp_path / "department.parquet"
+        s3_client.download_file(PROCESSED_BUCKET, keys[0], str(local))
+        assert pq.read_table(local).num_rows == 2
+
+    def test_declared_column_types(self, s3_client, tmp_path) -> None:
+        """An all-empty exit_date stays a date column, ids stay int32."""
+
+        pa = pytest.importorskip("pyarrow")
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "employee.csv").write_text(
+            "employee_id,full_name,department_id,designation_id,base_salary,"
+            "join_date,exit_date\n"
+            "1,Asha,1,1,30000,2020-01-06,\n"
+            "2,Ravi,2,1,45000,2021-03-01,\n"
+        )
+
+        run_pipeline(s3_client, str(source))
+
+        local = tmp_path / "employee.parquet"
+        s3_client.download_file(
+            PROCESSED_BUCKET, "employee/employee-0.parquet", str(local)
+        )
+        schema = pq.read_table(local).schema
+        assert schema.field("exit_date").type == pa.date32()
+        assert schema.field("employee_id").type == pa.int32()
+        assert schema.field("base_salary").type == pa.float64()
@@ -0,0 +1,388 @@
+"""OLTP (PostgreSQL) vs OLAP (DuckDB) query benchmark.
+
+Replaces the one-shot timings in timming.ipynb with a repeatable run:
+- every query in QUERY_CATALOGUE is warmed up N times, then timed M times
+- each timed run fetches the full result set, not just the cursor
+- median/p95 latency, rows returned, rows scanned and the process's peak
+  resident memory (RSS, so DuckDB's native allocations count) are written
+  to a JSON report that can be diffed between commits. For PostgreSQL the
+  RSS is the client's: the cost of receiving the result, not the server's.
+
+Usage:
+    python benchmark.py --engines duckdb postgres --warmup 2 --runs 10
+
+`--engines duckdb` needs no server, which is what CI runs; point PGHOST/
+PGDATABASE at a throwaway local PostgreSQL to include the OLTP side.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import duckdb
+
+from transform import MART_QUERIES
+
+DEFAULT_PG_CONFIG = {
+    "host": os.getenv("PGHOST", "localhost"),
+    "port": int(os.getenv("PGPORT", "5432")),
+    "dbname": os.getenv("PGDATABASE", "oltp_olap"),
+    "user": os.getenv("PGUSER", "rohitagarwal"),
+    "password": os.getenv("PGPASSWORD", "rohit2610"),
+}
+DEFAULT_DUCKDB_PATH = "warehouse.test_db"
+DEFAULT_REPORT_PATH = "benchmark_report.json"
+RSS_SAMPLE_INTERVAL_S = 0.001
+
+# timming.ipynb analytics plus date-range filters, runnable on both engines.
+QUERY_CATALOGUE: Dict[str, str] = {
+    "department_payroll_per_year": """
+        SELECT
+            d.name AS department,
+            EXTRACT(YEAR FROM p.year_month) AS year,
+            SUM(p.net_salary) AS total_payroll
+        FROM payroll_monthly p
+        JOIN employee e ON p.employee_id = e.employee_id
+        JOIN department d ON e.department_id = d.department_id
+        GROUP BY d.name, year
+        ORDER BY year, total_payroll DESC;
+    """,
+    "attendance_pct_per_department": """
+        SELECT
+            d.name AS department,
+            COUNT(*) FILTER (WHERE a.status = 'P') * 100.0 / COUNT(*) AS attendance_pct
+        FROM attendance a
+        JOIN employee e ON a.employee_id = e.employee_id
+        JOIN department d ON e.department_id = d.department_id
+        GROUP BY d.name
+        ORDER BY attendance_pct DESC;
+    """,
+    "top_lifetime_salary": """
+        SELECT
+            e.employee_id,
+            e.full_name,
+            SUM(p.net_salary) AS lifetime_salary
+        FROM payroll_monthly p
+        JOIN employee e ON p.employee_id = e.employee_id
+        GROUP BY e.employee_id, e.full_name
+        ORDER BY lifetime_salary DESC
+        LIMIT 20;
+    """,
+    "department_payroll_yoy": """
+        WITH yearly_payroll AS (
+            SELECT
+                d.name AS department,
+                EXTRACT(YEAR FROM p.year_month) AS year,
+                SUM(p.net_salary) AS total_payroll
+            FROM payroll_monthly p
+            JOIN employee e ON p.employee_id = e.employee_id
+            JOIN department d ON e.department_id = d.department_id
+            GROUP BY d.name, year
+        )
+        SELECT
+            department,
+            year,
+            total_payroll,
+            total_payroll
+                - LAG(total_payroll) OVER (PARTITION BY department ORDER BY year)
+                AS yoy_growth
+        FROM yearly_payroll
+        ORDER BY department, year;
+    """,
+    # date-range filters, the access pattern the date-ordered layout targets
+    "attendance_status_one_month": """
+        SELECT status, COUNT(*) AS days
+        FROM attendance
+        WHERE att_date BETWEEN DATE '2023-03-01' AND DATE '2023-03-31'
+        GROUP BY status
+        ORDER BY status;
+    """,
+    "attendance_pct_one_quarter": """
+        SELECT
+            d.name AS department,
+            COUNT(*) FILTER (WHERE a.status = 'P') * 100.0 / COUNT(*) AS attendance_pct
+        FROM attendance a
+        JOIN employee e ON a.employee_id = e.employee_id
+        JOIN department d ON e.department_id = d.department_id
+        WHERE a.att_date BETWEEN DATE '2023-04-01' AND DATE '2023-06-30'
+        GROUP BY d.name
+        ORDER BY attendance_pct DESC;
+    """,
+    "payroll_one_year": """
+        SELECT e.department_id, SUM(p.net_salary) AS total_payroll
+        FROM payroll_monthly p
+        JOIN employee e ON p.employee_id = e.employee_id
+        WHERE p.year_month BETWEEN DATE '2023-01-01' AND DATE '2023-12-01'
+        GROUP BY e.department_id
+        ORDER BY total_payroll DESC;
+    """,
+}
+
+# Same analytics served from the star-schema marts (DuckDB only).
+MART_CATALOGUE: Dict[str, str] = {
+    f"{name}__mart": query for name, query in MART_QUERIES.items()
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def git_commit() -> Optional[str]:
+    """Short hash of the current commit, if run inside a git checkout."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux /proc), or None elsewhere."""
+
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def max_rss_bytes() -> int:
+    """Lifetime peak RSS from getrusage (kB on Linux, bytes on macOS)."""
+
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def peak_rss_during(fn: Callable[[], Any]) -> Tuple[int, int]:
+    """Run fn while sampling RSS; returns (RSS before, peak RSS) in bytes.
+
+    Without /proc the peak falls back to getrusage's high-water mark, which
+    only moves when this run exceeds every earlier one.
+    """
+
+    baseline = current_rss_bytes()
+    if baseline is None:
+        before = max_rss_bytes()
+        fn()
+        return before, max_rss_bytes()
+
+    peak = baseline
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(RSS_SAMPLE_INTERVAL_S):
+            peak = max(peak, current_rss_bytes() or 0)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        fn()
+    finally:
+        done.set()
+        sampler.join()
+    return baseline, max(peak, current_rss_bytes() or 0)
+
+
+def _sum_pg_scanned(plan: Dict[str, Any]) -> int:
+    """Sum actual rows produced by scan nodes of a Postgres JSON plan."""
+
+    rows = 0
+    if "Scan" in plan.get("Node Type", ""):
+        rows += int(plan.get("Actual Rows", 0)) * int(plan.get("Actual Loops", 1))
+    for child in plan.get("Plans", []):
+        rows += _sum_pg_scanned(child)
+    return rows
+
+
+def _sum_duckdb_scanned(node: Dict[str, Any]) -> int:
+    """Sum cardinality of scan operators of a DuckDB JSON profile."""
+
+    name = (
+        node.get("operator_type") or node.get("operator_name") or node.get("name", "")
+    )
+    rows = 0
+    if "SCAN" in str(name).upper():
+        rows += int(node.get("operator_cardinality", node.get("cardinality", 0)))
+    for child in node.get("children", []):
+        rows += _sum_duckdb_scanned(child)
+    return rows
+
+
+class PostgresRunner:
+    """Executes catalogue queries against PostgreSQL via psycopg2."""
+
+    engine = "postgres"
+
+    def __init__(self, config: Dict[str, Any] = DEFAULT_PG_CONFIG) -> None:
+        import psycopg2
+
+        self.conn = psycopg2.connect(**config)
+        self.conn.autocommit = True
+
+    def fetch_all(self, query: str) -> List[tuple]:
+        with self.conn.cursor() as cur:
+            cur.execute(query)
+            return cur.fetchall()
+
+    def rows_scanned(self, query: str) -> int:
+        with self.conn.cursor() as cur:
+            cur.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + query)
+            plan = cur.fetchone()[0]
+        return _sum_pg_scanned(plan[0]["Plan"])
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class DuckDBRunner:
+    """Executes catalogue queries against the DuckDB warehouse."""
+
+    engine = "duckdb"
+
+    def __init__(self, database: str = DEFAULT_DUCKDB_PATH) -> None:
+        self.conn = duckdb.connect(database=database, read_only=True)
+
+    def fetch_all(self, query: str) -> List[tuple]:
+        return self.conn.execute(query).fetchall()
+
+    def rows_scanned(self, query: str) -> int:
+        profile_path = Path(f".duckdb_profile_{os.getpid()}.json")
+        self.conn.execute("SET enable_profiling = 'json'")
+        self.conn.execute(f"SET profiling_output = '{profile_path}'")
+        try:
+            self.conn.execute(query).fetchall()
+        finally:
+            self.conn.execute("PRAGMA disable_profiling")
+        try:
+            profile = json.loads(profile_path.read_text())
+        finally:
+            profile_path.unlink(missing_ok=True)
+        if "cumulative_rows_scanned" in profile:
+            return int(profile["cumulative_rows_scanned"])
+        return _sum_duckdb_scanned(profile)
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def measure(
+    fetch_all: Callable[[str], List[tuple]], query: str, warmup: int, runs: int
+) -> Dict[str, Any]:
+    """Warm up, then time `runs` full executions of a query."""
+
+    for _ in range(warmup):
+        fetch_all(query)
+
+    timings_ms: List[float] = []
+    rows_returned = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = fetch_all(query)
+        timings_ms.append((time.perf_counter() - start) * 1000)
+        rows_returned = len(rows)
+
+    # the sampler thread competes for the GIL, so memory gets its own untimed run
+    rss_before, rss_peak = peak_rss_during(lambda: fetch_all(query))
+
+    return {
+        "runs": runs,
+        "warmup": warmup,
+        "median_ms": round(statistics.median(timings_ms), 3),
+        "p95_ms": round(percentile(timings_ms, 95), 3),
+        "min_ms": round(min(timings_ms), 3),
+        "max_ms": round(max(timings_ms), 3),
+        "rows_returned": rows_returned,
+        "peak_rss_mb": round(rss_peak / 1024 / 1024, 3),
+        "rss_growth_mb": round((rss_peak - rss_before) / 1024 / 1024, 3),
+    }
+
+
+def run_catalogue(
+    runner, catalogue: Dict[str, str], warmup: int, runs: int
+) -> List[Dict[str, Any]]:
+    """Benchmark every query of a catalogue on one engine."""
+
+    results = []
+    for name, query in catalogue.items():
+        result = {"query": name, "engine": runner.engine}
+        result.update(measure(runner.fetch_all, query, warmup, runs))
+        result["rows_scanned"] = runner.rows_scanned(query)
+        results.append(result)
+        print(
+            f"{runner.engine:<8} {name:<40} "
+            f"median {result['median_ms']:>10.2f} ms  p95 {result['p95_ms']:>10.2f} ms"
+        )
+    return results
+
+
+def write_report(results: List[Dict[str, Any]], path: str, config: Dict) -> None:
+    """Write results as stable, diff-friendly JSON."""
+
+    report = {
+        "commit": git_commit(),
+        "config": config,
+        "results": sorted(results, key=lambda r: (r["query"], r["engine"])),
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Report written to {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--engines", nargs="+", choices=["postgres", "duckdb"], default=["duckdb"]
+    )
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--duckdb-path", default=DEFAULT_DUCKDB_PATH)
+    parser.add_argument(
+        "--no-marts",
+        action="store_true",
+        help="skip the star-schema mart variants on DuckDB",
+    )
+    parser.add_argument("--output", default=DEFAULT_REPORT_PATH)
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for engine in args.engines:
+        if engine == "postgres":
+            runner = PostgresRunner()
+            catalogue = QUERY_CATALOGUE
+        else:
+            runner = DuckDBRunner(args.duckdb_path)
+            catalogue = dict(QUERY_CATALOGUE)
+            if not args.no_marts:
+                catalogue.update(MART_CATALOGUE)
+        try:
+            results.extend(run_catalogue(runner, catalogue, args.warmup, args.runs))
+        finally:
+            runner.close()
+
+    config = {"engines": args.engines, "warmup": args.warmup, "runs": args.runs}
+    write_report(results, args.output, config)
+
+
+if __name__ == "__main__":
+    main()
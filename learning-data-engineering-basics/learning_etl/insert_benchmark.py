@@ -0,0 +1,333 @@
+"""Insert-throughput benchmark for PostgreSQL and DuckDB write paths.
+
+The insert cell in timming.ipynb issues 10,000 single-row INSERTs, which
+mostly measures round-trips. This compares the write strategies we actually
+use, at increasing row counts, and reports rows/sec:
+
+PostgreSQL: row-by-row, executemany, execute_batch, execute_values, COPY FROM STDIN
+DuckDB:     row-by-row, executemany, DataFrame append, Arrow registration, Parquet COPY
+
+Every strategy pulls rows from the same lazy generator in CHUNK_SIZE blocks,
+so the `generate_only` baseline is the cost to subtract from each timing.
+
+Usage:
+    python insert_benchmark.py --engines duckdb --rows 10000 100000 1000000
+"""
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import duckdb
+
+from benchmark import DEFAULT_PG_CONFIG, git_commit
+
+DEFAULT_ROW_COUNTS = [10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_PAGE_SIZES = [100, 1_000, 10_000]
+# row-by-row and executemany are skipped above this many rows
+DEFAULT_MAX_SLOW_ROWS = 100_000
+CHUNK_SIZE = 100_000
+DEFAULT_REPORT_PATH = "insert_benchmark_report.json"
+
+COLUMNS = ["id", "name", "phone", "email"]
+Row = Tuple[int, str, str, str]
+
+
+def sample_rows(num_rows: int) -> Iterator[Row]:
+    """Same row shape as the sample_table cells in timming.ipynb."""
+
+    for i in range(1, num_rows + 1):
+        yield (i, f"Name_{i}", f"123-456-789{i % 10}", f"name_{i}@example.com")
+
+
+def chunked(rows: Iterator[Row], size: int = CHUNK_SIZE) -> Iterator[List[Row]]:
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def generate_only(num_rows: int) -> None:
+    for _ in chunked(sample_rows(num_rows)):
+        pass
+
+
+# ---------------------------------------------------------------- PostgreSQL
+
+PG_INSERT = "INSERT INTO sample_table (id, name, phone, email) VALUES (%s, %s, %s, %s)"
+
+
+def pg_reset(conn) -> None:
+    with conn.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS sample_table")
+        cur.execute(
+            "CREATE TABLE sample_table "
+            "(id INTEGER, name VARCHAR(100), phone VARCHAR(15), email VARCHAR(100))"
+        )
+    conn.commit()
+
+
+def pg_row_by_row(conn, num_rows: int) -> None:
+    with conn.cursor() as cur:
+        for row in sample_rows(num_rows):
+            cur.execute(PG_INSERT, row)
+    conn.commit()
+
+
+def pg_executemany(conn, num_rows: int) -> None:
+    with conn.cursor() as cur:
+        for chunk in chunked(sample_rows(num_rows)):
+            cur.executemany(PG_INSERT, chunk)
+    conn.commit()
+
+
+def pg_execute_batch(page_size: int) -> Callable:
+    def run(conn, num_rows: int) -> None:
+        from psycopg2.extras import execute_batch
+
+        with conn.cursor() as cur:
+            for chunk in chunked(sample_rows(num_rows)):
+                execute_batch(cur, PG_INSERT, chunk, page_size=page_size)
+        conn.commit()
+
+    return run
+
+
+def pg_execute_values(page_size: int) -> Callable:
+    def run(conn, num_rows: int) -> None:
+        from psycopg2.extras import execute_values
+
+        with conn.cursor() as cur:
+            for chunk in chunked(sample_rows(num_rows)):
+                execute_values(
+                    cur,
+                    "INSERT INTO sample_table (id, name, phone, email) VALUES %s",
+                    chunk,
+                    page_size=page_size,
+                )
+        conn.commit()
+
+    return run
+
+
+def pg_copy(conn, num_rows: int) -> None:
+    with conn.cursor() as cur:
+        for chunk in chunked(sample_rows(num_rows)):
+            buffer = io.StringIO()
+            buffer.writelines("\t".join(map(str, row)) + "\n" for row in chunk)
+            buffer.seek(0)
+            cur.copy_expert(
+                "COPY sample_table (id, name, phone, email) FROM STDIN", buffer
+            )
+    conn.commit()
+
+
+def pg_strategies(page_sizes: List[int]) -> Dict[str, Tuple[Callable, bool]]:
+    """name -> (strategy, is_slow)"""
+
+    strategies = {
+        "row_by_row": (pg_row_by_row, True),
+        "executemany": (pg_executemany, True),
+    }
+    for page_size in page_sizes:
+        strategies[f"execute_batch_{page_size}"] = (pg_execute_batch(page_size), False)
+    for page_size in page_sizes:
+        strategies[f"execute_values_{page_size}"] = (
+            pg_execute_values(page_size),
+            False,
+        )
+    strategies["copy_from_stdin"] = (pg_copy, False)
+    return strategies
+
+
+# ---------------------------------------------------------------- DuckDB
+
+DUCKDB_INSERT = "INSERT INTO sample_table (id, name, phone, email) VALUES (?, ?, ?, ?)"
+
+
+def duckdb_reset(conn: duckdb.DuckDBPyConnection) -> None:
+    conn.execute("DROP TABLE IF EXISTS sample_table")
+    conn.execute(
+        "CREATE TABLE sample_table (id INTEGER, name VARCHAR, phone VARCHAR, email VARCHAR)"
+    )
+
+
+def duckdb_row_by_row(conn: duckdb.DuckDBPyConnection, num_rows: int) -> None:
+    for row in sample_rows(num_rows):
+        conn.execute(DUCKDB_INSERT, row)
+
+
+def duckdb_executemany(conn: duckdb.DuckDBPyConnection, num_rows: int) -> None:
+    for chunk in chunked(sample_rows(num_rows)):
+        conn.executemany(DUCKDB_INSERT, chunk)
+
+
+def duckdb_dataframe_append(conn: duckdb.DuckDBPyConnection, num_rows: int) -> None:
+    import pandas as pd
+
+    for chunk in chunked(sample_rows(num_rows)):
+        conn.append("sample_table", pd.DataFrame(chunk, columns=COLUMNS))
+
+
+def _arrow_table(chunk: List[Row]):
+    import pyarrow as pa
+
+    return pa.Table.from_arrays(
+        [pa.array(column) for column in zip(*chunk)], names=COLUMNS
+    )
+
+
+def duckdb_arrow(conn: duckdb.DuckDBPyConnection, num_rows: int) -> None:
+    for chunk in chunked(sample_rows(num_rows)):
+        conn.register("sample_chunk", _arrow_table(chunk))
+        conn.execute("INSERT INTO sample_table SELECT * FROM sample_chunk")
+        conn.unregister("sample_chunk")
+
+
+def duckdb_parquet_copy(conn: duckdb.DuckDBPyConnection, num_rows: int) -> None:
+    """Stage the rows as one Parquet file, then COPY it in.
+
+    Writing the file is part of the timing: it is what an ETL producer pays.
+    """
+
+    import pyarrow.parquet as pq
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sample.parquet")
+        writer = None
+        for chunk in chunked(sample_rows(num_rows)):
+            table = _arrow_table(chunk)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+            conn.execute(f"COPY sample_table FROM '{path}' (FORMAT PARQUET)")
+
+
+def duckdb_strategies() -> Dict[str, Tuple[Callable, bool]]:
+    """name -> (strategy, is_slow)"""
+
+    return {
+        "row_by_row": (duckdb_row_by_row, True),
+        "executemany": (duckdb_executemany, True),
+        "dataframe_append": (duckdb_dataframe_append, False),
+        "arrow_register": (duckdb_arrow, False),
+        "parquet_copy": (duckdb_parquet_copy, False),
+    }
+
+
+# ---------------------------------------------------------------- runner
+
+
+def time_strategy(
+    engine: str, conn, reset: Callable, name: str, strategy: Callable, num_rows: int
+) -> Dict:
+    reset(conn)
+    start = time.perf_counter()
+    strategy(conn, num_rows)
+    elapsed = time.perf_counter() - start
+    result = {
+        "engine": engine,
+        "strategy": name,
+        "rows": num_rows,
+        "seconds": round(elapsed, 4),
+        "rows_per_sec": round(num_rows / elapsed) if elapsed else None,
+    }
+    print(
+        f"{engine:<8} {name:<22} {num_rows:>11,} rows "
+        f"{elapsed:>9.3f} s {result['rows_per_sec'] or 0:>12,} rows/sec"
+    )
+    return result
+
+
+def run_engine(
+    engine: str,
+    conn,
+    reset: Callable,
+    strategies: Dict[str, Tuple[Callable, bool]],
+    row_counts: List[int],
+    max_slow_rows: int,
+) -> List[Dict]:
+    results = []
+    for num_rows in row_counts:
+        for name, (strategy, is_slow) in strategies.items():
+            if is_slow and num_rows > max_slow_rows:
+                continue
+            results.append(time_strategy(engine, conn, reset, name, strategy, num_rows))
+    reset(conn)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--engines", nargs="+", choices=["postgres", "duckdb"], default=["duckdb"]
+    )
+    parser.add_argument("--rows", nargs="+", type=int, default=DEFAULT_ROW_COUNTS)
+    parser.add_argument("--page-sizes", nargs="+", type=int, default=DEFAULT_PAGE_SIZES)
+    parser.add_argument("--max-slow-rows", type=int, default=DEFAULT_MAX_SLOW_ROWS)
+    parser.add_argument("--duckdb-path", default=":memory:")
+    parser.add_argument("--output", default=DEFAULT_REPORT_PATH)
+    args = parser.parse_args()
+
+    results = []
+    for num_rows in args.rows:
+        start = time.perf_counter()
+        generate_only(num_rows)
+        elapsed = time.perf_counter() - start
+        results.append(
+            {
+                "engine": "none",
+                "strategy": "generate_only",
+                "rows": num_rows,
+                "seconds": round(elapsed, 4),
+                "rows_per_sec": round(num_rows / elapsed) if elapsed else None,
+            }
+        )
+
+    for engine in args.engines:
+        if engine == "postgres":
+            import psycopg2
+
+            conn = psycopg2.connect(**DEFAULT_PG_CONFIG)
+            strategies = pg_strategies(args.page_sizes)
+            reset = pg_reset
+        else:
+            conn = duckdb.connect(database=args.duckdb_path)
+            strategies = duckdb_strategies()
+            reset = duckdb_reset
+        try:
+            results.extend(
+                run_engine(
+                    engine, conn, reset, strategies, args.rows, args.max_slow_rows
+                )
+            )
+        finally:
+            conn.close()
+
+    report = {
+        "commit": git_commit(),
+        "config": {
+            "engines": args.engines,
+            "rows": args.rows,
+            "page_sizes": args.page_sizes,
+            "max_slow_rows": args.max_slow_rows,
+            "chunk_size": CHUNK_SIZE,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Before/after benchmark for the date-ordered attendance/payroll layout.
+
+Builds two throwaway warehouses from raw_data/, one loaded in file order and
+one with `load_data(sort_on_load=True)`, runs the benchmark catalogue against
+both and reports the latency and rows-scanned change per query.
+
+Usage:
+    python layout_benchmark.py --warmup 2 --runs 10
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from typing import Dict, List
+
+import duckdb
+
+from benchmark import QUERY_CATALOGUE, DuckDBRunner, git_commit, run_catalogue
+from main import create_tables, load_data
+
+DEFAULT_REPORT_PATH = "layout_benchmark_report.json"
+
+
+def build_warehouse(path: str, sort_on_load: bool) -> None:
+    conn = duckdb.connect(database=path, read_only=False)
+    try:
+        create_tables(conn)
+        load_data(conn, sort_on_load=sort_on_load)
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+
+
+def compare(before: List[Dict], after: List[Dict]) -> List[Dict]:
+    after_by_query = {r["query"]: r for r in after}
+    rows = []
+    for b in before:
+        a = after_by_query[b["query"]]
+        rows.append(
+            {
+                "query": b["query"],
+                "file_order_median_ms": b["median_ms"],
+                "sorted_median_ms": a["median_ms"],
+                "speedup": (
+                    round(b["median_ms"] / a["median_ms"], 2)
+                    if a["median_ms"]
+                    else None
+                ),
+                "file_order_rows_scanned": b["rows_scanned"],
+                "sorted_rows_scanned": a["rows_scanned"],
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", default=DEFAULT_REPORT_PATH)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for layout, sort_on_load in (("file_order", False), ("sorted", True)):
+            path = os.path.join(tmp_dir, f"{layout}.duckdb")
+            print(f"Building {layout} warehouse...")
+            build_warehouse(path, sort_on_load)
+
+            runner = DuckDBRunner(path)
+            try:
+                results[layout] = run_catalogue(
+                    runner, QUERY_CATALOGUE, args.warmup, args.runs
+                )
+            finally:
+                runner.close()
+
+    comparison = compare(results["file_order"], results["sorted"])
+    print()
+    print(f"{'query':<32} {'file order':>12} {'sorted':>12} {'speedup':>8}")
+    for row in comparison:
+        print(
+            f"{row['query']:<32} {row['file_order_median_ms']:>10.2f}ms "
+            f"{row['sorted_median_ms']:>10.2f}ms {row['speedup'] or 0:>7.2f}x"
+        )
+
+    report = {
+        "commit": git_commit(),
+        "config": {"warmup": args.warmup, "runs": args.runs},
+        "comparison": comparison,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
+import os
+import sys
+from typing import Optional
+
 import duckdb
 
+from object_cache import ObjectCache, get_s3_client
+from transform import run_transform
+
 
 def create_tables(conn: duckdb.DuckDBPyConnection):
     conn.execute("DROP TABLE IF EXISTS attendance")
@@ -79,26 +86,143 @@ def create_tables(conn: duckdb.DuckDBPyConnection):
     """)
 
 
-def load_data(conn: duckdb.DuckDBPyConnection):
+ATTENDANCE_FILES = [
+    "raw_data/attendance_part1.csv",
+    "raw_data/attendance_part2.csv",
+    "raw_data/attendance_part3.csv",
+]
+
+
+def load_data(conn: duckdb.DuckDBPyConnection, sort_on_load: bool = True):
+    """Load the raw CSVs.
+
+    With sort_on_load, attendance and payroll_monthly are written ordered by
+    date so each row group's min/max (zone map) covers a narrow date range and
+    date-range filters can skip most of them. Without it rows land in file order.
+    """
+
     conn.execute("""
         COPY department FROM 'raw_data/department.csv' (AUTO_DETECT TRUE);
         COPY salary_structure FROM 'raw_data/salary_structure.csv' (AUTO_DETECT TRUE);
         COPY designation FROM 'raw_data/designation.csv' (AUTO_DETECT TRUE);
-        COPY employee FROM 'raw_data/employee.csv' (AUTO_DETECT TRUE);
-        COPY payroll_monthly FROM 'raw_data/payroll_monthly.csv' (AUTO_DETECT TRUE);
-        COPY attendance FROM 'raw_data/attendance_part1.csv' (AUTO_DETECT TRUE);
-        COPY attendance FROM 'raw_data/attendance_part2.csv' (AUTO_DETECT TRUE);
-        COPY attendance FROM 'raw_data/attendance_part3.csv' (AUTO_DETECT TRUE);""")
+        COPY employee FROM 'raw_data/employee.csv' (AUTO_DETECT TRUE);""")
+
+    if not sort_on_load:
+        conn.execute(
+            "COPY payroll_monthly FROM 'raw_data/payroll_monthly.csv' (AUTO_DETECT TRUE);"
+        )
+        for path in ATTENDANCE_FILES:
+            conn.execute(f"COPY attendance FROM '{path}' (AUTO_DETECT TRUE);")
+        return
+
+    conn.execute("""
+        INSERT INTO payroll_monthly
+        SELECT * FROM read_csv('raw_data/payroll_monthly.csv', auto_detect = true)
+        ORDER BY year_month, employee_id;""")
+    conn.execute(
+        """
+        INSERT INTO attendance
+        SELECT * FROM read_csv(?, auto_detect = true)
+        ORDER BY att_date, employee_id;""",
+        [ATTENDANCE_FILES],
+    )
+
+
+LAKE_BUCKET = "processed-data"
+LAKE_TABLES = [
+    "department",
+    "salary_structure",
+    "designation",
+    "employee",
+    "payroll_monthly",
+    "attendance",
+]
+# load order for the date-keyed tables, same as load_data(sort_on_load=True)
+LAKE_SORT_KEYS = {
+    "payroll_monthly": "year_month, employee_id",
+    "attendance": "att_date, employee_id",
+}
+
+
+def configure_s3(conn: duckdb.DuckDBPyConnection):
+    """Point DuckDB's httpfs at the data-lake MinIO (see data_lake/)."""
+
+    endpoint = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
+    conn.execute("INSTALL httpfs; LOAD httpfs;")
+    conn.execute(f"SET s3_endpoint = '{endpoint.split('://', 1)[-1]}'")
+    conn.execute(f"SET s3_use_ssl = {str(endpoint.startswith('https')).lower()}")
+    conn.execute("SET s3_url_style = 'path'")
+    conn.execute(f"SET s3_region = '{os.getenv('S3_REGION', 'us-east-1')}'")
+    conn.execute(
+        f"SET s3_access_key_id = '{os.getenv('S3_ACCESS_KEY_ID', 'minioadmin')}'"
+    )
+    conn.execute(
+        "SET s3_secret_access_key = "
+        f"'{os.getenv('S3_SECRET_ACCESS_KEY', 'minioadmin')}'"
+    )
+
+
+def load_data_from_lake(
+    conn: duckdb.DuckDBPyConnection,
+    bucket: str = LAKE_BUCKET,
+    cache: Optional[ObjectCache] = None,
+):
+    """Load the warehouse from the processed Parquet objects.
+
+    With a cache, objects are synced to local disk first and only new or
+    rewritten ones are downloaded; without one DuckDB reads S3 directly.
+    The original columns are all inside the files, so hive columns are not read.
+
+    Raises:
+        ValueError: If a table has no objects in the bucket (cached path).
+    """
+
+    if cache is None:
+        configure_s3(conn)
+    else:
+        client = get_s3_client()
+
+    for table in LAKE_TABLES:
+        if cache is None:
+            source = f"'s3://{bucket}/{table}/**/*.parquet'"
+        else:
+            paths = cache.sync_prefix(client, bucket, f"{table}/")
+            if not paths:
+                # read_parquet([]) fails with a binder error that names no table
+                raise ValueError(
+                    f"No objects under s3://{bucket}/{table}/; "
+                    "run data_lake/pipeline.py first"
+                )
+            source = "[" + ", ".join(f"'{path}'" for path in paths) + "]"
+
+        order_by = (
+            f"ORDER BY {LAKE_SORT_KEYS[table]}" if table in LAKE_SORT_KEYS else ""
+        )
+        conn.execute(f"""
+            INSERT INTO {table} BY NAME
+            SELECT * FROM read_parquet({source}, hive_partitioning = false)
+            {order_by};""")
+
+    if cache is not None:
+        print(cache.report())
 
 
 def check_data(conn: duckdb.DuckDBPyConnection):
     result = conn.execute("SELECT COUNT(*) FROM employee;").fetchone()
     print(f"Total employees: {result}")
 
+    for table in ("dim_date", "dim_employee", "fact_payroll", "fact_attendance"):
+        result = conn.execute(f"SELECT COUNT(*) FROM {table};").fetchone()
+        print(f"{table} rows: {result}")
+
 
 if __name__ == "__main__":
     conn = duckdb.connect(database="warehouse.test_db", read_only=False)
     create_tables(conn)
-    load_data(conn)
+    if len(sys.argv) > 1 and sys.argv[1] == "lake":
+        load_data_from_lake(conn, cache=ObjectCache())
+    else:
+        load_data(conn)
+    run_transform(conn)
     check_data(conn)
     conn.close()
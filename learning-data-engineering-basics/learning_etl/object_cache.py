@@ -0,0 +1,164 @@
+"""Local read cache for data-lake objects.
+
+Lake objects are immutable once written, so a local copy keyed by
+(bucket, key, ETag) stays valid until the object is rewritten, at which point
+its ETag - and therefore its cache entry - changes. Entries are stored by
+content address under the cache directory and evicted least-recently-used
+once the cache grows past max_bytes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+DEFAULT_CACHE_DIR = os.getenv("LAKE_CACHE_DIR", ".lake_cache")
+DEFAULT_MAX_BYTES = int(os.getenv("LAKE_CACHE_MAX_BYTES", str(2 * 1024**3)))
+INDEX_FILE = "index.json"
+
+
+def get_s3_client():
+    """S3 client for the data-lake MinIO, same settings as data_lake/pipeline.py."""
+
+    import boto3
+
+    return boto3.client(
+        "s3",
+        endpoint_url=os.getenv("S3_ENDPOINT_URL", "http://localhost:9000"),
+        aws_access_key_id=os.getenv("S3_ACCESS_KEY_ID", "minioadmin"),
+        aws_secret_access_key=os.getenv("S3_SECRET_ACCESS_KEY", "minioadmin"),
+        region_name=os.getenv("S3_REGION", "us-east-1"),
+    )
+
+
+class ObjectCache:
+    """Content-addressed, size-bounded LRU cache of S3 objects on local disk."""
+
+    def __init__(
+        self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.index: Dict[str, Dict] = self._load_index()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "bytes_saved": 0,
+            "bytes_downloaded": 0,
+        }
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.cache_dir / INDEX_FILE) as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        # drop entries whose file was removed behind our back
+        return {
+            digest: entry
+            for digest, entry in index.items()
+            if (self.cache_dir / entry["file"]).exists()
+        }
+
+    def _save_index(self) -> None:
+        tmp_path = self.cache_dir / f"{INDEX_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.cache_dir / INDEX_FILE)
+
+    @staticmethod
+    def digest(bucket: str, key: str, etag: str) -> str:
+        return hashlib.sha256(f"{bucket}\0{key}\0{etag}".encode()).hexdigest()
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(entry["size"] for entry in self.index.values())
+
+    def _fetch(
+        self, client, bucket: str, key: str, etag: str, size: Optional[int]
+    ) -> str:
+        digest = self.digest(bucket, key, etag)
+        entry = self.index.get(digest)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += entry["size"]
+            entry["last_access"] = time.time()
+            return digest
+
+        file_name = digest + Path(key).suffix
+        tmp_path = self.cache_dir / f"{file_name}.part"
+        client.download_file(bucket, key, str(tmp_path))
+        os.replace(tmp_path, self.cache_dir / file_name)
+
+        size = size if size is not None else (self.cache_dir / file_name).stat().st_size
+        self.index[digest] = {
+            "bucket": bucket,
+            "key": key,
+            "etag": etag,
+            "file": file_name,
+            "size": size,
+            "last_access": time.time(),
+        }
+        self.stats["misses"] += 1
+        self.stats["bytes_downloaded"] += size
+        return digest
+
+    def evict(self, protected: Iterable[str] = ()) -> None:
+        """Drop least-recently-used entries until under max_bytes.
+
+        Protected entries (the ones a caller is about to read) are never
+        evicted, so the cache can briefly exceed its bound.
+        """
+
+        keep: Set[str] = set(protected)
+        total = self.size_bytes
+        by_age = sorted(self.index.items(), key=lambda item: item[1]["last_access"])
+        for digest, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if digest in keep:
+                continue
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            del self.index[digest]
+            total -= entry["size"]
+            self.stats["evictions"] += 1
+
+    def fetch(self, client, bucket: str, key: str) -> Path:
+        """Local path of one object, downloading it on a miss."""
+
+        head = client.head_object(Bucket=bucket, Key=key)
+        digest = self._fetch(client, bucket, key, head["ETag"], head["ContentLength"])
+        self.evict(protected=[digest])
+        self._save_index()
+        return self.cache_dir / self.index[digest]["file"]
+
+    def sync_prefix(self, client, bucket: str, prefix: str) -> List[Path]:
+        """Local paths of every object under a prefix.
+
+        The listing already carries each ETag, so hits cost no extra request.
+        """
+
+        digests = []
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                digests.append(
+                    self._fetch(client, bucket, obj["Key"], obj["ETag"], obj["Size"])
+                )
+        self.evict(protected=digests)
+        self._save_index()
+        return [self.cache_dir / self.index[digest]["file"] for digest in digests]
+
+    def report(self) -> str:
+        stats = self.stats
+        return (
+            f"Lake cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['bytes_saved'] / 1024 / 1024:.1f} MB saved, "
+            f"{stats['bytes_downloaded'] / 1024 / 1024:.1f} MB downloaded, "
+            f"{stats['evictions']} evictions, "
+            f"{self.size_bytes / 1024 / 1024:.1f} MB cached"
+        )
@@ -0,0 +1,224 @@
+"""Materialized summaries for the four benchmark analytics.
+
+The marts built by `transform.run_transform()` are the summary tables. This
+module keeps them current without a full rebuild:
+- `load_increment()` appends new payroll/attendance CSVs to the raw tables and
+  facts, then refreshes only the year-months and employees they touch
+- `SummaryCache` serves the analytics from memory, falling back to the marts
+  once after every refresh
+
+Increments carry facts only; new employees, or dates past the end of dim_date,
+need a full `run_transform()` first and are rejected otherwise.
+"""
+
+from typing import Dict, List, Optional
+
+import duckdb
+
+from transform import (
+    FACT_ATTENDANCE_SELECT,
+    FACT_PAYROLL_SELECT,
+    MART_DEPARTMENT_ATTENDANCE_MONTHLY_SELECT,
+    MART_DEPARTMENT_PAYROLL_MONTHLY_SELECT,
+    MART_EMPLOYEE_LIFETIME_SALARY_SELECT,
+    MART_QUERIES,
+    build_yearly_mart,
+)
+
+
+def _stage_csv(conn: duckdb.DuckDBPyConnection, table: str, path: str) -> str:
+    """Copy a CSV into a temp table shaped like `table`; returns its name."""
+
+    staging = f"staging_{table}"
+    conn.execute(
+        f"CREATE OR REPLACE TEMP TABLE {staging} AS SELECT * FROM {table} LIMIT 0"
+    )
+    conn.execute(f"COPY {staging} FROM '{path}' (AUTO_DETECT TRUE)")
+    return staging
+
+
+def _check_resolved(conn: duckdb.DuckDBPyConnection, staging: str, loaded: int) -> None:
+    """Fail the increment if some rows did not resolve to dimension keys."""
+
+    staged = conn.execute(f"SELECT COUNT(*) FROM {staging}").fetchone()[0]
+    if loaded != staged:
+        raise ValueError(
+            f"{staged - loaded} rows in {staging} reference unknown employees; "
+            "run the full transform first"
+        )
+    missing_months = conn.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT year_month FROM refresh_payroll_months
+            UNION SELECT year_month FROM refresh_attendance_months
+        )
+        WHERE year_month NOT IN (SELECT year_month FROM dim_date)
+    """).fetchone()[0]
+    if missing_months:
+        raise ValueError(
+            f"{missing_months} months fall outside dim_date; run the full transform first"
+        )
+
+
+def refresh_summaries(conn: duckdb.DuckDBPyConnection) -> None:
+    """Recompute mart rows for the keys listed in the refresh_* temp tables.
+
+    refresh_payroll_months, refresh_attendance_months and refresh_employees
+    hold the affected year-months and employee keys of the last increment.
+    """
+
+    conn.execute("""
+        DELETE FROM mart_department_payroll_monthly
+        WHERE year_month IN (SELECT year_month FROM refresh_payroll_months)
+    """)
+    conn.execute(
+        "INSERT INTO mart_department_payroll_monthly "
+        + MART_DEPARTMENT_PAYROLL_MONTHLY_SELECT.format(
+            where="WHERE dt.year_month IN (SELECT year_month FROM refresh_payroll_months)"
+        )
+    )
+
+    conn.execute("""
+        DELETE FROM mart_department_attendance_monthly
+        WHERE year_month IN (SELECT year_month FROM refresh_attendance_months)
+    """)
+    conn.execute(
+        "INSERT INTO mart_department_attendance_monthly "
+        + MART_DEPARTMENT_ATTENDANCE_MONTHLY_SELECT.format(
+            where="WHERE dt.year_month IN (SELECT year_month FROM refresh_attendance_months)"
+        )
+    )
+
+    conn.execute("""
+        DELETE FROM mart_employee_lifetime_salary
+        WHERE employee_key IN (SELECT employee_key FROM refresh_employees)
+    """)
+    conn.execute(
+        "INSERT INTO mart_employee_lifetime_salary "
+        + MART_EMPLOYEE_LIFETIME_SALARY_SELECT.format(
+            where="WHERE f.employee_key IN (SELECT employee_key FROM refresh_employees)"
+        )
+    )
+
+    # yearly totals and YoY growth are derived from the (small) monthly mart
+    build_yearly_mart(conn)
+
+
+def load_increment(
+    conn: duckdb.DuckDBPyConnection,
+    payroll_csv: Optional[str] = None,
+    attendance_csv: Optional[str] = None,
+) -> Dict[str, int]:
+    """Append new payroll/attendance rows and refresh the affected summaries.
+
+    Returns the number of rows loaded and year-months refreshed.
+    """
+
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute(
+            "CREATE OR REPLACE TEMP TABLE refresh_payroll_months (year_month DATE)"
+        )
+        conn.execute(
+            "CREATE OR REPLACE TEMP TABLE refresh_attendance_months (year_month DATE)"
+        )
+        conn.execute(
+            "CREATE OR REPLACE TEMP TABLE refresh_employees (employee_key INTEGER)"
+        )
+
+        stats = {"payroll_rows": 0, "attendance_rows": 0}
+
+        if payroll_csv:
+            staging = _stage_csv(conn, "payroll_monthly", payroll_csv)
+            conn.execute(
+                f"INSERT INTO payroll_monthly SELECT * FROM {staging} "
+                "ORDER BY year_month, employee_id"
+            )
+            loaded = conn.execute(
+                "INSERT INTO fact_payroll " + FACT_PAYROLL_SELECT.format(source=staging)
+            ).fetchone()[0]
+            conn.execute(f"""
+                INSERT INTO refresh_payroll_months
+                SELECT DISTINCT CAST(date_trunc('month', year_month) AS DATE) FROM {staging}
+            """)
+            conn.execute(f"""
+                INSERT INTO refresh_employees
+                SELECT DISTINCT de.employee_key
+                FROM {staging} s
+                JOIN dim_employee de ON s.employee_id = de.employee_id
+            """)
+            _check_resolved(conn, staging, loaded)
+            stats["payroll_rows"] = loaded
+
+        if attendance_csv:
+            staging = _stage_csv(conn, "attendance", attendance_csv)
+            conn.execute(
+                f"INSERT INTO attendance SELECT * FROM {staging} "
+                "ORDER BY att_date, employee_id"
+            )
+            loaded = conn.execute(
+                "INSERT INTO fact_attendance "
+                + FACT_ATTENDANCE_SELECT.format(source=staging)
+            ).fetchone()[0]
+            conn.execute(f"""
+                INSERT INTO refresh_attendance_months
+                SELECT DISTINCT CAST(date_trunc('month', att_date) AS DATE) FROM {staging}
+            """)
+            _check_resolved(conn, staging, loaded)
+            stats["attendance_rows"] = loaded
+
+        refresh_summaries(conn)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    stats["months_refreshed"] = conn.execute("""
+        SELECT COUNT(*) FROM (
+            SELECT year_month FROM refresh_payroll_months
+            UNION SELECT year_month FROM refresh_attendance_months
+        )
+    """).fetchone()[0]
+    return stats
+
+
+class SummaryCache:
+    """Serves the benchmark analytics from memory.
+
+    Results are read from the marts on first use and kept until the next
+    `load_increment()` through this cache, so repeated reads are a dict lookup.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        self.conn = conn
+        self._results: Dict[str, List[tuple]] = {}
+
+    def _get(self, name: str) -> List[tuple]:
+        if name not in self._results:
+            self._results[name] = self.conn.execute(MART_QUERIES[name]).fetchall()
+        return self._results[name]
+
+    def invalidate(self) -> None:
+        self._results.clear()
+
+    def load_increment(
+        self, payroll_csv: Optional[str] = None, attendance_csv: Optional[str] = None
+    ) -> Dict[str, int]:
+        stats = load_increment(self.conn, payroll_csv, attendance_csv)
+        self.invalidate()
+        return stats
+
+    def department_payroll_per_year(self) -> List[tuple]:
+        """(department, year, total_payroll) ordered by year, payroll desc."""
+        return self._get("department_payroll_per_year")
+
+    def attendance_pct_per_department(self) -> List[tuple]:
+        """(department, attendance_pct) ordered by attendance_pct desc."""
+        return self._get("attendance_pct_per_department")
+
+    def top_lifetime_salary(self) -> List[tuple]:
+        """Top 20 (employee_id, full_name, lifetime_salary)."""
+        return self._get("top_lifetime_salary")
+
+    def department_payroll_yoy(self) -> List[tuple]:
+        """(department, year, total_payroll, yoy_growth) by department, year."""
+        return self._get("department_payroll_yoy")
@@ -0,0 +1,70 @@
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from main import create_tables  # noqa: E402
+
+MASTER_DATA = """
+INSERT INTO department VALUES (1, 'Sales'), (2, 'HR');
+INSERT INTO salary_structure VALUES (1, 'JUNIOR', 20, 30, 10), (2, 'SENIOR', 30, 40, 20);
+INSERT INTO designation VALUES (1, 'Sales Executive', 1), (2, 'HR Manager', 2);
+INSERT INTO employee VALUES
+    (1, 'Asha', 1, 1, 1000, '2022-06-01', NULL),
+    (2, 'Ravi', 2, 2, 2000, '2022-01-10', NULL),
+    (3, 'Meera', 1, 2, 4000, '2023-03-01', NULL);
+"""
+
+
+def payroll_row(payroll_id: int, employee_id: int, year_month: str, net: float):
+    """A payroll_monthly row whose gross is net + 100 and deductions 100."""
+
+    return (
+        payroll_id,
+        employee_id,
+        year_month,
+        net,
+        0,
+        0,
+        0,
+        net + 100,
+        100,
+        0,
+        0,
+        net,
+    )
+
+
+# employees 1 and 2, January to March 2023; employee 3 has no facts yet
+BASE_PAYROLL = [
+    payroll_row(1, 1, "2023-01-01", 1000),
+    payroll_row(2, 2, "2023-01-01", 2000),
+    payroll_row(3, 1, "2023-02-01", 1000),
+    payroll_row(4, 2, "2023-02-01", 2500),
+    payroll_row(5, 1, "2023-03-01", 1500),
+    payroll_row(6, 2, "2022-12-01", 1800),
+]
+BASE_ATTENDANCE = [
+    (1, 1, "2023-01-02", "P"),
+    (2, 1, "2023-01-03", "A"),
+    (3, 2, "2023-01-02", "P"),
+    (4, 2, "2023-02-01", "P"),
+    (5, 1, "2023-03-01", "L"),
+]
+
+
+def insert_rows(conn, table: str, rows) -> None:
+    placeholders = ", ".join("?" * len(rows[0]))
+    conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+
+
+@pytest.fixture
+def warehouse():
+    """In-memory warehouse with a few raw rows, before any transform."""
+
+    conn = duckdb.connect()
+    create_tables(conn)
+    conn.execute(MASTER_DATA)
+    insert_rows(conn, "payroll_monthly", BASE_PAYROLL)
+    insert_rows(conn, "attendance", BASE_ATTENDANCE)
+    yield conn
+    conn.close()
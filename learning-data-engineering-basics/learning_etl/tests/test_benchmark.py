@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+duckdb = pytest.importorskip("duckdb")
+
+from benchmark import (  # noqa: E402
+    DuckDBRunner,
+    measure,
+    peak_rss_during,
+    run_catalogue,
+    write_report,
+)
+
+CATALOGUE = {
+    "all_rows": "SELECT * FROM payroll",
+    "total_per_year": "SELECT year, SUM(amount) FROM payroll GROUP BY year",
+}
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """Read-only runner over a small warehouse file."""
+
+    # rows_scanned writes its profile next to the working directory
+    monkeypatch.chdir(tmp_path)
+    database = str(tmp_path / "warehouse.duckdb")
+    with duckdb.connect(database) as conn:
+        conn.execute(
+            "CREATE TABLE payroll AS SELECT i AS id, 2020 + i % 3 AS year, "
+            "i * 10 AS amount FROM range(1000) t(i)"
+        )
+    runner = DuckDBRunner(database)
+    yield runner
+    runner.close()
+
+
+class TestPeakRss:
+    def test_sees_native_allocations(self) -> None:
+        """Memory allocated outside the Python heap still moves the peak."""
+
+        conn = duckdb.connect()
+        before, peak = peak_rss_during(
+            lambda: conn.execute("SELECT list(i) FROM range(5000000) t(i)").fetchall()
+        )
+        conn.close()
+
+        assert peak - before > 10 * 1024 * 1024
+
+
+class TestMeasure:
+    def test_reports_timings_rows_and_memory(self, runner) -> None:
+        result = measure(runner.fetch_all, CATALOGUE["all_rows"], warmup=1, runs=3)
+
+        assert result["runs"] == 3
+        assert result["rows_returned"] == 1000
+        assert result["min_ms"] <= result["median_ms"] <= result["max_ms"]
+        assert result["peak_rss_mb"] > 0
+        assert result["rss_growth_mb"] >= 0
+
+
+class TestRunCatalogue:
+    def test_report_covers_every_query(self, runner, tmp_path) -> None:
+        results = run_catalogue(runner, CATALOGUE, warmup=0, runs=2)
+        path = tmp_path / "report.json"
+        write_report(results, str(path), {"runs": 2})
+
+        report = json.loads(path.read_text())
+        assert [r["query"] for r in report["results"]] == sorted(CATALOGUE)
+        by_query = {r["query"]: r for r in report["results"]}
+        assert by_query["all_rows"]["rows_scanned"] == 1000
+        assert by_query["total_per_year"]["rows_returned"] == 3
+        assert report["config"] == {"runs": 2}
@@ -0,0 +1,28 @@
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+duckdb = pytest.importorskip("duckdb")
+
+import main  # noqa: E402
+from object_cache import ObjectCache  # noqa: E402
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    """In-process S3 stand-in for the MinIO service, used by main."""
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=main.LAKE_BUCKET)
+        monkeypatch.setattr(main, "get_s3_client", lambda: client)
+        yield client
+
+
+class TestLoadDataFromLake:
+    def test_missing_table_names_the_prefix(self, s3_client, tmp_path) -> None:
+        conn = duckdb.connect()
+        main.create_tables(conn)
+
+        with pytest.raises(ValueError, match="s3://processed-data/department/"):
+            main.load_data_from_lake(conn, cache=ObjectCache(str(tmp_path)))
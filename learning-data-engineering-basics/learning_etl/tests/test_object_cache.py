@@ -0,0 +1,130 @@
+import itertools
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+import object_cache  # noqa: E402
+from object_cache import ObjectCache  # noqa: E402
+
+BUCKET = "processed"
+
+
+@pytest.fixture
+def s3_client():
+    """In-process S3 stand-in for the MinIO service."""
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def ticking_clock(monkeypatch):
+    """Strictly increasing access times, so LRU order never ties."""
+
+    ticks = itertools.count(1)
+    monkeypatch.setattr(object_cache.time, "time", lambda: float(next(ticks)))
+
+
+def put(client, key: str, body: bytes) -> None:
+    client.put_object(Bucket=BUCKET, Key=key, Body=body)
+
+
+class TestFetch:
+    def test_unchanged_object_is_a_hit(self, s3_client, tmp_path) -> None:
+        put(s3_client, "payroll/part-0.parquet", b"x" * 100)
+        cache = ObjectCache(str(tmp_path))
+
+        first = cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+        second = cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+
+        assert first == second
+        assert first.read_bytes() == b"x" * 100
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 1
+        assert cache.stats["bytes_downloaded"] == 100
+        assert cache.stats["bytes_saved"] == 100
+
+    def test_rewritten_object_is_a_miss(self, s3_client, tmp_path) -> None:
+        put(s3_client, "payroll/part-0.parquet", b"old")
+        cache = ObjectCache(str(tmp_path))
+        old = cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+
+        put(s3_client, "payroll/part-0.parquet", b"new contents")
+        new = cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+
+        assert new != old
+        assert new.read_bytes() == b"new contents"
+        assert cache.stats["misses"] == 2
+        assert cache.stats["hits"] == 0
+
+    def test_index_survives_a_new_instance(self, s3_client, tmp_path) -> None:
+        put(s3_client, "payroll/part-0.parquet", b"x" * 10)
+        ObjectCache(str(tmp_path)).fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+
+        cache = ObjectCache(str(tmp_path))
+        cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet")
+
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 0
+
+    def test_deleted_cache_file_is_downloaded_again(self, s3_client, tmp_path) -> None:
+        put(s3_client, "payroll/part-0.parquet", b"x" * 10)
+        path = ObjectCache(str(tmp_path)).fetch(
+            s3_client, BUCKET, "payroll/part-0.parquet"
+        )
+        path.unlink()
+
+        cache = ObjectCache(str(tmp_path))
+        assert cache.fetch(s3_client, BUCKET, "payroll/part-0.parquet").exists()
+        assert cache.stats["misses"] == 1
+
+
+class TestEviction:
+    def test_least_recently_used_goes_first(self, s3_client, tmp_path) -> None:
+        for name in "abc":
+            put(s3_client, f"{name}.parquet", b"x" * 100)
+        cache = ObjectCache(str(tmp_path), max_bytes=200)
+
+        a = cache.fetch(s3_client, BUCKET, "a.parquet")
+        b = cache.fetch(s3_client, BUCKET, "b.parquet")
+        cache.fetch(s3_client, BUCKET, "a.parquet")
+        c = cache.fetch(s3_client, BUCKET, "c.parquet")
+
+        assert a.exists() and c.exists()
+        assert not b.exists()
+        assert cache.stats["evictions"] == 1
+        assert cache.size_bytes == 200
+
+    def test_entries_being_read_are_kept_over_the_bound(
+        self, s3_client, tmp_path
+    ) -> None:
+        for name in "abc":
+            put(s3_client, f"daily/{name}.parquet", b"x" * 100)
+        cache = ObjectCache(str(tmp_path), max_bytes=150)
+
+        paths = cache.sync_prefix(s3_client, BUCKET, "daily/")
+
+        assert len(paths) == 3
+        assert all(path.exists() for path in paths)
+        assert cache.stats["evictions"] == 0
+        assert cache.size_bytes == 300
+
+
+class TestSyncPrefix:
+    def test_listing_etags_give_hits_without_download(
+        self, s3_client, tmp_path
+    ) -> None:
+        for name in "ab":
+            put(s3_client, f"daily/{name}.parquet", b"x" * 50)
+        cache = ObjectCache(str(tmp_path))
+        cache.sync_prefix(s3_client, BUCKET, "daily/")
+
+        cache.sync_prefix(s3_client, BUCKET, "daily/")
+
+        assert cache.stats["misses"] == 2
+        assert cache.stats["hits"] == 2
+        assert cache.stats["bytes_saved"] == 100
@@ -0,0 +1,147 @@
+import csv
+
+import pytest
+
+from summary_cache import SummaryCache, load_increment
+from tests.conftest import payroll_row
+from transform import MART_QUERIES, run_transform
+
+MART_TABLES = [
+    "mart_department_payroll_monthly",
+    "mart_department_attendance_monthly",
+    "mart_employee_lifetime_salary",
+    "mart_department_payroll_yearly",
+]
+PAYROLL_HEADER = [
+    "payroll_id",
+    "employee_id",
+    "year_month",
+    "base_salary",
+    "hra_amount",
+    "da_amount",
+    "allowance_amt",
+    "gross_salary",
+    "pf_deduction",
+    "tax_deduction",
+    "prof_tax",
+    "net_salary",
+]
+ATTENDANCE_HEADER = ["attendance_id", "employee_id", "att_date", "status"]
+
+# an existing month (March) and a new one (April); employee 3 is new to payroll
+INCREMENT_PAYROLL = [
+    payroll_row(7, 3, "2023-03-01", 4000),
+    payroll_row(8, 1, "2023-04-01", 1500),
+    payroll_row(9, 3, "2023-04-01", 4200),
+]
+INCREMENT_ATTENDANCE = [
+    (6, 3, "2023-03-02", "P"),
+    (7, 2, "2023-03-02", "A"),
+    (8, 1, "2023-04-03", "P"),
+    (9, 3, "2023-04-03", "P"),
+]
+
+
+def write_csv(path, header, rows) -> str:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return str(path)
+
+
+def snapshot(conn):
+    """Every mart, row-sorted, plus the four analytics."""
+
+    marts = {
+        table: sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+        for table in MART_TABLES
+    }
+    analytics = {
+        name: conn.execute(query).fetchall() for name, query in MART_QUERIES.items()
+    }
+    return marts, analytics
+
+
+@pytest.fixture
+def increment(tmp_path):
+    return (
+        write_csv(tmp_path / "payroll.csv", PAYROLL_HEADER, INCREMENT_PAYROLL),
+        write_csv(tmp_path / "attendance.csv", ATTENDANCE_HEADER, INCREMENT_ATTENDANCE),
+    )
+
+
+class TestLoadIncrement:
+    def test_matches_a_full_rebuild(self, warehouse, increment) -> None:
+        run_transform(warehouse)
+
+        stats = load_increment(warehouse, *increment)
+        incremental = snapshot(warehouse)
+        run_transform(warehouse)
+
+        assert stats == {
+            "payroll_rows": 3,
+            "attendance_rows": 4,
+            "months_refreshed": 2,
+        }
+        assert incremental == snapshot(warehouse)
+
+    def test_untouched_months_are_not_rewritten(self, warehouse, increment) -> None:
+        """Only the increment's months are deleted and re-inserted."""
+
+        run_transform(warehouse)
+        # mark January; a refresh of it would replace the marker
+        warehouse.execute("""
+            UPDATE mart_department_payroll_monthly SET employee_count = -1
+            WHERE year_month = DATE '2023-01-01'
+        """)
+
+        load_increment(warehouse, *increment)
+
+        counts = warehouse.execute("""
+            SELECT year_month, MIN(employee_count)
+            FROM mart_department_payroll_monthly
+            GROUP BY year_month ORDER BY year_month
+        """).fetchall()
+        # January keeps its marker; March and April are rebuilt with employee 3
+        assert [count for _, count in counts] == [1, -1, 1, 2, 2]
+
+    def test_unknown_employee_rolls_back(self, warehouse, tmp_path) -> None:
+        run_transform(warehouse)
+        before = snapshot(warehouse)
+        payroll_csv = write_csv(
+            tmp_path / "payroll.csv",
+            PAYROLL_HEADER,
+            [payroll_row(7, 1, "2023-04-01", 1), payroll_row(8, 42, "2023-04-01", 1)],
+        )
+
+        with pytest.raises(ValueError, match="unknown employees"):
+            load_increment(warehouse, payroll_csv=payroll_csv)
+
+        assert snapshot(warehouse) == before
+        assert warehouse.execute("SELECT COUNT(*) FROM payroll_monthly").fetchone() == (
+            6,
+        )
+
+
+class TestSummaryCache:
+    def test_serves_from_memory_until_the_next_increment(
+        self, warehouse, increment
+    ) -> None:
+        run_transform(warehouse)
+        cache = SummaryCache(warehouse)
+
+        first = cache.top_lifetime_salary()
+        # served from memory: a change behind the cache's back is not seen
+        warehouse.execute("DELETE FROM mart_employee_lifetime_salary")
+        assert cache.top_lifetime_salary() == first
+
+        cache.load_increment(*increment)
+
+        top = cache.top_lifetime_salary()
+        assert top[0] == (3, "Meera", 8200.0)
+        assert [row[0] for row in top] == [3, 1]
+        assert (
+            cache.department_payroll_per_year()
+            == warehouse.execute(MART_QUERIES["department_payroll_per_year"]).fetchall()
+        )
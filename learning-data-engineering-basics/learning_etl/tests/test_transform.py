@@ -0,0 +1,100 @@
+from datetime import date
+
+import pytest
+
+from benchmark import QUERY_CATALOGUE
+from transform import MART_QUERIES, run_transform
+
+
+@pytest.fixture
+def star(warehouse):
+    """The fixture warehouse after the full transform."""
+
+    run_transform(warehouse)
+    return warehouse
+
+
+def rows(conn, query: str):
+    return conn.execute(query).fetchall()
+
+
+class TestDimensions:
+    def test_dim_date_covers_whole_years_of_the_data(self, star) -> None:
+        # employee 2 joined in 2022, the latest row is from 2023
+        assert rows(
+            star, "SELECT MIN(full_date), MAX(full_date), COUNT(*) FROM dim_date"
+        ) == [(date(2022, 1, 1), date(2023, 12, 31), 730)]
+        assert rows(
+            star,
+            "SELECT date_key, year_month, is_weekend FROM dim_date "
+            "WHERE full_date = DATE '2023-03-04'",
+        ) == [(20230304, date(2023, 3, 1), True)]
+
+    def test_dim_employee_resolves_department_and_designation(self, star) -> None:
+        query = """
+            SELECT de.employee_id, dd.department_name, dg.title, dg.structure_code
+            FROM dim_employee de
+            JOIN dim_department dd ON de.department_key = dd.department_key
+            JOIN dim_designation dg ON de.designation_key = dg.designation_key
+            ORDER BY de.employee_id
+        """
+        employees = rows(star, query)
+
+        assert employees == [
+            (1, "Sales", "Sales Executive", "JUNIOR"),
+            (2, "HR", "HR Manager", "SENIOR"),
+            (3, "Sales", "HR Manager", "SENIOR"),
+        ]
+
+
+class TestFacts:
+    def test_every_raw_row_becomes_a_fact(self, star) -> None:
+        assert rows(star, "SELECT COUNT(*) FROM fact_payroll") == rows(
+            star, "SELECT COUNT(*) FROM payroll_monthly"
+        )
+        assert rows(star, "SELECT COUNT(*) FROM fact_attendance") == rows(
+            star, "SELECT COUNT(*) FROM attendance"
+        )
+
+    def test_facts_join_every_dimension(self, star) -> None:
+        query = """
+            SELECT COUNT(*) FROM fact_payroll f
+            JOIN dim_date dt ON f.date_key = dt.date_key
+            JOIN dim_employee de ON f.employee_key = de.employee_key
+            JOIN dim_department dd ON f.department_key = dd.department_key
+        """
+        joined = rows(star, query)
+
+        assert joined == rows(star, "SELECT COUNT(*) FROM fact_payroll")
+
+
+class TestMarts:
+    @pytest.mark.parametrize("name", sorted(MART_QUERIES))
+    def test_mart_matches_the_raw_query(self, star, name) -> None:
+        """Each analytic gives the same figures from the marts as from raw."""
+
+        assert sorted(rows(star, MART_QUERIES[name])) == sorted(
+            rows(star, QUERY_CATALOGUE[name])
+        )
+
+    def test_yoy_growth(self, star) -> None:
+        assert rows(star, MART_QUERIES["department_payroll_yoy"]) == [
+            ("HR", 2022, 1800.0, None),
+            ("HR", 2023, 4500.0, 2700.0),
+            ("Sales", 2023, 3500.0, None),
+        ]
+
+    def test_monthly_attendance_counts_present_days(self, star) -> None:
+        query = """
+            SELECT department_name, year_month, present_days, total_days
+            FROM mart_department_attendance_monthly
+            ORDER BY department_name, year_month
+        """
+        monthly = rows(star, query)
+
+        assert monthly == [
+            ("HR", date(2023, 1, 1), 1, 1),
+            ("HR", date(2023, 2, 1), 1, 1),
+            ("Sales", date(2023, 1, 1), 1, 2),
+            ("Sales", date(2023, 3, 1), 0, 1),
+        ]
@@ -0,0 +1,294 @@
+"""Star-schema transform stage for the DuckDB warehouse.
+
+Runs after `main.load_data()` and reshapes the OLTP-style tables into:
+- dim_date, dim_department, dim_designation, dim_employee
+- fact_payroll, fact_attendance keyed by surrogate keys
+- monthly/yearly aggregate marts the analytic queries can read directly
+"""
+
+import duckdb
+
+
+def build_dim_date(conn: duckdb.DuckDBPyConnection) -> None:
+    """Build a calendar dimension covering every year present in the data.
+
+    date_key is the YYYYMMDD integer so facts can be joined (or filtered)
+    without a lookup.
+    """
+
+    conn.execute("DROP TABLE IF EXISTS dim_date")
+    conn.execute("""
+        CREATE TABLE dim_date AS
+        WITH bounds AS (
+            SELECT
+                MIN(d) AS min_date,
+                MAX(d) AS max_date
+            FROM (
+                SELECT MIN(join_date) AS d FROM employee
+                UNION ALL SELECT MAX(COALESCE(exit_date, join_date)) FROM employee
+                UNION ALL SELECT MIN(att_date) FROM attendance
+                UNION ALL SELECT MAX(att_date) FROM attendance
+                UNION ALL SELECT MIN(year_month) FROM payroll_monthly
+                UNION ALL SELECT MAX(year_month) FROM payroll_monthly
+            )
+        ),
+        days AS (
+            SELECT CAST(generate_series AS DATE) AS full_date
+            FROM bounds,
+                generate_series(
+                    CAST(make_date(year(min_date), 1, 1) AS TIMESTAMP),
+                    CAST(make_date(year(max_date), 12, 31) AS TIMESTAMP),
+                    INTERVAL 1 DAY
+                )
+        )
+        SELECT
+            CAST(strftime(full_date, '%Y%m%d') AS INTEGER) AS date_key,
+            full_date,
+            year(full_date) AS year,
+            quarter(full_date) AS quarter,
+            month(full_date) AS month,
+            monthname(full_date) AS month_name,
+            day(full_date) AS day,
+            isodow(full_date) AS day_of_week,
+            dayname(full_date) AS day_name,
+            weekofyear(full_date) AS week_of_year,
+            isodow(full_date) >= 6 AS is_weekend,
+            CAST(date_trunc('month', full_date) AS DATE) AS year_month
+        FROM days
+        ORDER BY full_date;
+    """)
+
+
+def build_dimensions(conn: duckdb.DuckDBPyConnection) -> None:
+    """Build department, designation and employee dimensions."""
+
+    conn.execute("DROP TABLE IF EXISTS dim_employee")
+    conn.execute("DROP TABLE IF EXISTS dim_designation")
+    conn.execute("DROP TABLE IF EXISTS dim_department")
+
+    conn.execute("""
+        CREATE TABLE dim_department AS
+        SELECT
+            CAST(ROW_NUMBER() OVER (ORDER BY department_id) AS INTEGER) AS department_key,
+            department_id,
+            name AS department_name
+        FROM department;
+    """)
+
+    # designation is denormalised with its salary structure
+    conn.execute("""
+        CREATE TABLE dim_designation AS
+        SELECT
+            CAST(ROW_NUMBER() OVER (ORDER BY d.designation_id) AS INTEGER) AS designation_key,
+            d.designation_id,
+            d.title,
+            s.code AS structure_code,
+            s.hra_pct,
+            s.da_pct,
+            s.allowance_pct
+        FROM designation d
+        LEFT JOIN salary_structure s ON d.structure_id = s.structure_id;
+    """)
+
+    conn.execute("""
+        CREATE TABLE dim_employee AS
+        SELECT
+            CAST(ROW_NUMBER() OVER (ORDER BY e.employee_id) AS INTEGER) AS employee_key,
+            e.employee_id,
+            e.full_name,
+            dd.department_key,
+            dg.designation_key,
+            e.base_salary,
+            e.join_date,
+            e.exit_date,
+            e.exit_date IS NULL AS is_active
+        FROM employee e
+        LEFT JOIN dim_department dd ON e.department_id = dd.department_id
+        LEFT JOIN dim_designation dg ON e.designation_id = dg.designation_id;
+    """)
+
+
+# Source-table parameterised so incremental loads can reuse the same mapping.
+FACT_PAYROLL_SELECT = """
+    SELECT
+        p.payroll_id,
+        de.employee_key,
+        de.department_key,
+        de.designation_key,
+        CAST(strftime(p.year_month, '%Y%m%d') AS INTEGER) AS date_key,
+        p.base_salary,
+        p.hra_amount,
+        p.da_amount,
+        p.allowance_amt,
+        p.gross_salary,
+        p.pf_deduction,
+        p.tax_deduction,
+        p.prof_tax,
+        p.net_salary
+    FROM {source} p
+    JOIN dim_employee de ON p.employee_id = de.employee_id
+"""
+
+FACT_ATTENDANCE_SELECT = """
+    SELECT
+        a.attendance_id,
+        de.employee_key,
+        de.department_key,
+        CAST(strftime(a.att_date, '%Y%m%d') AS INTEGER) AS date_key,
+        a.status,
+        a.status = 'P' AS is_present
+    FROM {source} a
+    JOIN dim_employee de ON a.employee_id = de.employee_id
+"""
+
+
+def build_facts(conn: duckdb.DuckDBPyConnection) -> None:
+    """Build payroll and attendance facts keyed by surrogate keys."""
+
+    conn.execute("DROP TABLE IF EXISTS fact_payroll")
+    conn.execute("DROP TABLE IF EXISTS fact_attendance")
+
+    conn.execute(
+        "CREATE TABLE fact_payroll AS "
+        + FACT_PAYROLL_SELECT.format(source="payroll_monthly")
+        + " ORDER BY date_key, employee_key"
+    )
+    conn.execute(
+        "CREATE TABLE fact_attendance AS "
+        + FACT_ATTENDANCE_SELECT.format(source="attendance")
+        + " ORDER BY date_key, employee_key"
+    )
+
+
+# Monthly marts are the unit of refresh, yearly marts are rolled up from them.
+MART_DEPARTMENT_PAYROLL_MONTHLY_SELECT = """
+    SELECT
+        f.department_key,
+        dd.department_name,
+        dt.year_month,
+        dt.year,
+        dt.month,
+        COUNT(DISTINCT f.employee_key) AS employee_count,
+        SUM(f.gross_salary) AS total_gross,
+        SUM(f.net_salary) AS total_payroll
+    FROM fact_payroll f
+    JOIN dim_date dt ON f.date_key = dt.date_key
+    JOIN dim_department dd ON f.department_key = dd.department_key
+    {where}
+    GROUP BY f.department_key, dd.department_name, dt.year_month, dt.year, dt.month
+"""
+
+MART_DEPARTMENT_ATTENDANCE_MONTHLY_SELECT = """
+    SELECT
+        f.department_key,
+        dd.department_name,
+        dt.year_month,
+        COUNT(*) FILTER (WHERE f.is_present) AS present_days,
+        COUNT(*) AS total_days
+    FROM fact_attendance f
+    JOIN dim_date dt ON f.date_key = dt.date_key
+    JOIN dim_department dd ON f.department_key = dd.department_key
+    {where}
+    GROUP BY f.department_key, dd.department_name, dt.year_month
+"""
+
+MART_EMPLOYEE_LIFETIME_SALARY_SELECT = """
+    SELECT
+        de.employee_key,
+        de.employee_id,
+        de.full_name,
+        COUNT(*) AS months_paid,
+        SUM(f.net_salary) AS lifetime_salary
+    FROM fact_payroll f
+    JOIN dim_employee de ON f.employee_key = de.employee_key
+    {where}
+    GROUP BY de.employee_key, de.employee_id, de.full_name
+"""
+
+MART_DEPARTMENT_PAYROLL_YEARLY_SELECT = """
+    WITH yearly AS (
+        SELECT
+            department_key,
+            department_name,
+            year,
+            SUM(total_gross) AS total_gross,
+            SUM(total_payroll) AS total_payroll
+        FROM mart_department_payroll_monthly
+        GROUP BY department_key, department_name, year
+    )
+    SELECT
+        *,
+        total_payroll
+            - LAG(total_payroll) OVER (PARTITION BY department_key ORDER BY year)
+            AS yoy_growth
+    FROM yearly
+"""
+
+
+def build_yearly_mart(conn: duckdb.DuckDBPyConnection) -> None:
+    """(Re)build the yearly payroll mart from the monthly mart.
+
+    This is at most departments x years rows, so it is always rebuilt whole.
+    """
+
+    conn.execute(
+        "CREATE OR REPLACE TABLE mart_department_payroll_yearly AS "
+        + MART_DEPARTMENT_PAYROLL_YEARLY_SELECT
+        + " ORDER BY department_key, year"
+    )
+
+
+def build_marts(conn: duckdb.DuckDBPyConnection) -> None:
+    """Build the monthly/yearly aggregate marts from the facts."""
+
+    conn.execute(
+        "CREATE OR REPLACE TABLE mart_department_payroll_monthly AS "
+        + MART_DEPARTMENT_PAYROLL_MONTHLY_SELECT.format(where="")
+    )
+    conn.execute(
+        "CREATE OR REPLACE TABLE mart_department_attendance_monthly AS "
+        + MART_DEPARTMENT_ATTENDANCE_MONTHLY_SELECT.format(where="")
+    )
+    conn.execute(
+        "CREATE OR REPLACE TABLE mart_employee_lifetime_salary AS "
+        + MART_EMPLOYEE_LIFETIME_SALARY_SELECT.format(where="")
+    )
+    build_yearly_mart(conn)
+
+
+# The four timming.ipynb analytics rewritten against the marts.
+MART_QUERIES = {
+    "department_payroll_per_year": """
+        SELECT department_name AS department, year, total_payroll
+        FROM mart_department_payroll_yearly
+        ORDER BY year, total_payroll DESC;
+    """,
+    "attendance_pct_per_department": """
+        SELECT
+            department_name AS department,
+            SUM(present_days) * 100.0 / SUM(total_days) AS attendance_pct
+        FROM mart_department_attendance_monthly
+        GROUP BY department_name
+        ORDER BY attendance_pct DESC;
+    """,
+    "top_lifetime_salary": """
+        SELECT employee_id, full_name, lifetime_salary
+        FROM mart_employee_lifetime_salary
+        ORDER BY lifetime_salary DESC
+        LIMIT 20;
+    """,
+    "department_payroll_yoy": """
+        SELECT department_name AS department, year, total_payroll, yoy_growth
+        FROM mart_department_payroll_yearly
+        ORDER BY department, year;
+    """,
+}
+
+
+def run_transform(conn: duckdb.DuckDBPyConnection) -> None:
+    """Run the full transform stage: dimensions, facts, then marts."""
+
+    build_dim_date(conn)
+    build_dimensions(conn)
+    build_facts(conn)
+    build_marts(conn)
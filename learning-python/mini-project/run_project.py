@@ -6,5 +6,9 @@ if __name__ == "__main__":
 
     if dev_option:
         dev_entrypoints()
+    elif len(sys.argv) > 1:
+        from src.cli.commands import run_command
+
+        sys.exit(run_command(sys.argv[1:]))
     else:
         main()
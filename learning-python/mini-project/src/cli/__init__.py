@@ -1 +1,7 @@
-from .main_menu import MainMenu
+def __getattr__(name: str):
+    # resolve MainMenu on first use rather than when src.cli is imported
+    if name == "MainMenu":
+        from .main_menu import MainMenu
+
+        return MainMenu
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -71,11 +71,31 @@ class AddRecordMenu:
                 "Description cannot be empty. Enter description: "
             ).strip()
 
+        # Get currency (optional)
+        supported_currencies = self.config.supported_currencies
+        preferred = self.transaction_service.preferred_currency
+        currency = (
+            input(
+                f"Enter currency ({', '.join(supported_currencies)}) "
+                f"or press Enter for {preferred}: "
+            )
+            .strip()
+            .upper()
+        )
+        while currency and currency not in supported_currencies:
+            currency = (
+                input(f"Unsupported currency. Choose from {supported_currencies}: ")
+                .strip()
+                .upper()
+            )
+
         # Get date (optional)
         date = input("Enter date (YYYY-MM-DD) or press Enter for today: ").strip()
         if not date:
             date = None
 
         # Add transaction
-        self.transaction_service.add_transaction(amount, category, description, date)
+        self.transaction_service.add_transaction(
+            amount, category, description, date, currency or None
+        )
         print("Transaction added successfully!")
@@ -0,0 +1,188 @@
+"""Non-interactive subcommands for scripting the expense tracker.
+
+    python run_project.py add --amount 120 --category FOOD --description Lunch
+    python run_project.py bulk-add < transactions.jsonl
+    python run_project.py summary --currency USD --json
+    python run_project.py export --output data/exported_transactions.csv
+    python run_project.py import data/exported_transactions.csv --mode merge
+
+All subcommands share one TransactionService; bulk-add validates every
+record first and stores them with a single write.
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import IO, List, Optional, Tuple
+
+from src.services.currency_converter import get_currency_converter
+from src.services.transaction_service import IMPORT_MODES, TransactionService
+from src.storage.csv_handler import MAX_REPORTED_ERRORS, NumberedRow, validate_rows
+
+DEFAULT_EXPORT_PATH = (
+    Path(__file__).parent.parent.parent / "data" / "exported_transactions.csv"
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser with one subparser per command."""
+
+    parser = argparse.ArgumentParser(
+        prog="run_project.py", description="Expense Tracker batch commands"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add = subparsers.add_parser("add", help="add one transaction")
+    add.add_argument("--amount", type=float, required=True)
+    add.add_argument("--category", required=True)
+    add.add_argument("--description", required=True)
+    add.add_argument("--date", help="YYYY-MM-DD (default: today)")
+    add.add_argument("--currency", help="default: preferred currency")
+
+    bulk_add = subparsers.add_parser(
+        "bulk-add", help="add JSON-lines transactions from a file or stdin"
+    )
+    bulk_add.add_argument("input", nargs="?", default="-", help="file or - (stdin)")
+
+    summary = subparsers.add_parser("summary", help="print the summary")
+    summary.add_argument("--currency", help="report in this currency")
+    summary.add_argument("--json", action="store_true", help="print JSON")
+
+    export = subparsers.add_parser("export", help="export transactions to CSV")
+    export.add_argument("--output", type=Path, default=DEFAULT_EXPORT_PATH)
+
+    import_ = subparsers.add_parser("import", help="import transactions from CSV")
+    import_.add_argument("input", type=Path)
+    import_.add_argument("--mode", choices=IMPORT_MODES, default="merge")
+
+    return parser
+
+
+def add_command(service: TransactionService, args: argparse.Namespace) -> int:
+    record = {
+        "amount": args.amount,
+        "category": args.category,
+        "description": args.description,
+        "date": args.date or datetime.now().strftime("%Y-%m-%d"),
+        "currency": args.currency,
+    }
+    valid, errors = validate_rows([(1, record)], get_currency_converter().currencies)
+    if errors:
+        print(f"Invalid transaction: {errors[0].split(': ', 1)[1]}", file=sys.stderr)
+        return 1
+    (transaction,) = service.add_transactions(valid)
+    print(f"Added transaction {transaction['id']}")
+    return 0
+
+
+def read_json_lines(stream: IO[str]) -> Tuple[List[NumberedRow], List[str]]:
+    """Parses JSON-lines records; returns (numbered records, errors)."""
+
+    records, errors = [], []
+    for line_num, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            errors.append(f"line {line_num}: {e.msg}")
+            continue
+        if not isinstance(record, dict):
+            errors.append(f"line {line_num}: expected a JSON object")
+            continue
+        record.setdefault("date", datetime.now().strftime("%Y-%m-%d"))
+        # ids are always assigned by the store on bulk-add
+        record.pop("id", None)
+        records.append((line_num, record))
+    return records, errors
+
+
+def bulk_add_command(service: TransactionService, args: argparse.Namespace) -> int:
+    start = time.perf_counter()
+    if args.input == "-":
+        records, errors = read_json_lines(sys.stdin)
+    else:
+        with open(args.input, "r") as f:
+            records, errors = read_json_lines(f)
+
+    valid, invalid = validate_rows(records, get_currency_converter().currencies)
+    errors.extend(invalid)
+    added = service.add_transactions(valid)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"Added {len(added)} transactions in {elapsed:.2f}s "
+        f"({len(added) / elapsed if elapsed else 0:,.0f} rows/sec)"
+    )
+    for error in errors[:MAX_REPORTED_ERRORS]:
+        print(f"  {error}", file=sys.stderr)
+    if errors:
+        print(f"Skipped {len(errors)} invalid records", file=sys.stderr)
+        return 1
+    return 0
+
+
+def summary_command(service: TransactionService, args: argparse.Namespace) -> int:
+    summary = service.get_summary(currency=args.currency)
+    if args.json:
+        print(json.dumps(summary, indent=2, sort_keys=True))
+        return 0
+
+    currency = f" {args.currency}" if args.currency else ""
+    print(f"Total Transactions: {summary['count']}")
+    print(f"Total Amount: {summary['total']:.2f}{currency}")
+    for dimension in ("by_category", "by_month", "by_currency"):
+        print(f"\n{dimension.replace('_', ' ').title()}:")
+        for key, amount in sorted(summary[dimension].items()):
+            print(f"  {key:<15}: {amount:.2f}")
+    return 0
+
+
+def export_command(service: TransactionService, args: argparse.Namespace) -> int:
+    written = service.export_csv(args.output)
+    print(f"Exported {written} transactions to {args.output}")
+    return 0
+
+
+def import_command(service: TransactionService, args: argparse.Namespace) -> int:
+    report = service.import_csv(args.input, mode=args.mode)
+    print(
+        f"Imported {report.imported} of {report.rows_read} rows "
+        f"({report.duplicates} duplicates, {report.invalid} invalid) "
+        f"in {report.seconds:.2f}s ({report.rows_per_sec:,.0f} rows/sec)."
+    )
+    for error in report.errors:
+        print(f"  {error}", file=sys.stderr)
+    return 1 if report.invalid else 0
+
+
+COMMANDS = {
+    "add": add_command,
+    "bulk-add": bulk_add_command,
+    "summary": summary_command,
+    "export": export_command,
+    "import": import_command,
+}
+
+
+def run_command(argv: List[str], service: Optional[TransactionService] = None) -> int:
+    """Parses argv and runs one subcommand.
+
+    Args:
+        argv (list): Arguments after the program name.
+        service (TransactionService, optional): Shared service to use.
+
+    Returns:
+        int: Process exit code.
+    """
+
+    args = build_parser().parse_args(argv)
+    service = service or TransactionService()
+    try:
+        return COMMANDS[args.command](service, args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
@@ -1,15 +1,14 @@
+from src.services.currency_converter import get_currency_converter
 from src.utils.config import Config
 
 
 class CurrencyConvertorMenu:
     """Menu for currency conversion."""
 
-    # Simple exchange rates (in real app, use API)
-    EXCHANGE_RATES = {"USD": 1.0, "EUR": 0.85, "GBP": 0.73, "INR": 74.5}
-
     def __init__(self) -> None:
         """Initializes the CurrencyConvertorMenu and handles conversion."""
         self.config = Config()
+        self.converter = get_currency_converter()
         self.convert_currency()
 
     def convert_currency(self) -> None:
@@ -72,11 +71,13 @@ class CurrencyConvertorMenu:
                 print("Invalid input. Please enter a number.")
 
         # Perform conversion
-        converted_amount = self.convert(amount, from_currency, to_currency)
+        try:
+            converted_amount = self.convert(amount, from_currency, to_currency)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
         print(f"\n{amount} {from_currency} = {converted_amount:.2f} {to_currency}")
 
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
-        """Converts amount from one currency to another."""
-        # Convert to USD first, then to target currency
-        usd_amount = amount / self.EXCHANGE_RATES[from_currency]
-        return usd_amount * self.EXCHANGE_RATES[to_currency]
+        """Converts amount from one currency to another at today's rates."""
+        return self.converter.convert(amount, from_currency, to_currency)
@@ -1,4 +1,5 @@
 import csv
+import time
 from pathlib import Path
 from src.services.transaction_service import TransactionService
 
@@ -47,26 +48,23 @@ class ExportImportMenu:
 
     def export_to_csv(self) -> None:
         """Exports transactions to CSV file."""
-        transactions = self.transaction_service.get_transactions()
-
-        if not transactions:
-            print("No transactions to export.")
-            return
-
         file_path = (
             Path(__file__).parent.parent.parent / "data" / "exported_transactions.csv"
         )
 
-        with open(file_path, "w", newline="") as csvfile:
-            fieldnames = ["id", "amount", "category", "description", "date"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(transactions)
+        start = time.perf_counter()
+        written = self.transaction_service.export_csv(file_path)
+        elapsed = time.perf_counter() - start
 
-        print(f"Transactions exported to {file_path}")
+        if not written:
+            print("No transactions to export.")
+            return
+
+        print(f"Exported {written} transactions to {file_path}")
+        print(f"({written / elapsed if elapsed else 0:,.0f} rows/sec)")
 
     def import_from_csv(self) -> None:
-        """Imports transactions from CSV file."""
+        """Imports transactions from CSV file, merging or appending."""
         file_path = (
             Path(__file__).parent.parent.parent / "data" / "exported_transactions.csv"
         )
@@ -75,19 +73,22 @@ class ExportImportMenu:
             print("No CSV file found to import.")
             return
 
-        try:
-            with open(file_path, "r") as csvfile:
-                reader = csv.DictReader(csvfile)
-                transactions = list(reader)
-
-            # Convert amount to float
-            for t in transactions:
-                t["amount"] = float(t["amount"])
-                t["id"] = int(t["id"])
-
-            # Save to data file
-            self.transaction_service.save_transactions(transactions)
-            print(f"Imported {len(transactions)} transactions from CSV.")
+        print("1. Merge (keep ids, skip ones already stored)")
+        print("2. Append (store every row with a new id)")
+        mode = (
+            "append" if input("Select import mode (1-2): ").strip() == "2" else "merge"
+        )
 
-        except Exception as e:
+        try:
+            report = self.transaction_service.import_csv(file_path, mode=mode)
+        except (OSError, csv.Error) as e:
             print(f"Error importing CSV: {e}")
+            return
+
+        print(
+            f"Imported {report.imported} of {report.rows_read} rows "
+            f"({report.duplicates} duplicates, {report.invalid} invalid) "
+            f"in {report.seconds:.2f}s ({report.rows_per_sec:,.0f} rows/sec)."
+        )
+        for error in report.errors:
+            print(f"  {error}")
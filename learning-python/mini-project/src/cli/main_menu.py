@@ -1,4 +1,4 @@
-from src.utils.config import Config
+from src.utils.config import requires_setup
 
 
 class MainMenu:
@@ -14,9 +14,7 @@ class MainMenu:
     SETTINGS = 6
     EXIT = 7
 
-    config = Config()
-
-    @config.setup_checker
+    @requires_setup
     def __init__(self) -> None:
         """Initializes the MainMenu class and displays the menu."""
         while True:
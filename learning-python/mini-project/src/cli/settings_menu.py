@@ -1,6 +1,12 @@
+from src.utils.config import Config
+
+
 class SettingsMenu:
+    """Menu for changing user settings."""
+
     def __init__(self) -> None:
         """Initializes the SettingsMenu class and displays the menu."""
+        self.config = Config()
         while True:
             self.show_settings_menu()
             choice = self.get_user_choice()
@@ -11,6 +17,8 @@ class SettingsMenu:
         """Displays the settings menu options to the user."""
 
         print("\nSettings Menu:")
+        print(f"Name: {self.config.user_details.get('name', '')}")
+        print(f"Preferred Currency: {self.config.user_preferences.get('currency', '')}")
         print("1. Change User Name")
         print("2. Change Preferred Currency")
         print("3. Back to Main Menu")
@@ -32,7 +40,7 @@ class SettingsMenu:
             except ValueError:
                 print("Invalid input. Please enter a number.")
 
-    def execute_choice(self, choice: int) -> None:
+    def execute_choice(self, choice: int) -> bool:
         """Executes the action based on the user's settings menu choice.
 
         Args:
@@ -40,12 +48,10 @@ class SettingsMenu:
         """
 
         if choice == 1:
-            print("Change User Name selected.")
-            # TODO: Implement name change logic
+            self.change_name()
             return True
         elif choice == 2:
-            print("Change Preferred Currency selected.")
-            # TODO: Implement currency change logic
+            self.change_currency()
             return True
         elif choice == 3:
             print("Returning to Main Menu...")
@@ -53,3 +59,29 @@ class SettingsMenu:
         else:
             print("Invalid choice.")
             return True
+
+    def change_name(self) -> None:
+        """Prompts for a new user name and saves it."""
+        name = input("Enter your name: ").strip()
+        while not name:
+            name = input("Name cannot be empty. Enter your name: ").strip()
+
+        self.config.set("user_details", "name", name)
+        print(f"Name updated to '{name}'.")
+
+    def change_currency(self) -> None:
+        """Prompts for a new preferred currency and saves it."""
+        supported_currencies = self.config.supported_currencies
+        print("Select your preferred currency from the following options:")
+        for currency in supported_currencies:
+            print(f"- {currency}")
+
+        currency = input("Enter your preferred currency: ").strip().upper()
+        while currency not in supported_currencies:
+            print(
+                f"Currency '{currency}' is not supported. Please choose from {supported_currencies}."
+            )
+            currency = input("Enter your preferred currency: ").strip().upper()
+
+        self.config.set("user_preferences", "currency", currency)
+        print(f"Preferred currency updated to '{currency}'.")
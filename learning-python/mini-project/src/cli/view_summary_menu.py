@@ -13,14 +13,20 @@ class ViewSummaryMenu:
         """Displays transaction summary."""
         print("\nTransaction Summary")
 
-        summary = self.transaction_service.get_summary()
+        currency = self.transaction_service.preferred_currency
+        try:
+            summary = self.transaction_service.get_summary(currency=currency)
+        except ValueError as e:
+            # e.g. a stored currency the rate table does not cover
+            print(f"Error: {e}")
+            return
 
         if summary["count"] == 0:
             print("No transactions found.")
             return
 
         print(f"Total Transactions: {summary['count']}")
-        print(f"Total Amount: {summary['total']:.2f}")
+        print(f"Total Amount: {summary['total']:.2f} {currency}")
         print("\nBreakdown by Category:")
         print("-" * 30)
 
@@ -28,3 +34,17 @@ class ViewSummaryMenu:
             print(f"{category:<15}: {amount:.2f}")
 
         print("-" * 30)
+        print("\nBreakdown by Month:")
+        print("-" * 30)
+
+        for month, amount in sorted(summary["by_month"].items()):
+            print(f"{month:<15}: {amount:.2f}")
+
+        print("-" * 30)
+        print("\nRecorded Amounts by Currency:")
+        print("-" * 30)
+
+        for recorded_currency, amount in summary["by_currency"].items():
+            print(f"{recorded_currency:<15}: {amount:.2f}")
+
+        print("-" * 30)
@@ -1,4 +1,8 @@
-from src.services.transaction_service import TransactionService
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.services.transaction_service import SORT_FIELDS, TransactionService
+from src.storage.aggregates import DEFAULT_CURRENCY
 
 
 class ViewTransactionsMenu:
@@ -10,23 +14,94 @@ class ViewTransactionsMenu:
         self.view_transactions()
 
     def view_transactions(self) -> None:
-        """Displays all transactions."""
+        """Displays transactions one page at a time."""
         print("\nView Transactions")
 
-        transactions = self.transaction_service.get_transactions()
+        query = self.get_query()
+        page = 1
+
+        while True:
+            result = self.transaction_service.query_transactions(**query, page=page)
+
+            if not result["items"]:
+                print("No transactions found.")
+            else:
+                self.print_page(result)
+
+            options = []
+            if result["has_next"]:
+                options.append("[n]ext")
+            if page > 1:
+                options.append("[p]revious")
+            options.append("[q]uit")
+
+            choice = input(f"{' / '.join(options)}: ").strip().lower()
+            if choice == "n" and result["has_next"]:
+                page += 1
+            elif choice == "p" and page > 1:
+                page -= 1
+            elif choice == "q":
+                break
+
+    def get_query(self) -> Dict[str, Any]:
+        """Prompts for optional filters and sort order.
+
+        Returns:
+            dict: Keyword arguments for TransactionService.query_transactions.
+        """
+
+        print("Press Enter to skip a filter.")
+        query = {
+            "start_date": self.prompt_date("From date (YYYY-MM-DD): "),
+            "end_date": self.prompt_date("To date (YYYY-MM-DD): "),
+            "category": input("Category: ").strip().upper() or None,
+            "min_amount": self.prompt_amount("Minimum amount: "),
+            "max_amount": self.prompt_amount("Maximum amount: "),
+        }
+
+        sort_by = ""
+        while sort_by not in SORT_FIELDS:
+            sort_by = input(f"Sort by ({'/'.join(SORT_FIELDS)}) [date]: ").strip()
+            sort_by = sort_by.lower() or "date"
+        query["sort_by"] = sort_by
+        query["descending"] = input("Newest/highest first? (y/N): ").strip() == "y"
+        return query
+
+    def prompt_date(self, prompt: str) -> Optional[str]:
+        """Reads an optional YYYY-MM-DD date."""
+        while True:
+            value = input(prompt).strip()
+            if not value:
+                return None
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+                return value
+            except ValueError:
+                print("Invalid date. Please use YYYY-MM-DD.")
 
-        if not transactions:
-            print("No transactions found.")
-            return
+    def prompt_amount(self, prompt: str) -> Optional[float]:
+        """Reads an optional amount."""
+        while True:
+            value = input(prompt).strip()
+            if not value:
+                return None
+            try:
+                return float(value)
+            except ValueError:
+                print("Invalid amount. Please enter a number.")
 
-        print(f"Total transactions: {len(transactions)}")
+    def print_page(self, result: Dict[str, Any]) -> None:
+        """Prints one page of transactions."""
+        print(f"Page {result['page']}")
         print("-" * 80)
-        print(f"{'ID':<5} {'Date':<12} {'Category':<15} {'Amount':<10} {'Description'}")
+        print(
+            f"{'ID':<5} {'Date':<12} {'Category':<15} {'Amount':<10} {'Cur':<4} {'Description'}"
+        )
         print("-" * 80)
 
-        for t in transactions:
+        for t in result["items"]:
             print(
-                f"{t['id']:<5} {t['date']:<12} {t['category']:<15} {t['amount']:<10.2f} {t['description']}"
+                f"{t['id']:<5} {t['date']:<12} {t['category']:<15} {t['amount']:<10.2f} {t.get('currency', DEFAULT_CURRENCY):<4} {t['description']}"
             )
 
         print("-" * 80)
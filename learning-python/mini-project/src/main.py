@@ -1,10 +1,10 @@
-from src.cli.main_menu import MainMenu
-from src.utils.config import Config
-
-
 def main() -> None:
     """Entry point for the Expense Tracker application."""
 
+    # imported here so that importing src stays cheap; menus and services
+    # are in turn imported only when first selected
+    from src.cli.main_menu import MainMenu
+
     print("Welcome to the Expense Tracker Application!")
     MainMenu()
 
@@ -12,5 +12,7 @@ def main() -> None:
 def dev_entrypoints() -> None:
     """Development entry point for testing purposes."""
 
+    from src.utils.config import Config
+
     print("Development Entry Point for Expense Tracker")
     Config()
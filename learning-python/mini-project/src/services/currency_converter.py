@@ -0,0 +1,216 @@
+import bisect
+import json
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.storage.aggregates import DEFAULT_CURRENCY
+
+RATES_FILE_PATH = Path(__file__).parent.parent.parent / "config" / "exchange_rates.json"
+
+CrossRates = Dict[str, Dict[str, float]]
+
+
+class CurrencyConverter:
+    """Converts amounts between currencies using dated rate tables.
+
+    config/exchange_rates.json holds one table of rates against a base
+    currency per effective date. A date uses the latest table effective on
+    or before it (the earliest table for older dates); that lookup is cached
+    per date. For each table a full cross-rate matrix (from -> to -> factor)
+    is built once and cached, and single amounts are converted from it in
+    plain Python.
+
+    Columns of amounts are converted with numpy: the cached matrices are
+    stacked into one (table x from x to) array, so after one cached lookup
+    per distinct date, gathering each row's factor and multiplying are
+    whole-array operations. numpy is imported on first use, keeping it off
+    the startup path.
+    """
+
+    def __init__(self, rates_file: Path = RATES_FILE_PATH) -> None:
+        """Loads the rate tables.
+
+        Args:
+            rates_file (Path): JSON file with "base" and dated "rates".
+
+        Raises:
+            ValueError: If the file has no rate tables.
+        """
+
+        with open(rates_file, "r") as f:
+            data = json.load(f)
+        self.base = data.get("base", "USD")
+        self.rate_tables: Dict[str, Dict[str, float]] = data.get("rates", {})
+        if not self.rate_tables:
+            raise ValueError(f"No exchange rates found in {rates_file}")
+        self.effective_dates = sorted(self.rate_tables)
+        self.currencies = sorted(self.rate_tables[self.effective_dates[-1]])
+        self._cross_rate_array = None
+
+        # per-instance caches, so a reloaded file never serves stale rates
+        self.effective_date = lru_cache(maxsize=4096)(self._effective_date)
+        self.cross_rates_for = lru_cache(maxsize=None)(self._build_cross_rates)
+
+    def _effective_date(self, on: str) -> str:
+        position = bisect.bisect_right(self.effective_dates, on)
+        return self.effective_dates[max(position - 1, 0)]
+
+    def _build_cross_rates(self, effective_date: str) -> CrossRates:
+        rates = self.rate_tables[effective_date]
+        return {
+            source: {target: rates[target] / rates[source] for target in rates}
+            for source in rates
+        }
+
+    def _stacked_cross_rates(self):
+        """(currency -> index, tables x from x to factors), built once.
+
+        Pairs involving a currency missing from a table are NaN there.
+        """
+        import numpy as np
+
+        if self._cross_rate_array is None:
+            currencies = sorted(
+                {currency for rates in self.rate_tables.values() for currency in rates}
+            )
+            columns = {currency: i for i, currency in enumerate(currencies)}
+            factors = np.full(
+                (len(self.effective_dates), len(currencies), len(currencies)), np.nan
+            )
+            for table, effective_date in enumerate(self.effective_dates):
+                for source, targets in self.cross_rates_for(effective_date).items():
+                    for target, factor in targets.items():
+                        factors[table, columns[source], columns[target]] = factor
+            self._cross_rate_array = (columns, factors)
+        return self._cross_rate_array
+
+    def cross_rates(self, on: Optional[str] = None) -> CrossRates:
+        """Returns the cross-rate matrix in effect on a date (default today).
+
+        Args:
+            on (str, optional): Date as YYYY-MM-DD.
+        """
+        on = on or date.today().isoformat()
+        return self.cross_rates_for(self.effective_date(on[:10]))
+
+    def convert(
+        self,
+        amount: float,
+        from_currency: str,
+        to_currency: str,
+        on: Optional[str] = None,
+    ) -> float:
+        """Converts one amount at the rates in effect on a date.
+
+        Raises:
+            ValueError: If either currency has no rate.
+        """
+        cross_rates = self.cross_rates(on)
+        for currency in (from_currency, to_currency):
+            if currency not in cross_rates:
+                raise ValueError(f"No exchange rate for currency '{currency}'")
+        return amount * cross_rates[from_currency][to_currency]
+
+    def convert_many(
+        self,
+        amounts: Iterable[float],
+        from_currencies: Iterable[str],
+        to_currency: str,
+        dates: Optional[Iterable[Optional[str]]] = None,
+    ) -> List[float]:
+        """Converts a column of amounts to one currency in a single pass.
+
+        Args:
+            amounts: Amounts to convert.
+            from_currencies: Currency of each amount.
+            to_currency (str): Target currency.
+            dates: Date of each amount (YYYY-MM-DD); None uses today's rates.
+
+        Raises:
+            ValueError: If a currency has no rate.
+        """
+
+        import numpy as np
+
+        columns, factors_by_table = self._stacked_cross_rates()
+        amounts = np.asarray(list(amounts), dtype=float)
+        if dates is None:
+            dates = [None] * len(amounts)
+        today = date.today().isoformat()
+        table_of = {d: i for i, d in enumerate(self.effective_dates)}
+
+        # a ledger has few distinct dates and currencies: resolve those, then
+        # gather per row
+        distinct_dates, date_rows = np.unique(
+            np.asarray([(on or today)[:10] for on in dates], dtype=str),
+            return_inverse=True,
+        )
+        tables = np.array(
+            [table_of[self.effective_date(str(on))] for on in distinct_dates],
+            dtype=int,
+        )[date_rows]
+        distinct, inverse = np.unique(
+            np.asarray(list(from_currencies), dtype=str), return_inverse=True
+        )
+        for currency in [*map(str, distinct), to_currency]:
+            if currency not in columns:
+                raise ValueError(f"No exchange rate for currency '{currency}'")
+        sources = np.array([columns[str(c)] for c in distinct], dtype=int)[inverse]
+
+        factors = factors_by_table[tables, sources, columns[to_currency]]
+        missing = np.isnan(factors)
+        if missing.any():
+            position = int(np.argmax(missing))
+            currency = str(distinct[inverse[position]])
+            if (
+                to_currency
+                not in self.rate_tables[self.effective_dates[tables[position]]]
+            ):
+                currency = to_currency
+            raise ValueError(f"No exchange rate for currency '{currency}'")
+        return (amounts * factors).tolist()
+
+    def convert_transactions(
+        self, transactions: Iterable[Dict[str, Any]], to_currency: str
+    ) -> List[float]:
+        """Converts each transaction's amount at the rates on its own date."""
+        transactions = list(transactions)
+        return self.convert_many(
+            (t["amount"] for t in transactions),
+            (t.get("currency") or DEFAULT_CURRENCY for t in transactions),
+            to_currency,
+            (t["date"] for t in transactions),
+        )
+
+    def convert_totals(
+        self,
+        totals: Dict[str, float],
+        to_currency: str,
+        on: Optional[str] = None,
+    ) -> Dict[str, float]:
+        """Converts "<group>|<currency>" totals and sums them per group.
+
+        This turns the by_category_currency / by_month_currency aggregates
+        into one column in to_currency.
+        """
+
+        keys = list(totals)
+        groups_currencies = [key.rsplit("|", 1) for key in keys]
+        converted = self.convert_many(
+            (totals[key] for key in keys),
+            (currency for _, currency in groups_currencies),
+            to_currency,
+            [on] * len(keys),
+        )
+        result: Dict[str, float] = {}
+        for (group, _), amount in zip(groups_currencies, converted):
+            result[group] = result.get(group, 0.0) + amount
+        return result
+
+
+@lru_cache(maxsize=None)
+def get_currency_converter(rates_file: Path = RATES_FILE_PATH) -> CurrencyConverter:
+    """Returns the process-wide converter for a rates file."""
+    return CurrencyConverter(rates_file)
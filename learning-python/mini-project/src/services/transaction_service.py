@@ -1,65 +1,285 @@
-import json
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
+from src.services.currency_converter import get_currency_converter
+from src.services.transaction_store import SORTED_FIELDS, get_transaction_store
+from src.storage.csv_handler import (
+    DEFAULT_CHUNK_SIZE,
+    MAX_REPORTED_ERRORS,
+    ImportReport,
+    read_csv_chunks,
+    validate_rows,
+    write_csv_chunks,
+)
 from src.utils.config import Config
 
+SORT_FIELDS = ("date", "amount", "id")
+DEFAULT_PAGE_SIZE = 20
+IMPORT_MODES = ("merge", "append")
+
 
 class TransactionService:
     """Service class to handle transaction operations."""
 
     def __init__(self):
         self.config = Config()
-        self.data_file_path = Path(
-            __file__
-        ).parent.parent.parent / self.config.default_settings.get(
-            "data_file_path", "data/transactions.json"
-        )
-        self.data_file_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.data_file_path.exists():
-            with open(self.data_file_path, "w") as f:
-                json.dump([], f)
+        self.store = get_transaction_store(self.config.default_settings)
 
     def load_transactions(self) -> List[Dict[str, Any]]:
-        """Loads transactions from the data file."""
-        try:
-            with open(self.data_file_path, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        """Returns the cached transactions (reloaded if the data changed)."""
+        return self.store.transactions
 
     def save_transactions(self, transactions: List[Dict[str, Any]]) -> None:
-        """Saves transactions to the data file."""
-        with open(self.data_file_path, "w") as f:
-            json.dump(transactions, f, indent=4)
+        """Replaces the stored transactions."""
+        self.store.replace_all(transactions)
 
     def add_transaction(
-        self, amount: float, category: str, description: str, date: str = None
-    ) -> None:
-        """Adds a new transaction."""
+        self,
+        amount: float,
+        category: str,
+        description: str,
+        date: str = None,
+        currency: str = None,
+    ) -> Dict[str, Any]:
+        """Adds a new transaction and returns it with its assigned id.
+
+        The currency defaults to the user's preferred currency.
+        """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
+        if currency is None:
+            currency = self.preferred_currency
         transaction = {
-            "id": len(self.load_transactions()) + 1,
             "amount": amount,
             "category": category,
             "description": description,
             "date": date,
+            "currency": currency,
         }
-        transactions = self.load_transactions()
-        transactions.append(transaction)
-        self.save_transactions(transactions)
+        return self.store.add(transaction)
+
+    def add_transactions(
+        self, transactions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Adds many transactions with a single storage write.
+
+        Missing dates default to today and missing currencies to the
+        preferred currency.
+
+        Args:
+            transactions (list): Validated transaction fields, without ids.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        currency = self.preferred_currency
+        return self.store.add_many(
+            [
+                {
+                    **t,
+                    "date": t.get("date") or today,
+                    "currency": t.get("currency") or currency,
+                }
+                for t in transactions
+            ]
+        )
 
     def get_transactions(self) -> List[Dict[str, Any]]:
         """Gets all transactions."""
         return self.load_transactions()
 
-    def get_summary(self) -> Dict[str, Any]:
-        """Gets a summary of transactions."""
-        transactions = self.load_transactions()
-        total = sum(t["amount"] for t in transactions)
-        by_category = {}
-        for t in transactions:
-            cat = t["category"]
-            by_category[cat] = by_category.get(cat, 0) + t["amount"]
-        return {"total": total, "by_category": by_category, "count": len(transactions)}
+    def query_transactions(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        sort_by: str = "date",
+        descending: bool = False,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """Returns one page of transactions matching the filters.
+
+        Rows are walked in sort order from an index (the date or amount
+        index, bounded by bisection when the range filter is on the sort
+        field, or the category list for id order), and the walk stops as
+        soon as the page is full.
+
+        Args:
+            start_date (str, optional): Inclusive lower date (YYYY-MM-DD).
+            end_date (str, optional): Inclusive upper date (YYYY-MM-DD).
+            category (str, optional): Exact category.
+            min_amount (float, optional): Inclusive lower amount.
+            max_amount (float, optional): Inclusive upper amount.
+            sort_by (str): One of SORT_FIELDS.
+            descending (bool): Sort from highest to lowest.
+            page (int): 1-based page number.
+            page_size (int): Rows per page.
+
+        Returns:
+            dict: "items", "page", "page_size" and "has_next".
+
+        Raises:
+            ValueError: If sort_by, page or page_size is invalid.
+        """
+
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort by '{sort_by}'; use one of {SORT_FIELDS}")
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be positive")
+
+        rows: Iterator[Dict[str, Any]]
+        if sort_by in SORTED_FIELDS:
+            bounds = {
+                "date": (start_date, end_date),
+                "amount": (min_amount, max_amount),
+            }[sort_by]
+            rows = self.store.iter_sorted(sort_by, *bounds, descending=descending)
+        else:
+            self.store.refresh()
+            id_ordered = (
+                self.store.by_category.get(category, [])
+                if category is not None
+                else self.store.transactions
+            )
+            rows = reversed(id_ordered) if descending else iter(id_ordered)
+
+        def matches(t: Dict[str, Any]) -> bool:
+            return (
+                (start_date is None or t["date"] >= start_date)
+                and (end_date is None or t["date"] <= end_date)
+                and (category is None or t["category"] == category)
+                and (min_amount is None or t["amount"] >= min_amount)
+                and (max_amount is None or t["amount"] <= max_amount)
+            )
+
+        offset = (page - 1) * page_size
+        window = list(islice(filter(matches, rows), offset, offset + page_size + 1))
+        return {
+            "items": window[:page_size],
+            "page": page,
+            "page_size": page_size,
+            "has_next": len(window) > page_size,
+        }
+
+    def export_csv(self, file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Writes all transactions to a CSV file in chunks.
+
+        Returns:
+            int: Number of rows written.
+        """
+        return write_csv_chunks(file_path, self.store.transactions, chunk_size)
+
+    def import_csv(
+        self,
+        file_path: Path,
+        mode: str = "merge",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """Streams a CSV file into the store, one validated chunk at a time.
+
+        In "merge" mode rows keep their ids and rows whose id is already
+        stored (or repeated in the file) are skipped as duplicates; rows
+        without an id get a new one. In "append" mode every valid row is
+        added with a new id. Invalid rows are skipped and reported.
+
+        Args:
+            file_path (Path): CSV file with the export's columns.
+            mode (str): One of IMPORT_MODES.
+            chunk_size (int): Rows validated and stored per batch.
+
+        Raises:
+            ValueError: If mode is not one of IMPORT_MODES.
+        """
+
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"Unknown import mode '{mode}'; use one of {IMPORT_MODES}")
+
+        report = ImportReport()
+        start = time.perf_counter()
+        seen_ids = set()
+
+        currencies = get_currency_converter().currencies
+        for chunk in read_csv_chunks(file_path, chunk_size):
+            report.rows_read += len(chunk)
+            valid, errors = validate_rows(chunk, currencies)
+            report.invalid += len(errors)
+            report.errors.extend(errors[: MAX_REPORTED_ERRORS - len(report.errors)])
+
+            # the duplicate check and the write must see the same data
+            with self.store.write_lock():
+                self.store.refresh()
+                keep_ids, new_rows = [], []
+                for transaction in valid:
+                    if mode == "append" or "id" not in transaction:
+                        transaction.pop("id", None)
+                        new_rows.append(transaction)
+                    elif (
+                        transaction["id"] in seen_ids
+                        or transaction["id"] in self.store.by_id
+                    ):
+                        report.duplicates += 1
+                    else:
+                        seen_ids.add(transaction["id"])
+                        keep_ids.append(transaction)
+
+                report.imported += len(self.store.add_many(keep_ids, keep_ids=True))
+                report.imported += len(self.store.add_many(new_rows))
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    @property
+    def preferred_currency(self) -> str:
+        """The user's reporting currency."""
+        return self.config.user_preferences.get(
+            "currency", self.config.default_settings.get("default_currency")
+        )
+
+    def get_summary(
+        self, currency: Optional[str] = None, on: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Gets a summary of transactions from the running aggregates.
+
+        With a currency, the total and the category/month breakdowns are
+        converted from the per-currency aggregates at the rates in effect
+        on `on` (default today); by_currency always stays in each currency.
+        Costs O(categories + months + currencies), not O(transactions).
+
+        Args:
+            currency (str, optional): Reporting currency.
+            on (str, optional): Valuation date (YYYY-MM-DD).
+        """
+        aggregates = self.store.aggregates()
+        summary = {"total": aggregates["total"], "count": aggregates["count"]}
+        for dimension in ("by_category", "by_month", "by_currency"):
+            summary[dimension] = {
+                key: bucket["total"] for key, bucket in aggregates[dimension].items()
+            }
+        if currency is None:
+            return summary
+
+        converter = get_currency_converter()
+        for dimension in ("by_category", "by_month"):
+            summary[dimension] = converter.convert_totals(
+                {
+                    key: bucket["total"]
+                    for key, bucket in aggregates[f"{dimension}_currency"].items()
+                },
+                currency,
+                on,
+            )
+        summary["total"] = sum(summary["by_category"].values())
+        summary["currency"] = currency
+        return summary
+
+    def get_period_summary(self, year_month: str) -> Dict[str, Any]:
+        """Gets the total and count for one month.
+
+        Args:
+            year_month (str): Month as YYYY-MM.
+        """
+        bucket = self.store.aggregates()["by_month"].get(year_month)
+        return bucket or {"total": 0.0, "count": 0}
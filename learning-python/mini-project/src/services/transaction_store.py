@@ -0,0 +1,177 @@
+import bisect
+from collections import defaultdict
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from src.storage import StorageBackend, get_storage
+from src.storage.base import Signature
+
+# fields with a sorted (value, id) index, for range filters and ordering
+SORTED_FIELDS = ("date", "amount")
+
+
+class TransactionStore:
+    """Process-wide, in-memory view of the stored transactions.
+
+    The parsed list and its indexes are kept until the backend's signature
+    changes (another process or an editor touched the data), so repeated
+    menu actions do not re-read the ledger. Writes made through the store
+    update the cache in place, under the backend's write lock so a
+    concurrent writer's rows are picked up rather than skipped.
+    """
+
+    def __init__(self, storage: StorageBackend) -> None:
+        """Initializes an empty cache over a storage backend.
+
+        Args:
+            storage (StorageBackend): Backend the transactions are read from.
+        """
+
+        self.storage = storage
+        self._signature: Optional[Signature] = None
+        self._transactions: List[Dict[str, Any]] = []
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        self.by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_month: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.sorted_indexes: Dict[str, List[Tuple[Any, int]]] = {
+            field: [] for field in SORTED_FIELDS
+        }
+        self.loads = 0
+
+    def _index(self, transaction: Dict[str, Any]) -> None:
+        self.by_id[transaction["id"]] = transaction
+        self.by_category[transaction["category"]].append(transaction)
+        self.by_month[str(transaction["date"])[:7]].append(transaction)
+
+    def _load(self) -> None:
+        self._signature = self.storage.signature()
+        self._transactions = self.storage.load_all()
+        self._reindex()
+        self.loads += 1
+
+    def _reindex(self) -> None:
+        self.by_id = {}
+        self.by_category = defaultdict(list)
+        self.by_month = defaultdict(list)
+        for transaction in self._transactions:
+            self._index(transaction)
+        self.sorted_indexes = {
+            field: sorted((t[field], t["id"]) for t in self._transactions)
+            for field in SORTED_FIELDS
+        }
+
+    def refresh(self) -> None:
+        """Reloads if the data changed on disk since the last load."""
+        if self._signature is None or self.storage.signature() != self._signature:
+            self._load()
+
+    def write_lock(self) -> ContextManager[None]:
+        """The backend's write lock, for read-then-write steps by callers."""
+        return self.storage.write_lock()
+
+    def invalidate(self) -> None:
+        """Forces a reload on next access."""
+        self._signature = None
+
+    @property
+    def transactions(self) -> List[Dict[str, Any]]:
+        """The cached transactions, ordered by id (do not mutate)."""
+        self.refresh()
+        return self._transactions
+
+    def add(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Stores a transaction and adds it to the cache and indexes."""
+        return self.add_many([transaction])[0]
+
+    def add_many(
+        self, transactions: List[Dict[str, Any]], keep_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Stores a chunk of transactions and adds them to the cache.
+
+        Args:
+            transactions (list): Transaction fields.
+            keep_ids (bool): Keep the given ids (they must not exist yet).
+        """
+
+        with self.storage.write_lock():
+            self.refresh()
+            stored = self.storage.add_many(transactions, keep_ids=keep_ids)
+            self._add_to_cache(stored)
+            self._signature = self.storage.signature()
+        return stored
+
+    def _add_to_cache(self, stored: List[Dict[str, Any]]) -> None:
+        last_id = self._transactions[-1]["id"] if self._transactions else 0
+        self._transactions.extend(stored)
+        ids = [last_id] + [t["id"] for t in stored]
+        if any(previous > current for previous, current in zip(ids, ids[1:])):
+            # merged ids arrived out of order: restore id order
+            self._transactions.sort(key=lambda t: t["id"])
+            self._reindex()
+        else:
+            for transaction in stored:
+                self._index(transaction)
+                for field in SORTED_FIELDS:
+                    bisect.insort(
+                        self.sorted_indexes[field],
+                        (transaction[field], transaction["id"]),
+                    )
+
+    def iter_sorted(
+        self,
+        field: str,
+        low: Any = None,
+        high: Any = None,
+        descending: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields transactions ordered by a sorted field, within [low, high].
+
+        The bounds are found by bisection, so only the rows in range are
+        visited, and callers that stop early never touch the rest.
+
+        Args:
+            field (str): One of SORTED_FIELDS.
+            low: Inclusive lower bound, or None for no bound.
+            high: Inclusive upper bound, or None for no bound.
+            descending (bool): Yield from the highest value down.
+        """
+
+        self.refresh()
+        index = self.sorted_indexes[field]
+        start = 0 if low is None else bisect.bisect_left(index, (low,))
+        stop = (
+            len(index)
+            if high is None
+            else bisect.bisect_right(index, (high, float("inf")))
+        )
+        positions = range(stop - 1, start - 1, -1) if descending else range(start, stop)
+        for position in positions:
+            yield self.by_id[index[position][1]]
+
+    def aggregates(self) -> Dict[str, Any]:
+        """Running totals maintained by the backend (see storage/aggregates.py)."""
+        return self.storage.aggregates()
+
+    def replace_all(self, transactions: List[Dict[str, Any]]) -> None:
+        """Replaces the stored transactions and rebuilds the cache."""
+        with self.storage.write_lock():
+            self.storage.replace_all(transactions)
+            self._load()
+
+
+_STORES: Dict[Tuple, TransactionStore] = {}
+
+
+def get_transaction_store(default_settings: Dict[str, Any]) -> TransactionStore:
+    """Returns the shared store for the configured backend, creating it once.
+
+    Args:
+        default_settings (dict): The "default_settings" section of the config.
+    """
+
+    key = tuple(
+        default_settings.get(name)
+        for name in ("storage_backend", "data_file_path", "database_file_path")
+    )
+    if key not in _STORES:
+        _STORES[key] = TransactionStore(get_storage(default_settings))
+    return _STORES[key]
@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Any, Dict
+
+from .base import StorageBackend
+from .json_storage import DEFAULT_COMPACTION_THRESHOLD_BYTES, JsonStorage
+from .sqlite_storage import SqliteStorage
+
+# project root, against which data paths in settings.json are resolved
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+DEFAULT_BACKEND = "json"
+DEFAULT_DATA_FILE_PATH = "data/transactions.json"
+DEFAULT_DATABASE_FILE_PATH = "data/transactions.db"
+
+
+def get_storage(default_settings: Dict[str, Any]) -> StorageBackend:
+    """Builds the storage backend selected in settings.json.
+
+    Args:
+        default_settings (dict): The "default_settings" section of the config.
+
+    Raises:
+        ValueError: If storage_backend names an unknown backend.
+    """
+
+    backend = default_settings.get("storage_backend", DEFAULT_BACKEND)
+    json_path = PROJECT_ROOT / default_settings.get(
+        "data_file_path", DEFAULT_DATA_FILE_PATH
+    )
+
+    if backend == "json":
+        return JsonStorage(
+            json_path,
+            compaction_threshold_bytes=default_settings.get(
+                "journal_compaction_bytes", DEFAULT_COMPACTION_THRESHOLD_BYTES
+            ),
+        )
+    if backend == "sqlite":
+        db_path = PROJECT_ROOT / default_settings.get(
+            "database_file_path", DEFAULT_DATABASE_FILE_PATH
+        )
+        return SqliteStorage(db_path, legacy_json_path=json_path)
+    raise ValueError(f"Unknown storage backend '{backend}'")
+
+
+__all__ = ["StorageBackend", "JsonStorage", "SqliteStorage", "get_storage"]
@@ -0,0 +1,56 @@
+from typing import Any, Dict, Iterable
+
+# currency assumed for transactions recorded without one
+DEFAULT_CURRENCY = "INR"
+# bump when DIMENSIONS change so persisted aggregates are rebuilt
+AGGREGATES_VERSION = "2"
+DIMENSIONS = (
+    "by_category",
+    "by_month",
+    "by_currency",
+    "by_category_currency",
+    "by_month_currency",
+)
+
+Aggregates = Dict[str, Any]
+
+
+def empty_aggregates() -> Aggregates:
+    """Returns aggregates for an empty ledger."""
+    return {"total": 0.0, "count": 0, **{dimension: {} for dimension in DIMENSIONS}}
+
+
+def dimension_keys(transaction: Dict[str, Any]) -> Dict[str, str]:
+    """Maps each aggregate dimension to the transaction's key in it.
+
+    The combined dimensions are keyed "<category or month>|<currency>".
+    """
+    category = transaction["category"]
+    month = str(transaction["date"])[:7]
+    currency = transaction.get("currency") or DEFAULT_CURRENCY
+    return {
+        "by_category": category,
+        "by_month": month,
+        "by_currency": currency,
+        "by_category_currency": f"{category}|{currency}",
+        "by_month_currency": f"{month}|{currency}",
+    }
+
+
+def apply_transaction(aggregates: Aggregates, transaction: Dict[str, Any]) -> None:
+    """Adds one transaction to running aggregates in place."""
+    amount = float(transaction["amount"])
+    aggregates["total"] += amount
+    aggregates["count"] += 1
+    for dimension, key in dimension_keys(transaction).items():
+        bucket = aggregates[dimension].setdefault(key, {"total": 0.0, "count": 0})
+        bucket["total"] += amount
+        bucket["count"] += 1
+
+
+def compute_aggregates(transactions: Iterable[Dict[str, Any]]) -> Aggregates:
+    """Builds aggregates from scratch."""
+    aggregates = empty_aggregates()
+    for transaction in transactions:
+        apply_transaction(aggregates, transaction)
+    return aggregates
@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+Signature = Tuple[Any, ...]
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class StorageBackend(ABC):
+    """Interface every transaction storage backend implements."""
+
+    @abstractmethod
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Returns every stored transaction, ordered by id."""
+
+    @abstractmethod
+    def add(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Stores a new transaction and returns it with its assigned id.
+
+        Args:
+            transaction (dict): Transaction fields without an id.
+        """
+
+    @abstractmethod
+    def add_many(
+        self, transactions: List[Dict[str, Any]], keep_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Stores a chunk of transactions and returns them with their ids.
+
+        Args:
+            transactions (list): Transaction fields.
+            keep_ids (bool): Store the given ids instead of assigning new
+                ones; callers must have removed ids that already exist.
+        """
+
+    @abstractmethod
+    def replace_all(self, transactions: List[Dict[str, Any]]) -> None:
+        """Replaces the stored transactions with the given list.
+
+        Args:
+            transactions (list): Transactions including their ids.
+        """
+
+    @abstractmethod
+    def aggregates(self) -> Dict[str, Any]:
+        """Returns the running totals (see aggregates.py) without a full scan."""
+
+    @abstractmethod
+    def signature(self) -> Signature:
+        """Returns a cheap fingerprint of the stored data.
+
+        It changes whenever the data on disk changes, so callers can keep
+        a parsed copy in memory until it does.
+        """
+
+    def write_lock(self) -> ContextManager[None]:
+        """Returns a context manager excluding other writers, even in other
+        processes, for its duration.
+
+        Backends that serialise writes hold it inside their own writes too;
+        callers take it to make a read-then-write step atomic. It must be
+        re-entrant.
+        """
+        return nullcontext()
+
+    def close(self) -> None:
+        """Releases any resources held by the backend."""
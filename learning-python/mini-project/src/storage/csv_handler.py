@@ -0,0 +1,121 @@
+import csv
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+CSV_FIELDS = ["id", "amount", "category", "description", "date", "currency"]
+DEFAULT_CHUNK_SIZE = 1000
+DATE_FORMAT = "%Y-%m-%d"
+# invalid rows listed in an import report; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+NumberedRow = Tuple[int, Dict[str, str]]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a CSV import."""
+
+    rows_read: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+
+def read_csv_chunks(
+    file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[List[NumberedRow]]:
+    """Yields the rows of a CSV file in chunks, with their line numbers.
+
+    Only one chunk is held in memory at a time.
+    """
+
+    with open(file_path, "r", newline="") as csvfile:
+        reader = csv.DictReader(csvfile)
+        rows = ((reader.line_num, row) for row in reader)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def validate_rows(
+    rows: Iterable[NumberedRow],
+    currencies: Optional[Collection[str]] = None,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Converts a chunk of CSV rows to transactions.
+
+    Args:
+        rows: Numbered CSV rows (or JSON records).
+        currencies: Currency codes with an exchange rate; when given, rows
+            in any other currency are invalid.
+
+    Returns:
+        tuple: The valid transactions (with "id" only if the row had one)
+        and one "line N: reason" message per invalid row.
+    """
+
+    valid, errors = [], []
+    for line_num, row in rows:
+        try:
+            amount = float(row.get("amount") or "")
+            if not math.isfinite(amount):
+                raise ValueError(f"amount must be a finite number, not {amount}")
+            if amount <= 0:
+                raise ValueError("amount must be positive")
+            category = str(row.get("category") or "").strip().upper()
+            if not category:
+                raise ValueError("category is empty")
+            date = str(row.get("date") or "").strip()
+            datetime.strptime(date, DATE_FORMAT)
+            transaction = {
+                "amount": amount,
+                "category": category,
+                "description": str(row.get("description") or "").strip(),
+                "date": date,
+            }
+            currency = str(row.get("currency") or "").strip().upper()
+            if currency:
+                if len(currency) != 3 or not currency.isalpha():
+                    raise ValueError(f"invalid currency '{currency}'")
+                if currencies is not None and currency not in currencies:
+                    raise ValueError(f"no exchange rate for currency '{currency}'")
+                transaction["currency"] = currency
+            if str(row.get("id") or "").strip():
+                transaction = {"id": int(row["id"]), **transaction}
+        except (TypeError, ValueError) as e:
+            # TypeError: a JSON import field that is not a scalar
+            errors.append(f"line {line_num}: {e}")
+            continue
+        valid.append(transaction)
+    return valid, errors
+
+
+def write_csv_chunks(
+    file_path: Path,
+    transactions: Iterable[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Writes transactions to CSV chunk by chunk; returns the row count."""
+
+    written = 0
+    transactions = iter(transactions)
+    with open(file_path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        while True:
+            chunk = list(islice(transactions, chunk_size))
+            if not chunk:
+                return written
+            writer.writerows(chunk)
+            written += len(chunk)
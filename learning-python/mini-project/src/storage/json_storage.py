@@ -0,0 +1,256 @@
+import copy
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from src.utils.file_utils import atomic_write_json
+
+from .aggregates import (
+    AGGREGATES_VERSION,
+    Aggregates,
+    apply_transaction,
+    compute_aggregates,
+)
+from .base import Signature, StorageBackend, file_signature
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+SUMMARY_SUFFIX = ".summary.json"
+LOCK_SUFFIX = ".lock"
+SEQUENCE_SUFFIX = ".seq"
+DEFAULT_COMPACTION_THRESHOLD_BYTES = 1024 * 1024
+
+
+class JsonStorage(StorageBackend):
+    """Stores transactions as a JSON snapshot plus an append-only journal.
+
+    The snapshot is the original JSON array file. Each add appends one JSON
+    line to `<snapshot>.journal.jsonl`, so adds cost the same however large
+    the ledger is. Reads replay the snapshot and then the journal. Once the
+    journal grows past compaction_threshold_bytes it is folded into a new
+    snapshot, which is written atomically before the journal is removed.
+
+    Running aggregates live in a `<snapshot>.summary.json` sidecar stamped
+    with the data signature they describe; a stale sidecar (e.g. after a
+    crash or a hand edit) is rebuilt from a full replay.
+
+    Writers serialise on an advisory lock on `<snapshot>.lock` (POSIX
+    flock), and ids come from the last-id counter in `<snapshot>.seq`,
+    so several processes can add at once without losing records or
+    reusing ids, and allocating an id never needs a full load.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        compaction_threshold_bytes: int = DEFAULT_COMPACTION_THRESHOLD_BYTES,
+    ) -> None:
+        """Initializes the backend, creating an empty snapshot if needed.
+
+        Args:
+            file_path (Path): Path of the JSON snapshot file.
+            compaction_threshold_bytes (int): Journal size that triggers
+                compaction.
+        """
+
+        self.file_path = Path(file_path)
+        self.journal_path = self.file_path.with_suffix(JOURNAL_SUFFIX)
+        self.summary_path = self.file_path.with_suffix(SUMMARY_SUFFIX)
+        self.lock_path = self.file_path.with_suffix(LOCK_SUFFIX)
+        self.sequence_path = self.file_path.with_suffix(SEQUENCE_SUFFIX)
+        self.compaction_threshold_bytes = compaction_threshold_bytes
+        self._aggregates: Optional[Aggregates] = None
+        self._aggregates_signature: Optional[list] = None
+        self._lock_file = None
+        self._lock_depth = 0
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.write_lock():
+            if not self.file_path.exists():
+                atomic_write_json(self.file_path, [])
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Holds the exclusive writer lock (re-entrant within an instance)."""
+        if self._lock_depth == 0:
+            self._lock_file = open(self.lock_path, "a")
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                # closing the file releases the flock
+                self._lock_file.close()
+                self._lock_file = None
+
+    def _read_sequence(self) -> int:
+        try:
+            with open(self.sequence_path, "r") as f:
+                return int(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError, ValueError):
+            # first use (or a damaged counter): start after the largest id
+            return max((t["id"] for t in self.load_all()), default=0)
+
+    def _advance_sequence(self, last_id: int) -> None:
+        atomic_write_json(self.sequence_path, last_id)
+
+    def _load_snapshot(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.file_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _read_journal(self) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Returns the journal records and the offset of a torn tail, if any."""
+        records = []
+        valid_bytes = 0
+        try:
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        return records, valid_bytes
+                    valid_bytes += len(line)
+        except FileNotFoundError:
+            pass
+        return records, None
+
+    def _load_journal(self) -> List[Dict[str, Any]]:
+        records, torn_at = self._read_journal()
+        if torn_at is None:
+            return records
+        # the tail may be an append still in progress, so only writers may
+        # judge it: under the lock, a torn line can only be left by a crash
+        # and is cut off so the next append starts on a clean line
+        with self.write_lock():
+            records, torn_at = self._read_journal()
+            if torn_at is not None:
+                os.truncate(self.journal_path, torn_at)
+        return records
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Replays the snapshot and then the journal."""
+        transactions = self._load_snapshot()
+        # a crash between writing a compacted snapshot and removing the
+        # journal leaves records that are already in the snapshot
+        snapshot_ids = {t["id"] for t in transactions}
+        transactions.extend(
+            t for t in self._load_journal() if t["id"] not in snapshot_ids
+        )
+        ids = [t["id"] for t in transactions]
+        if any(previous > current for previous, current in zip(ids, ids[1:])):
+            # rows added with keep_ids may carry ids below existing ones
+            transactions.sort(key=lambda t: t["id"])
+        return transactions
+
+    def add(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Appends one journal line; compacts if the journal is too large."""
+        return self.add_many([transaction])[0]
+
+    def add_many(
+        self, transactions: List[Dict[str, Any]], keep_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Appends a chunk of journal lines with a single write and fsync."""
+        if not transactions:
+            return []
+        with self.write_lock():
+            aggregates = copy.deepcopy(self.aggregates())
+            last_id = self._read_sequence()
+
+            stored = []
+            for transaction in transactions:
+                if keep_ids:
+                    last_id = max(last_id, transaction["id"])
+                else:
+                    last_id += 1
+                    transaction = {"id": last_id, **transaction}
+                apply_transaction(aggregates, transaction)
+                stored.append(transaction)
+
+            self._advance_sequence(last_id)
+            with open(self.journal_path, "a") as f:
+                f.write("".join(json.dumps(t) + "\n" for t in stored))
+                f.flush()
+                os.fsync(f.fileno())
+                journal_size = f.tell()
+
+            if journal_size >= self.compaction_threshold_bytes:
+                self.compact()
+            else:
+                self._save_aggregates(aggregates)
+        return stored
+
+    def signature(self) -> Signature:
+        """Stat of the snapshot and the journal."""
+        return file_signature(self.file_path), file_signature(self.journal_path)
+
+    def _stamp(self) -> list:
+        # the signature as it round-trips through JSON, plus the aggregate
+        # layout version so sidecars from older layouts count as stale
+        return json.loads(json.dumps([AGGREGATES_VERSION, *self.signature()]))
+
+    def _save_aggregates(self, aggregates: Aggregates) -> None:
+        self._aggregates = aggregates
+        self._aggregates_signature = self._stamp()
+        atomic_write_json(
+            self.summary_path,
+            {"signature": self._aggregates_signature, "aggregates": aggregates},
+        )
+
+    def _load_sidecar(self) -> bool:
+        """Adopts the sidecar aggregates if they match the current data."""
+        stamp = self._stamp()
+        if self._aggregates is not None and self._aggregates_signature == stamp:
+            return True
+        try:
+            with open(self.summary_path, "r") as f:
+                summary = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if summary.get("signature") != stamp or "aggregates" not in summary:
+            return False
+        self._aggregates = summary["aggregates"]
+        self._aggregates_signature = stamp
+        return True
+
+    def aggregates(self) -> Aggregates:
+        """Returns the sidecar aggregates, rebuilding them if stale.
+
+        The rebuild holds the writer lock, so the replayed rows and the
+        signature stamped on the new sidecar describe the same data.
+        """
+        if self._load_sidecar():
+            return self._aggregates
+        with self.write_lock():
+            # another process may have written or rebuilt meanwhile
+            if not self._load_sidecar():
+                # stamped after the replay, which may repair the journal
+                self._save_aggregates(compute_aggregates(self.load_all()))
+        return self._aggregates
+
+    def compact(self) -> None:
+        """Folds the journal into a new snapshot."""
+        with self.write_lock():
+            self.replace_all(self.load_all())
+
+    def replace_all(self, transactions: List[Dict[str, Any]]) -> None:
+        """Atomically writes a new snapshot and drops the journal.
+
+        The id counter never moves backwards, so ids are not reused.
+        """
+        with self.write_lock():
+            last_id = max([self._read_sequence(), *(t["id"] for t in transactions)])
+            atomic_write_json(self.file_path, transactions)
+            self.journal_path.unlink(missing_ok=True)
+            self._advance_sequence(last_id)
+            self._save_aggregates(compute_aggregates(transactions))
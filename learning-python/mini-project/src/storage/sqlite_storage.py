@@ -0,0 +1,340 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .aggregates import (
+    AGGREGATES_VERSION,
+    DEFAULT_CURRENCY,
+    Aggregates,
+    empty_aggregates,
+)
+from .base import Signature, StorageBackend
+from .json_storage import JsonStorage
+
+TRANSACTION_FIELDS = ["id", "amount", "category", "description", "date", "currency"]
+JSON_MIGRATION_KEY = "migrated_from_json"
+AGGREGATES_VERSION_KEY = "aggregates_version"
+TRIGGERS_VERSION_KEY = "triggers_version"
+# bump when the trigger bodies change, so existing databases recreate them
+TRIGGERS_VERSION = "2"
+WRITE_COUNTER_KEY = "write_counter"
+# seconds a writer waits for another process's write lock
+BUSY_TIMEOUT = 30
+TRIGGER_NAMES = [
+    "transactions_aggregates_insert",
+    "transactions_aggregates_delete",
+    "transactions_aggregates_update",
+]
+
+_CURRENCY = f"COALESCE({{row}}.currency, '{DEFAULT_CURRENCY}')"
+_MONTH = "substr({row}.date, 1, 7)"
+# aggregate dimension -> SQL for a row's key in it ({row} is NEW or OLD);
+# must match aggregates.dimension_keys
+AGGREGATE_KEYS = {
+    "all": "''",
+    "by_category": "{row}.category",
+    "by_month": _MONTH,
+    "by_currency": _CURRENCY,
+    "by_category_currency": f"{{row}}.category || '|' || {_CURRENCY}",
+    "by_month_currency": f"{_MONTH} || '|' || {_CURRENCY}",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    amount REAL NOT NULL,
+    category TEXT NOT NULL,
+    description TEXT NOT NULL,
+    date TEXT NOT NULL,
+    currency TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date);
+CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions (category);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, key)
+);
+INSERT OR IGNORE INTO metadata (key, value) VALUES ('write_counter', '0');
+"""
+
+
+def _aggregate_triggers() -> List[str]:
+    """Triggers keeping the aggregates table in step with transactions.
+
+    They run inside the writing statement's transaction, so the totals can
+    never disagree with the rows, whoever writes them. Each one also bumps
+    the write counter that signature() reports.
+    """
+
+    bump = (
+        f"UPDATE metadata SET value = CAST(value AS INTEGER) + 1 "
+        f"WHERE key = '{WRITE_COUNTER_KEY}';\n"
+    )
+
+    def upsert(row: str, sign: str) -> str:
+        return "".join(
+            "INSERT INTO aggregates (dimension, key, total, count) "
+            f"VALUES ('{dimension}', {key.format(row=row)}, "
+            f"{sign}{row}.amount, {sign}1) "
+            "ON CONFLICT (dimension, key) DO UPDATE SET "
+            "total = total + excluded.total, count = count + excluded.count;\n"
+            for dimension, key in AGGREGATE_KEYS.items()
+        )
+
+    return [
+        "CREATE TRIGGER IF NOT EXISTS transactions_aggregates_insert "
+        f"AFTER INSERT ON transactions BEGIN\n{upsert('NEW', '')}{bump}END",
+        "CREATE TRIGGER IF NOT EXISTS transactions_aggregates_delete "
+        f"AFTER DELETE ON transactions BEGIN\n{upsert('OLD', '-')}{bump}END",
+        "CREATE TRIGGER IF NOT EXISTS transactions_aggregates_update "
+        "AFTER UPDATE ON transactions BEGIN\n"
+        f"{upsert('OLD', '-')}{upsert('NEW', '')}{bump}END",
+    ]
+
+
+class SqliteStorage(StorageBackend):
+    """Stores transactions in an indexed SQLite table.
+
+    Adds are a single INSERT, independent of how many rows are stored. On
+    first use an existing JSON data file is imported once; the JSON file is
+    left in place and the import is recorded in the metadata table.
+
+    Running totals are kept in the aggregates table by triggers, so
+    summaries read a handful of rows instead of the whole ledger.
+
+    Every write runs in a BEGIN IMMEDIATE transaction, so concurrent
+    processes queue for the database's write lock (up to BUSY_TIMEOUT
+    seconds) instead of failing, and AUTOINCREMENT never reuses an id.
+    """
+
+    def __init__(self, db_path: Path, legacy_json_path: Optional[Path] = None) -> None:
+        """Opens (and if needed creates) the database.
+
+        Args:
+            db_path (Path): Path of the SQLite database file.
+            legacy_json_path (Path, optional): JSON data file to migrate from.
+        """
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # autocommit mode: write_lock() opens the transactions explicitly
+        self.connection = sqlite3.connect(
+            self.db_path, timeout=BUSY_TIMEOUT, isolation_level=None
+        )
+        self.connection.row_factory = sqlite3.Row
+        self._lock_depth = 0
+        self.connection.executescript(SCHEMA)
+        self._upgrade_schema()
+        if legacy_json_path is not None:
+            self.migrate_from_json(Path(legacy_json_path))
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Runs the block in one BEGIN IMMEDIATE transaction (re-entrant).
+
+        The write lock is taken up front, so a read-then-write inside the
+        block cannot be invalidated by another process.
+        """
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        self._lock_depth = 1
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self._lock_depth = 0
+
+    def _upgrade_schema(self) -> None:
+        """Brings databases created by older versions up to date.
+
+        Checks are repeated under the write lock, since several processes
+        may open an old database at the same time.
+        """
+        with self.write_lock():
+            columns = {
+                row["name"]
+                for row in self.connection.execute("PRAGMA table_info(transactions)")
+            }
+            if "currency" not in columns:
+                # NULL currency means DEFAULT_CURRENCY
+                self.connection.execute(
+                    "ALTER TABLE transactions ADD COLUMN currency TEXT"
+                )
+            if self.get_metadata(TRIGGERS_VERSION_KEY) != TRIGGERS_VERSION:
+                for trigger in TRIGGER_NAMES:
+                    self.connection.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                self.set_metadata(TRIGGERS_VERSION_KEY, TRIGGERS_VERSION)
+            for trigger in _aggregate_triggers():
+                self.connection.execute(trigger)
+            if self.get_metadata(AGGREGATES_VERSION_KEY) != AGGREGATES_VERSION:
+                self.rebuild_aggregates()
+
+    def get_metadata(self, key: str) -> Optional[str]:
+        """Returns a metadata value, or None if it is not set."""
+        row = self.connection.execute(
+            "SELECT value FROM metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set_metadata(self, key: str, value: str) -> None:
+        """Sets a metadata value (within the caller's transaction)."""
+        self.connection.execute(
+            "INSERT INTO metadata (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def migrate_from_json(self, json_path: Path) -> int:
+        """Imports a JSON data file once and records the migration.
+
+        Args:
+            json_path (Path): Path of the legacy JSON snapshot (its journal,
+                if any, is replayed too).
+
+        Returns:
+            int: Number of transactions imported (0 if already migrated).
+        """
+
+        if self.get_metadata(JSON_MIGRATION_KEY) is not None:
+            return 0
+        transactions = JsonStorage(json_path).load_all() if json_path.exists() else []
+
+        with self.write_lock():
+            if self.get_metadata(JSON_MIGRATION_KEY) is not None:
+                # another process migrated while we were reading
+                return 0
+            self._insert_many(transactions)
+            self.set_metadata(
+                JSON_MIGRATION_KEY,
+                json.dumps(
+                    {
+                        "source": str(json_path),
+                        "count": len(transactions),
+                        "at": datetime.now().isoformat(timespec="seconds"),
+                    }
+                ),
+            )
+        return len(transactions)
+
+    def _insert_many(self, transactions: List[Dict[str, Any]]) -> None:
+        self.connection.executemany(
+            "INSERT INTO transactions "
+            "(id, amount, category, description, date, currency) "
+            "VALUES (:id, :amount, :category, :description, :date, :currency)",
+            [{**dict.fromkeys(TRANSACTION_FIELDS), **t} for t in transactions],
+        )
+
+    def rebuild_aggregates(self) -> None:
+        """Recomputes the aggregates table from the stored rows."""
+        selects = " UNION ALL ".join(
+            f"SELECT '{dimension}', {key.format(row='t')}, SUM(t.amount), COUNT(*) "
+            f"FROM transactions t GROUP BY 2"
+            for dimension, key in AGGREGATE_KEYS.items()
+        )
+        with self.write_lock():
+            self.connection.execute("DELETE FROM aggregates")
+            self.connection.execute(
+                f"INSERT INTO aggregates (dimension, key, total, count) {selects}"
+            )
+            self.set_metadata(AGGREGATES_VERSION_KEY, AGGREGATES_VERSION)
+
+    def aggregates(self) -> Aggregates:
+        """Reads the trigger-maintained totals."""
+        aggregates = empty_aggregates()
+        rows = self.connection.execute(
+            "SELECT dimension, key, total, count FROM aggregates WHERE count > 0"
+        )
+        for row in rows:
+            if row["dimension"] == "all":
+                aggregates["total"] = row["total"]
+                aggregates["count"] = row["count"]
+            else:
+                aggregates[row["dimension"]][row["key"]] = {
+                    "total": row["total"],
+                    "count": row["count"],
+                }
+        return aggregates
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Returns every transaction, ordered by id."""
+        rows = self.connection.execute(
+            "SELECT id, amount, category, description, date, currency "
+            "FROM transactions ORDER BY id"
+        )
+        # rows recorded before currencies existed come back without one,
+        # exactly as the JSON backend stores them
+        return [
+            {key: row[key] for key in row.keys() if row[key] is not None}
+            for row in rows
+        ]
+
+    def add(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Inserts a transaction and returns it with its new id."""
+        with self.write_lock():
+            cursor = self.connection.execute(
+                "INSERT INTO transactions (amount, category, description, date, currency) "
+                "VALUES (:amount, :category, :description, :date, :currency)",
+                {"currency": None, **transaction},
+            )
+        return {"id": cursor.lastrowid, **transaction}
+
+    def add_many(
+        self, transactions: List[Dict[str, Any]], keep_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Inserts a chunk of transactions in one database transaction."""
+        if keep_ids:
+            with self.write_lock():
+                self._insert_many(transactions)
+            return list(transactions)
+
+        stored = []
+        with self.write_lock():
+            for transaction in transactions:
+                cursor = self.connection.execute(
+                    "INSERT INTO transactions "
+                    "(amount, category, description, date, currency) "
+                    "VALUES (:amount, :category, :description, :date, :currency)",
+                    {"currency": None, **transaction},
+                )
+                stored.append({"id": cursor.lastrowid, **transaction})
+        return stored
+
+    def replace_all(self, transactions: List[Dict[str, Any]]) -> None:
+        """Replaces every row in one transaction."""
+        with self.write_lock():
+            self.connection.execute("DELETE FROM transactions")
+            self._insert_many(transactions)
+
+    def signature(self) -> Signature:
+        """The trigger-maintained write counter.
+
+        Every inserted, updated or deleted row bumps it in the same
+        transaction, so it changes exactly when the committed rows do,
+        whichever process or connection wrote them.
+        """
+        return (self.get_metadata(WRITE_COUNTER_KEY),)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
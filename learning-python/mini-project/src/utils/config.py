@@ -1,11 +1,28 @@
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from tkinter import N
-from typing import Any
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from src.utils.file_utils import atomic_write_json
+
+SECTIONS = (
+    "app_info",
+    "default_settings",
+    "supported_currencies",
+    "user_preferences",
+    "user_details",
+)
 
 
 class Config:
-    """Configuration class to manage application settings."""
+    """Configuration class to manage application settings.
+
+    There is one shared instance per process: `Config()` always returns it.
+    settings.json is parsed on first use and again only when its mtime or
+    size changes. Changes are held in memory and written back in a single
+    atomic write, either immediately or once at the end of a `batch()`.
+    """
 
     # absolute path to settings.json
     settings_file_rel_path = "../../config/settings.json"
@@ -13,22 +30,108 @@ class Config:
         Path(__file__).parent.parent.parent / "config" / "settings.json"
     )
 
-    app_info: dict
-    default_settings: dict
-    supported_currencies: list
-    user_preferences: dict
-    user_details: dict
+    _instance: Optional["Config"] = None
+
+    def __new__(cls) -> "Config":
+        if cls._instance is None:
+            instance = super().__new__(cls)
+            instance._data = None
+            instance._raw = {}
+            instance._signature = None
+            instance._pending = {}
+            instance._batch_depth = 0
+            instance.reads = 0
+            cls._instance = instance
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops the shared instance, e.g. after pointing at another file."""
+        cls._instance = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.settings_file_abs_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> Dict[str, Any]:
+        """Returns the parsed settings, re-reading only if the file changed."""
+
+        signature = self._file_signature()
+        if self._data is None or signature != self._signature:
+            with open(self.settings_file_abs_path, "r") as file:
+                data = json.load(file)
+            self._data = {
+                section: data.get(
+                    section, [] if section == "supported_currencies" else {}
+                )
+                for section in SECTIONS
+            }
+            # keep unsaved changes on top of what another process wrote
+            for section, values in self._pending.items():
+                self._data[section].update(values)
+            self._raw = data
+            self._signature = signature
+            self.reads += 1
+        return self._data
+
+    @property
+    def app_info(self) -> dict:
+        return self._load()["app_info"]
+
+    @property
+    def default_settings(self) -> dict:
+        return self._load()["default_settings"]
+
+    @property
+    def supported_currencies(self) -> list:
+        return self._load()["supported_currencies"]
+
+    @property
+    def user_preferences(self) -> dict:
+        return self._load()["user_preferences"]
+
+    @property
+    def user_details(self) -> dict:
+        return self._load()["user_details"]
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        """Changes one setting and writes it back (deferred inside batch()).
 
-    def __init__(self):
-        """Initializes the Config class with default settings."""
+        Args:
+            section (str): Settings section, e.g. "user_preferences".
+            key (str): Setting name within the section.
+            value: The new value.
+        """
 
-        with open(self.settings_file_abs_path, "r") as file:
-            data = json.load(file)
-            self.app_info = data.get("app_info", {})
-            self.default_settings = data.get("default_settings", {})
-            self.supported_currencies = data.get("supported_currencies", [])
-            self.user_preferences = data.get("user_preferences", {})
-            self.user_details = data.get("user_details", {})
+        self._load()[section][key] = value
+        self._pending.setdefault(section, {})[key] = value
+        if self._batch_depth == 0:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Groups several set() calls into one write of settings.json."""
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self.save()
+
+    def save(self) -> None:
+        """Atomically writes pending changes to settings.json."""
+
+        data = self._load()
+        raw = {**self._raw, **{section: data[section] for section in self._pending}}
+        atomic_write_json(self.settings_file_abs_path, raw, indent=4)
+        self._pending = {}
+        self._raw = raw
+        self._signature = self._file_signature()
 
     def change_setting(self, setting_key: str, setting_value: Any) -> None:
         """Changes a specific setting in the configuration.
@@ -39,7 +142,7 @@ class Config:
         """
 
         if setting_key in self.default_settings:
-            self.default_settings[setting_key] = setting_value
+            self.set("default_settings", setting_key, setting_value)
             print(f"Setting '{setting_key}' updated to {setting_value}.")
 
         else:
@@ -90,18 +193,11 @@ class Config:
             else:
                 break
 
-        self.user_details["name"] = name
         if currency in self.supported_currencies:
-            self.user_preferences["currency"] = currency
+            with self.batch():
+                self.set("user_details", "name", name)
+                self.set("user_preferences", "currency", currency)
             print(f"User '{name}' setup with preferred currency '{currency}'.")
-
-            with open(self.settings_file_abs_path, "r+") as file:
-                data = json.load(file)
-                data["user_details"] = self.user_details
-                data["user_preferences"] = self.user_preferences
-                file.seek(0)
-                json.dump(data, file, indent=4)
-                file.truncate()
         else:
             print(
                 f"Currency '{currency}' is not supported. Please choose from {self.supported_currencies}."
@@ -123,3 +219,17 @@ class Config:
                 return func(*args, **kwargs)
 
         return check_initial_setup_complete
+
+
+def requires_setup(func: Callable) -> Callable:
+    """Runs the initial setup, if needed, before calling func.
+
+    Unlike `Config().setup_checker`, nothing is read when the decorated
+    function is defined: the shared Config is resolved on each call.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return Config().setup_checker(func)(*args, **kwargs)
+
+    return wrapper
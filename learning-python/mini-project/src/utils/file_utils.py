@@ -0,0 +1,30 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """Writes JSON so that readers see either the old or the new file.
+
+    The data goes to a temporary file in the same directory, is fsynced and
+    then renamed over the target, so a crash can never leave it truncated.
+
+    Args:
+        path (Path): Destination file.
+        data: JSON-serialisable value.
+        indent (int, optional): Indentation passed to json.dump.
+    """
+
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
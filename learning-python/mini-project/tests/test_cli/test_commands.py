@@ -0,0 +1,136 @@
+import io
+import json
+
+import pytest
+
+from src.cli.commands import run_command
+from src.services.transaction_service import TransactionService
+from src.utils.config import Config
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch) -> TransactionService:
+    """A TransactionService whose settings and database live in tmp_path."""
+
+    settings = {
+        "default_settings": {
+            "default_currency": "INR",
+            "storage_backend": "sqlite",
+            "data_file_path": str(tmp_path / "transactions.json"),
+            "database_file_path": str(tmp_path / "transactions.db"),
+        },
+        "supported_currencies": ["INR", "USD"],
+        "user_preferences": {"currency": "USD"},
+        "user_details": {"name": "Test"},
+    }
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps(settings))
+    monkeypatch.setattr(Config, "settings_file_abs_path", settings_path)
+    Config.reset()
+    yield TransactionService()
+    Config.reset()
+
+
+class TestCommands:
+    def test_add(self, service, capsys) -> None:
+        """add stores one transaction in the preferred currency."""
+
+        code = run_command(
+            ["add", "--amount", "12.5", "--category", "food", "--description", "Tea"],
+            service,
+        )
+
+        assert code == 0
+        assert "Added transaction 1" in capsys.readouterr().out
+        (transaction,) = service.get_transactions()
+        assert transaction["category"] == "FOOD"
+        assert transaction["currency"] == "USD"
+
+    def test_bulk_add_from_stdin_in_one_write(
+        self, service, monkeypatch, capsys
+    ) -> None:
+        """bulk-add validates every line and stores the batch with one call."""
+
+        lines = [
+            json.dumps(
+                {
+                    "amount": i + 1,
+                    "category": "FOOD",
+                    "description": f"row {i}",
+                    "date": "2025-12-01",
+                }
+            )
+            for i in range(2000)
+        ]
+        lines.append('{"amount": -1, "category": "FOOD", "description": "bad"}')
+        lines.append("not json")
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines)))
+
+        writes = []
+        add_many = service.store.storage.add_many
+        monkeypatch.setattr(
+            service.store.storage,
+            "add_many",
+            lambda rows, **kwargs: writes.append(len(rows)) or add_many(rows, **kwargs),
+        )
+
+        code = run_command(["bulk-add"], service)
+
+        assert code == 1
+        assert writes == [2000]
+        assert service.get_summary()["count"] == 2000
+        captured = capsys.readouterr()
+        assert "Added 2000 transactions" in captured.out
+        assert "Skipped 2 invalid records" in captured.err
+
+    def test_bulk_add_reports_non_scalar_fields(
+        self, service, monkeypatch, capsys
+    ) -> None:
+        """A list where a number belongs is an invalid record, not a crash."""
+
+        lines = [
+            '{"amount": [5], "category": "FOOD", "date": "2025-12-01"}',
+            '{"amount": 5, "category": "FOOD", "date": "2025-12-01"}',
+        ]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines)))
+
+        code = run_command(["bulk-add"], service)
+
+        assert code == 1
+        assert service.get_summary()["count"] == 1
+        assert "line 1:" in capsys.readouterr().err
+
+    def test_bulk_add_rejects_currencies_without_a_rate(
+        self, service, monkeypatch, capsys
+    ) -> None:
+        """A JPY record is refused up front, so summaries keep working."""
+
+        lines = [
+            '{"amount": 5, "category": "FOOD", "date": "2025-12-01", "currency": "JPY"}',
+            '{"amount": 5, "category": "FOOD", "date": "2025-12-01", "currency": "USD"}',
+        ]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines)))
+
+        code = run_command(["bulk-add"], service)
+
+        assert code == 1
+        assert "line 1: no exchange rate for currency 'JPY'" in capsys.readouterr().err
+        assert run_command(["summary", "--currency", "USD"], service) == 0
+
+    def test_export_import_and_summary(self, service, tmp_path, capsys) -> None:
+        """export then merge-import is a no-op; summary prints JSON."""
+
+        run_command(
+            ["add", "--amount", "5", "--category", "OTHER", "--description", "Pen"],
+            service,
+        )
+        csv_path = tmp_path / "out.csv"
+
+        assert run_command(["export", "--output", str(csv_path)], service) == 0
+        assert run_command(["import", str(csv_path)], service) == 0
+        capsys.readouterr()
+        assert run_command(["summary", "--json"], service) == 0
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["count"] == 1
+        assert summary["by_currency"] == {"USD": 5.0}
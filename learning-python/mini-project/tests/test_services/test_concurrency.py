@@ -0,0 +1,121 @@
+import multiprocessing
+import threading
+
+import pytest
+
+from src.services.transaction_store import TransactionStore
+from src.storage import JsonStorage, SqliteStorage
+
+WORKERS = 4
+ADDS_PER_WORKER = 40
+TRANSACTION = {
+    "amount": 1.0,
+    "category": "FOOD",
+    "description": "Lunch",
+    "date": "2025-12-14",
+}
+
+
+def open_storage(backend: str, path: str):
+    if backend == "json":
+        # small threshold so compactions race with appends too
+        return JsonStorage(path, compaction_threshold_bytes=2000)
+    return SqliteStorage(path)
+
+
+def add_transactions(backend: str, path: str, worker: int) -> None:
+    store = TransactionStore(open_storage(backend, path))
+    for i in range(ADDS_PER_WORKER):
+        store.add(
+            {
+                "amount": 1.0,
+                "category": "FOOD",
+                "description": f"worker {worker} #{i}",
+                "date": "2025-12-14",
+            }
+        )
+    store.storage.close()
+
+
+@pytest.mark.parametrize(
+    "backend, file_name", [("json", "transactions.json"), ("sqlite", "data.db")]
+)
+class TestConcurrentWriters:
+    def test_no_lost_or_duplicated_adds(self, tmp_path, backend, file_name) -> None:
+        """Processes adding at once keep every row, with unique ids."""
+
+        path = str(tmp_path / file_name)
+        open_storage(backend, path).close()
+        processes = [
+            multiprocessing.Process(
+                target=add_transactions, args=(backend, path, worker)
+            )
+            for worker in range(WORKERS)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        storage = open_storage(backend, path)
+        transactions = storage.load_all()
+        expected = WORKERS * ADDS_PER_WORKER
+
+        assert len(transactions) == expected
+        assert len({t["id"] for t in transactions}) == expected
+        assert {t["description"] for t in transactions} == {
+            f"worker {worker} #{i}"
+            for worker in range(WORKERS)
+            for i in range(ADDS_PER_WORKER)
+        }
+        assert storage.aggregates()["count"] == expected
+        assert storage.aggregates()["total"] == expected
+
+    def test_ids_are_never_reused(self, tmp_path, backend, file_name) -> None:
+        """Ids keep increasing after the newest rows are removed."""
+
+        storage = open_storage(backend, str(tmp_path / file_name))
+        add_transactions(backend, str(tmp_path / file_name), worker=0)
+        storage.replace_all(storage.load_all()[:1])
+
+        added = storage.add(
+            {
+                "amount": 1.0,
+                "category": "FOOD",
+                "description": "after",
+                "date": "2025-12-15",
+            }
+        )
+        assert added["id"] == ADDS_PER_WORKER + 1
+
+
+class TestJsonAggregatesRebuild:
+    def test_rebuild_racing_a_writer_stays_consistent(self, tmp_path) -> None:
+        """A writer landing mid-rebuild cannot leave a stale sidecar behind."""
+
+        path = tmp_path / "transactions.json"
+        JsonStorage(path).add(TRANSACTION)
+        reader, writer = JsonStorage(path), JsonStorage(path)
+        reader.summary_path.unlink()
+
+        threads = []
+        replay = reader.load_all
+
+        def load_all_then_let_writer_in():
+            transactions = replay()
+            # the second instance writes between the replay and the save
+            thread = threading.Thread(target=writer.add, args=(TRANSACTION,))
+            thread.start()
+            thread.join(timeout=0.5)
+            threads.append(thread)
+            return transactions
+
+        reader.load_all = load_all_then_let_writer_in
+        reader.aggregates()
+        threads[0].join(timeout=10)
+        assert not threads[0].is_alive()
+
+        fresh = JsonStorage(path)
+        assert len(fresh.load_all()) == 2
+        assert fresh.aggregates()["count"] == 2
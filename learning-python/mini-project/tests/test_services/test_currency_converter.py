@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from src.services.currency_converter import CurrencyConverter
+
+RATES = {
+    "base": "USD",
+    "rates": {
+        "2024-01-01": {"USD": 1.0, "EUR": 0.5, "INR": 80.0},
+        "2025-01-01": {"USD": 1.0, "EUR": 0.8, "INR": 100.0},
+    },
+}
+
+
+@pytest.fixture
+def converter(tmp_path) -> CurrencyConverter:
+    """A converter over two dated rate tables."""
+
+    path = tmp_path / "exchange_rates.json"
+    path.write_text(json.dumps(RATES))
+    return CurrencyConverter(path)
+
+
+class TestCurrencyConverter:
+    def test_cross_rates_follow_the_effective_table(self, converter) -> None:
+        """Dates use the latest table on or before them, or the first one."""
+
+        assert converter.convert(10, "EUR", "INR", on="2024-06-30") == 1600
+        assert converter.convert(10, "EUR", "INR", on="2025-01-01") == 1250
+        assert converter.convert(10, "EUR", "INR", on="2020-01-01") == 1600
+
+    def test_vectorised_column_matches_the_cross_rates(self, converter) -> None:
+        """convert_many agrees with the per-table matrices, row by row."""
+
+        dates = [
+            f"{year}-{month:02d}-01"
+            for year in (2023, 2024, 2025)
+            for month in (1, 6, 12)
+        ] * 4
+        currencies = ["USD", "EUR", "INR"] * 12
+        amounts = [float(i) for i in range(36)]
+
+        converted = converter.convert_many(amounts, currencies, "EUR", dates)
+
+        assert converted == [
+            amount * converter.cross_rates(on)[currency]["EUR"]
+            for amount, currency, on in zip(amounts, currencies, dates)
+        ]
+        assert converter.convert_many([], [], "USD") == []
+
+    def test_convert_transactions_uses_each_date(self, converter) -> None:
+        """Transactions without a currency are treated as INR."""
+
+        converted = converter.convert_transactions(
+            [
+                {"amount": 80.0, "date": "2024-03-01"},
+                {"amount": 1.0, "date": "2025-03-01", "currency": "USD"},
+            ],
+            "USD",
+        )
+        assert converted == [1.0, 1.0]
+
+    def test_convert_totals_sums_per_group(self, converter) -> None:
+        """'<group>|<currency>' totals collapse into one column."""
+
+        totals = {"FOOD|USD": 1.0, "FOOD|INR": 100.0, "RENT|EUR": 8.0}
+        assert converter.convert_totals(totals, "USD", on="2025-06-01") == {
+            "FOOD": 2.0,
+            "RENT": 10.0,
+        }
+
+    def test_unknown_currency(self, converter) -> None:
+        """Currencies without a rate raise ValueError."""
+
+        with pytest.raises(ValueError):
+            converter.convert(1, "JPY", "USD")
+        with pytest.raises(ValueError, match=r"^No exchange rate for currency 'JPY'$"):
+            converter.convert_many([1.0, 2.0], ["USD", "JPY"], "EUR")
+        with pytest.raises(ValueError, match=r"^No exchange rate for currency 'JPY'$"):
+            converter.convert_many([1.0], ["USD"], "JPY")
@@ -0,0 +1,101 @@
+import pytest
+
+from src.services.transaction_service import TransactionService
+from src.services.transaction_store import TransactionStore
+from src.storage import SqliteStorage
+
+
+@pytest.fixture
+def service(tmp_path) -> TransactionService:
+    """A TransactionService over a fresh SQLite store with 50 rows."""
+
+    store = TransactionStore(SqliteStorage(tmp_path / "transactions.db"))
+    for i in range(1, 51):
+        store.add(
+            {
+                "amount": float(i * 10),
+                "category": "FOOD" if i % 2 else "TRANSPORT",
+                "description": f"row {i}",
+                "date": f"2025-{(i - 1) // 28 + 1:02d}-{(i - 1) % 28 + 1:02d}",
+            }
+        )
+    service = TransactionService.__new__(TransactionService)
+    service.store = store
+    return service
+
+
+class TestQueryTransactions:
+    def test_pages_in_date_order(self, service) -> None:
+        """Pages follow the date index and report whether more remain."""
+
+        first = service.query_transactions(page_size=20)
+        last = service.query_transactions(page=3, page_size=20)
+
+        assert [t["id"] for t in first["items"]] == list(range(1, 21))
+        assert first["has_next"]
+        assert [t["id"] for t in last["items"]] == list(range(41, 51))
+        assert not last["has_next"]
+
+    def test_filters_combine(self, service) -> None:
+        """Date range, category and amount range filters all apply."""
+
+        result = service.query_transactions(
+            start_date="2025-01-10",
+            end_date="2025-02-05",
+            category="FOOD",
+            min_amount=150,
+            sort_by="amount",
+            descending=True,
+        )
+
+        amounts = [t["amount"] for t in result["items"]]
+        assert amounts == sorted(amounts, reverse=True)
+        assert all(t["category"] == "FOOD" for t in result["items"])
+        assert all("2025-01-10" <= t["date"] <= "2025-02-05" for t in result["items"])
+        assert min(amounts) >= 150
+
+    def test_stops_walking_once_page_is_full(self, service) -> None:
+        """Only the rows needed for the page are visited."""
+
+        visited = []
+        original = service.store.by_id.__class__.__getitem__
+
+        class CountingDict(dict):
+            def __getitem__(self, key):
+                visited.append(key)
+                return original(self, key)
+
+        service.store.by_id = CountingDict(service.store.by_id)
+        service.query_transactions(page_size=5)
+
+        assert len(visited) == 6
+
+    def test_rejects_unknown_sort_field(self, service) -> None:
+        """Unsupported sort fields raise ValueError."""
+
+        with pytest.raises(ValueError):
+            service.query_transactions(sort_by="description")
+
+
+class TestSummary:
+    def test_summary_in_reporting_currency(self, service) -> None:
+        """Mixed-currency totals are converted per category."""
+
+        service.store.add(
+            {
+                "amount": 10.0,
+                "category": "FOOD",
+                "description": "abroad",
+                "date": "2025-12-20",
+                "currency": "USD",
+            }
+        )
+        native = service.get_summary()
+        converted = service.get_summary(currency="INR", on="2025-12-31")
+
+        assert native["by_currency"]["USD"] == 10.0
+        assert converted["currency"] == "INR"
+        assert converted["by_category"]["FOOD"] == pytest.approx(
+            native["by_category"]["FOOD"] - 10.0 + 10.0 * 89.9
+        )
+        assert converted["total"] == pytest.approx(native["total"] - 10.0 + 899.0)
@@ -0,0 +1,100 @@
+import json
+
+from src.services.transaction_store import TransactionStore
+from src.storage import JsonStorage, SqliteStorage
+from src.storage.aggregates import compute_aggregates
+
+TRANSACTION = {
+    "amount": 100.0,
+    "category": "FOOD",
+    "description": "Lunch",
+    "date": "2025-12-14",
+}
+
+
+class TestTransactionStore:
+    def test_loads_once_until_data_changes(self, tmp_path) -> None:
+        """Reads are served from memory until the file changes on disk."""
+
+        storage = JsonStorage(tmp_path / "transactions.json")
+        store = TransactionStore(storage)
+        store.add(TRANSACTION)
+
+        for _ in range(3):
+            assert len(store.transactions) == 1
+        assert store.loads == 1
+
+        # another writer replaces the snapshot behind the store's back
+        other = {"id": 7, **TRANSACTION, "category": "OTHER"}
+        (tmp_path / "transactions.json").write_text(json.dumps([other]))
+        storage.journal_path.unlink()
+
+        assert store.transactions == [other]
+        assert store.loads == 2
+        assert list(store.by_category) == ["OTHER"]
+
+    def test_indexes_follow_adds(self, tmp_path) -> None:
+        """Adds through the store update the indexes without a reload."""
+
+        store = TransactionStore(SqliteStorage(tmp_path / "transactions.db"))
+        first = store.add(TRANSACTION)
+        second = store.add({**TRANSACTION, "date": "2026-01-02"})
+
+        assert store.by_id[second["id"]] == second
+        assert store.by_month["2025-12"] == [first]
+        assert store.by_category["FOOD"] == [first, second]
+        assert store.loads == 1
+
+    def test_sees_writes_from_another_connection(self, tmp_path) -> None:
+        """A commit by a second SQLite connection invalidates the cache."""
+
+        store = TransactionStore(SqliteStorage(tmp_path / "transactions.db"))
+        store.add(TRANSACTION)
+        assert len(store.transactions) == 1
+
+        other = SqliteStorage(tmp_path / "transactions.db")
+        other.add(TRANSACTION)
+        other.close()
+
+        assert len(store.transactions) == 2
+
+
+class TestAggregates:
+    def test_backends_agree_with_a_full_recompute(self, tmp_path) -> None:
+        """Running totals match compute_aggregates over the stored rows."""
+
+        rows = [
+            {**TRANSACTION, "amount": 10.0 * i, "date": f"2025-{i % 12 + 1:02d}-01"}
+            for i in range(1, 30)
+        ]
+        for storage in (
+            JsonStorage(tmp_path / "t.json", compaction_threshold_bytes=1000),
+            SqliteStorage(tmp_path / "t.db"),
+        ):
+            store = TransactionStore(storage)
+            for row in rows:
+                store.add(row)
+            assert storage.aggregates() == compute_aggregates(storage.load_all())
+            assert storage.aggregates()["count"] == len(rows)
+
+    def test_replace_all_resets_totals(self, tmp_path) -> None:
+        """Imports rebuild the totals, including removed categories."""
+
+        storage = SqliteStorage(tmp_path / "t.db")
+        storage.add(TRANSACTION)
+        storage.replace_all([{"id": 1, **TRANSACTION, "category": "OTHER"}])
+
+        aggregates = storage.aggregates()
+        assert list(aggregates["by_category"]) == ["OTHER"]
+        assert aggregates["count"] == 1
+
+    def test_stale_sidecar_is_rebuilt(self, tmp_path) -> None:
+        """A journal written without its sidecar update is detected."""
+
+        storage = JsonStorage(tmp_path / "t.json")
+        storage.add(TRANSACTION)
+        with open(storage.journal_path, "a") as f:
+            f.write(json.dumps({"id": 2, **TRANSACTION}) + "\n")
+
+        reopened = JsonStorage(tmp_path / "t.json")
+        assert reopened.aggregates()["count"] == 2
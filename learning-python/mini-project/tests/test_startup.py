@@ -0,0 +1,103 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+# cumulative import time allowed for reaching the main menu, in microseconds
+IMPORT_BUDGET_US = 50_000
+# modules that must not load until a menu actually needs them
+LAZY_MODULES = [
+    "tkinter",
+    "sqlite3",
+    "src.cli.main_menu",
+    "src.cli.add_record_menu",
+    "src.cli.view_transactions_menu",
+    "src.cli.view_summary_menu",
+    "src.cli.export_import_menu",
+    "src.cli.currency_convertor_menu",
+    "src.cli.settings_menu",
+    "src.services.transaction_service",
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def run_importtime(statement: str) -> List[Tuple[int, str, int]]:
+    """Runs statement under `python -X importtime`.
+
+    Returns (nesting depth, module, cumulative µs) per imported module.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            entries.append((len(match.group(3)), match.group(4), int(match.group(2))))
+    return entries
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Module -> cumulative µs for everything statement imports."""
+
+    return {module: micros for _, module, micros in run_importtime(statement)}
+
+
+def src_import_time(statement: str) -> int:
+    """Total µs spent in top-level imports of `src` modules.
+
+    Lazily resolved modules (src.cli.main_menu via src.cli.__getattr__)
+    show up as separate top-level entries, so they are summed too.
+    """
+
+    entries = run_importtime(statement)
+    top = min(depth for depth, _, _ in entries)
+    return sum(
+        micros
+        for depth, module, micros in entries
+        if depth == top and (module == "src" or module.startswith("src."))
+    )
+
+
+class TestStartup:
+    def test_cold_start_within_budget(self) -> None:
+        """Loading the main menu, as src.main does, stays under budget."""
+
+        elapsed = src_import_time("from src.cli import MainMenu")
+
+        assert (
+            elapsed < IMPORT_BUDGET_US
+        ), f"reaching MainMenu took {elapsed} µs (budget {IMPORT_BUDGET_US} µs)"
+
+    def test_menus_and_gui_toolkit_are_lazy(self) -> None:
+        """Neither tkinter nor any menu or service loads at startup."""
+
+        times = import_times("import src.main")
+
+        assert [module for module in LAZY_MODULES if module in times] == []
+
+    def test_main_menu_still_resolves(self) -> None:
+        """src.cli.MainMenu is available on first attribute access."""
+
+        times = import_times("from src.cli import MainMenu")
+
+        assert "src.cli.main_menu" in times
+        assert "tkinter" not in times
+
+    def test_single_conversion_skips_numpy(self) -> None:
+        """The converter menu's one-amount path stays in plain Python."""
+
+        times = import_times(
+            "from src.services.currency_converter import get_currency_converter; "
+            "get_currency_converter().convert(1, 'USD', 'INR')"
+        )
+
+        assert "numpy" not in times
@@ -0,0 +1,135 @@
+from src.services.transaction_service import TransactionService
+from src.services.transaction_store import TransactionStore
+from src.storage import JsonStorage, SqliteStorage
+from src.storage.csv_handler import read_csv_chunks, validate_rows
+
+CSV_TEXT = """id,amount,category,description,date
+1,10.0,FOOD,Snacks,2025-12-12
+2,20.0,TRANSPORT,Bus,2025-12-12
+2,20.0,TRANSPORT,Bus again,2025-12-12
+,30.0,food,No id,2025-12-13
+4,-5,FOOD,Negative,2025-12-13
+5,abc,FOOD,Not a number,2025-12-13
+6,15.0,FOOD,Bad date,12/13/2025
+"""
+
+
+def make_service(storage) -> TransactionService:
+    service = TransactionService.__new__(TransactionService)
+    service.store = TransactionStore(storage)
+    return service
+
+
+class TestCsvHandler:
+    def test_reads_in_chunks_with_line_numbers(self, tmp_path) -> None:
+        """Chunks hold at most chunk_size rows and keep source line numbers."""
+
+        path = tmp_path / "in.csv"
+        path.write_text(CSV_TEXT)
+
+        chunks = list(read_csv_chunks(path, chunk_size=3))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert chunks[0][0][0] == 2
+
+    def test_validate_rows_reports_each_bad_row(self, tmp_path) -> None:
+        """Negative, non-numeric and badly dated rows are rejected."""
+
+        path = tmp_path / "in.csv"
+        path.write_text(CSV_TEXT)
+        rows = [row for chunk in read_csv_chunks(path) for row in chunk]
+
+        valid, errors = validate_rows(rows)
+
+        assert len(valid) == 4
+        assert valid[3] == {
+            "amount": 30.0,
+            "category": "FOOD",
+            "description": "No id",
+            "date": "2025-12-13",
+        }
+        assert [error.split(":")[0] for error in errors] == [
+            "line 6",
+            "line 7",
+            "line 8",
+        ]
+
+    def test_validate_rows_rejects_non_finite_amounts(self) -> None:
+        """nan and infinities would poison every aggregate."""
+
+        rows = [
+            (line, {"amount": amount, "category": "FOOD", "date": "2025-12-12"})
+            for line, amount in enumerate(["nan", "inf", "-inf", "1.5"], start=2)
+        ]
+
+        valid, errors = validate_rows(rows)
+
+        assert [t["amount"] for t in valid] == [1.5]
+        assert [error.split(":")[0] for error in errors] == [
+            "line 2",
+            "line 3",
+            "line 4",
+        ]
+
+    def test_validate_rows_checks_currencies_against_the_rates(self) -> None:
+        """Well-formed codes outside the rate table are invalid rows."""
+
+        rows = [
+            (
+                2,
+                {
+                    "amount": "1",
+                    "category": "FOOD",
+                    "date": "2025-12-12",
+                    "currency": "jpy",
+                },
+            ),
+            (
+                3,
+                {
+                    "amount": "1",
+                    "category": "FOOD",
+                    "date": "2025-12-12",
+                    "currency": "usd",
+                },
+            ),
+        ]
+
+        valid, errors = validate_rows(rows, currencies=["INR", "USD"])
+
+        assert [t["currency"] for t in valid] == ["USD"]
+        assert errors == ["line 2: no exchange rate for currency 'JPY'"]
+
+
+class TestImportExport:
+    def test_merge_skips_duplicate_ids(self, tmp_path) -> None:
+        """Merge keeps ids, skips known ones and appends rows without id."""
+
+        path = tmp_path / "in.csv"
+        path.write_text(CSV_TEXT)
+        for storage in (
+            SqliteStorage(tmp_path / "t.db"),
+            JsonStorage(tmp_path / "t.json"),
+        ):
+            service = make_service(storage)
+            report = service.import_csv(path, mode="merge", chunk_size=2)
+            again = service.import_csv(path, mode="merge", chunk_size=2)
+
+            assert (report.rows_read, report.imported) == (7, 3)
+            assert (report.duplicates, report.invalid) == (1, 3)
+            assert again.imported == 1
+            assert [t["id"] for t in storage.load_all()] == [1, 2, 3, 4]
+
+    def test_append_then_export_round_trip(self, tmp_path) -> None:
+        """Append assigns fresh ids; export writes every stored row."""
+
+        path = tmp_path / "in.csv"
+        path.write_text(CSV_TEXT)
+        service = make_service(SqliteStorage(tmp_path / "t.db"))
+
+        service.import_csv(path, mode="append")
+        service.import_csv(path, mode="append")
+        written = service.export_csv(tmp_path / "out.csv", chunk_size=3)
+
+        assert written == 8
+        assert service.get_summary()["count"] == 8
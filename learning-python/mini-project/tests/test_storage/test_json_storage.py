@@ -0,0 +1,64 @@
+import json
+
+from src.storage import JsonStorage
+
+TRANSACTION = {
+    "amount": 100.0,
+    "category": "FOOD",
+    "description": "Lunch",
+    "date": "2025-12-14",
+}
+
+
+class TestJsonStorage:
+    def test_add_appends_to_journal_only(self, tmp_path) -> None:
+        """Adds leave the snapshot untouched and write one journal line."""
+
+        storage = JsonStorage(tmp_path / "transactions.json")
+        snapshot = storage.file_path.read_text()
+
+        storage.add(TRANSACTION)
+        storage.add(TRANSACTION)
+
+        assert storage.file_path.read_text() == snapshot
+        assert len(storage.journal_path.read_text().splitlines()) == 2
+        assert [t["id"] for t in storage.load_all()] == [1, 2]
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path) -> None:
+        """Passing the threshold rewrites the snapshot and removes the journal."""
+
+        storage = JsonStorage(
+            tmp_path / "transactions.json", compaction_threshold_bytes=200
+        )
+        for _ in range(5):
+            storage.add(TRANSACTION)
+
+        snapshot = json.loads(storage.file_path.read_text())
+        assert len(snapshot) + len(storage._load_journal()) == 5
+        assert [t["id"] for t in storage.load_all()] == [1, 2, 3, 4, 5]
+
+    def test_replay_tolerates_crashes(self, tmp_path) -> None:
+        """A torn journal line and already-compacted records are ignored."""
+
+        storage = JsonStorage(tmp_path / "transactions.json")
+        first = storage.add(TRANSACTION)
+        storage.replace_all([first])
+        with open(storage.journal_path, "w") as f:
+            f.write(json.dumps(first) + "\n")
+            f.write('{"id": 2, "amou')
+
+        reopened = JsonStorage(tmp_path / "transactions.json")
+        assert reopened.load_all() == [first]
+        assert reopened.add(TRANSACTION)["id"] == 2
+        assert [t["id"] for t in reopened.load_all()] == [1, 2]
+
+    def test_kept_ids_below_existing_load_in_id_order(self, tmp_path) -> None:
+        """Merged rows with lower ids still come back ordered by id."""
+
+        storage = JsonStorage(tmp_path / "transactions.json")
+        storage.replace_all([{"id": 1, **TRANSACTION}, {"id": 3, **TRANSACTION}])
+        storage.add_many([{"id": 2, **TRANSACTION}], keep_ids=True)
+
+        reopened = JsonStorage(tmp_path / "transactions.json")
+        assert [t["id"] for t in reopened.load_all()] == [1, 2, 3]
+        assert reopened.add(TRANSACTION)["id"] == 4
@@ -0,0 +1,123 @@
+import json
+import sqlite3
+
+from src.storage import JsonStorage, SqliteStorage, get_storage
+from src.storage.sqlite_storage import JSON_MIGRATION_KEY
+
+LEGACY_TRANSACTIONS = [
+    {
+        "id": 1,
+        "amount": 1000.0,
+        "category": "FOOD",
+        "description": "Snacks",
+        "date": "2025-12-12",
+    },
+    {
+        "id": 2,
+        "amount": 5000.0,
+        "category": "TRANSPORT",
+        "description": "bus card",
+        "date": "2025-12-12",
+    },
+]
+
+NEW_TRANSACTION = {
+    "amount": 250.0,
+    "category": "OTHER",
+    "description": "Stationery",
+    "date": "2025-12-13",
+}
+
+
+class TestSqliteStorage:
+    def test_migrates_legacy_json_once(self, tmp_path) -> None:
+        """Existing JSON rows are imported once and the JSON file is kept."""
+
+        json_path = tmp_path / "transactions.json"
+        json_path.write_text(json.dumps(LEGACY_TRANSACTIONS))
+
+        storage = SqliteStorage(tmp_path / "transactions.db", json_path)
+        assert storage.load_all() == LEGACY_TRANSACTIONS
+        assert json.loads(storage.get_metadata(JSON_MIGRATION_KEY))["count"] == 2
+        storage.close()
+
+        reopened = SqliteStorage(tmp_path / "transactions.db", json_path)
+        assert reopened.load_all() == LEGACY_TRANSACTIONS
+        reopened.close()
+        assert json_path.exists()
+
+    def test_add_assigns_next_id(self, tmp_path) -> None:
+        """Adds continue the id sequence after migrated rows."""
+
+        json_path = tmp_path / "transactions.json"
+        json_path.write_text(json.dumps(LEGACY_TRANSACTIONS))
+        storage = SqliteStorage(tmp_path / "transactions.db", json_path)
+
+        added = storage.add(NEW_TRANSACTION)
+
+        assert added == {"id": 3, **NEW_TRANSACTION}
+        assert storage.load_all()[-1] == added
+        storage.close()
+
+    def test_indexes_exist(self, tmp_path) -> None:
+        """Date and category lookups are backed by indexes."""
+
+        storage = SqliteStorage(tmp_path / "transactions.db")
+        names = {
+            row["name"]
+            for row in storage.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {"idx_transactions_date", "idx_transactions_category"} <= names
+        storage.close()
+
+    def test_upgrades_databases_without_currency(self, tmp_path) -> None:
+        """Older databases gain the currency column and rebuilt totals."""
+
+        db_path = tmp_path / "transactions.db"
+        connection = sqlite3.connect(db_path)
+        connection.executescript(
+            "CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "amount REAL NOT NULL, category TEXT NOT NULL, "
+            "description TEXT NOT NULL, date TEXT NOT NULL);"
+            "INSERT INTO transactions VALUES (1, 10.0, 'FOOD', 'Old', '2025-01-01');"
+        )
+        connection.close()
+
+        storage = SqliteStorage(db_path)
+        storage.add({**NEW_TRANSACTION, "currency": "USD"})
+
+        assert storage.load_all()[0] == {
+            "id": 1,
+            "amount": 10.0,
+            "category": "FOOD",
+            "description": "Old",
+            "date": "2025-01-01",
+        }
+        assert storage.load_all()[1]["currency"] == "USD"
+        assert storage.aggregates()["by_currency"] == {
+            "INR": {"total": 10.0, "count": 1},
+            "USD": {"total": 250.0, "count": 1},
+        }
+        storage.close()
+
+
+class TestGetStorage:
+    def test_selects_backend_from_settings(self, tmp_path) -> None:
+        """storage_backend picks the backend; paths resolve from settings."""
+
+        json_storage = get_storage(
+            {"storage_backend": "json", "data_file_path": str(tmp_path / "t.json")}
+        )
+        sqlite_storage = get_storage(
+            {
+                "storage_backend": "sqlite",
+                "data_file_path": str(tmp_path / "t.json"),
+                "database_file_path": str(tmp_path / "t.db"),
+            }
+        )
+
+        assert isinstance(json_storage, JsonStorage)
+        assert isinstance(sqlite_storage, SqliteStorage)
+        sqlite_storage.close()
@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from src.utils.config import Config
+
+SETTINGS = {
+    "app_info": {"name": "Expense Tracker CLI"},
+    "default_settings": {"default_currency": "INR"},
+    "supported_currencies": ["INR", "USD"],
+    "user_preferences": {"currency": "INR"},
+    "user_details": {"name": "Rohit"},
+}
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Points the shared Config at a temporary settings.json."""
+
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps(SETTINGS))
+    monkeypatch.setattr(Config, "settings_file_abs_path", path)
+    Config.reset()
+    yield path
+    Config.reset()
+
+
+class TestConfig:
+    def test_single_lazy_instance(self, settings_file) -> None:
+        """Config() is shared and parses the file once, on first use."""
+
+        config = Config()
+        assert config.reads == 0
+        assert Config() is config
+
+        for _ in range(5):
+            assert Config().user_details["name"] == "Rohit"
+        assert config.reads == 1
+
+    def test_reloads_when_file_changes(self, settings_file) -> None:
+        """An edit by another process is picked up on next access."""
+
+        config = Config()
+        assert config.user_preferences["currency"] == "INR"
+
+        changed = {**SETTINGS, "user_preferences": {"currency": "USD"}}
+        settings_file.write_text(json.dumps(changed, indent=2))
+        stat = settings_file.stat()
+        os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        assert config.user_preferences["currency"] == "USD"
+        assert config.reads == 2
+
+    def test_batch_writes_once(self, settings_file) -> None:
+        """Changes inside batch() reach the file in one write."""
+
+        config = Config()
+        with config.batch():
+            config.set("user_details", "name", "Asha")
+            config.set("user_preferences", "currency", "USD")
+            assert json.loads(settings_file.read_text()) == SETTINGS
+
+        saved = json.loads(settings_file.read_text())
+        assert saved["user_details"] == {"name": "Asha"}
+        assert saved["user_preferences"] == {"currency": "USD"}
+        assert saved["app_info"] == SETTINGS["app_info"]
+        assert config.reads == 1
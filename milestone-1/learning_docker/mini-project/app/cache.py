@@ -0,0 +1,149 @@
+"""Response cache for the employee read endpoints.
+
+Entries are keyed by a cache generation plus the query. Writes bump the
+generation instead of deleting keys, so a write invalidates every cached
+query at once, and a response built from data read before the write is
+stored under the old generation, where nobody looks for it.
+
+MemoryCache is per process: with several workers, another worker's
+writes only show up once the entry's TTL expires. Set REDIS_URL to
+share one cache (and its generation) between all workers.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Awaitable, Callable, Optional, Tuple, Union
+
+from fastapi import Request, Response
+
+from settings import get_settings
+
+KEY_PREFIX = "employee-cache"
+
+
+class MemoryCache:
+    """In-process LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._generation = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self) -> None:
+        self._generation += 1
+        # older generations can never be read again
+        self._entries.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisCache:
+    """Cache shared through Redis (or anything with its async get/set/incr)."""
+
+    def __init__(self, client, ttl: float, prefix: str = KEY_PREFIX) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def generation(self) -> int:
+        return int(await self.client.get(f"{self.prefix}:generation") or 0)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(f"{self.prefix}:{key}")
+
+    async def set(self, key: str, value: bytes) -> None:
+        # stale generations simply expire
+        await self.client.set(f"{self.prefix}:{key}", value, ex=max(1, int(self.ttl)))
+
+    async def invalidate(self) -> None:
+        await self.client.incr(f"{self.prefix}:generation")
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+Cache = Union[MemoryCache, RedisCache]
+
+
+@lru_cache
+def get_cache() -> Cache:
+    """Dependency returning the configured cache (created on first use)."""
+
+    settings = get_settings()
+    if settings.redis_url:
+        # optional dependency, only needed when REDIS_URL is set
+        import redis.asyncio as redis
+
+        return RedisCache(redis.from_url(settings.redis_url), settings.cache_ttl)
+    return MemoryCache(settings.cache_max_entries, settings.cache_ttl)
+
+
+async def close_cache() -> None:
+    """Releases the cache's connections (on shutdown)."""
+
+    if get_cache.cache_info().currsize:
+        await get_cache().close()
+        get_cache.cache_clear()
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # weak comparison, as RFC 9110 asks for If-None-Match
+    return "*" in candidates or etag in [tag.removeprefix("W/") for tag in candidates]
+
+
+async def cached_json(
+    request: Request, cache: Cache, key: str, build: Callable[[], Awaitable[bytes]]
+) -> Response:
+    """Serves a JSON body from the cache, building and storing it on a miss.
+
+    The body's ETag is stored with it; a request whose If-None-Match
+    carries that ETag gets an empty 304 without the body being sent.
+    """
+
+    cache_key = f"{await cache.generation()}:{key}"
+    entry = await cache.get(cache_key)
+    if entry is None:
+        body = await build()
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'.encode()
+        entry = etag + b" " + body
+        await cache.set(cache_key, entry)
+
+    etag, body = entry.decode().split(" ", 1)
+    # clients must revalidate, which a matching ETag makes cheap
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
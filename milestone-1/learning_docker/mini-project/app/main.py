@@ -1,28 +1,293 @@
-from fastapi import FastAPI, Depends
-from sqlalchemy.orm import Session
+import json
+import re
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
-from schemas.employee import Employee_Response, Add_Employee, All_Employees_Response
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from schemas.employee import (
+    Employee_Response,
+    Add_Employee,
+    All_Employees_Response,
+    Bulk_Employees_Response,
+    Department_Counts_Response,
+)
+from schemas.metrics import Pool_Status_Response
 from models.employee import Employee
-from db import get_db_session
+from db import dispose_engine, get_db_session, get_sessionmaker, pool_status
+from cache import Cache, cached_json, close_cache, get_cache
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# rows fetched from the server-side cursor per round-trip
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
+# rows per INSERT ... RETURNING statement (and per commit) in bulk adds
+BULK_CHUNK_SIZE = 1000
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await dispose_engine()
+    await close_cache()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/employee", response_model=All_Employees_Response)
-def get_all_employees(db: Session = Depends(get_db_session)):
-    """Fetch all employees from the database."""
+async def get_all_employees(
+    request: Request,
+    after_id: Optional[int] = Query(None, description="Cursor: last id seen"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    department: Optional[str] = Query(None, description="Exact department"),
+    name_prefix: Optional[str] = Query(None, min_length=1),
+    db: AsyncSession = Depends(get_db_session),
+    cache: Cache = Depends(get_cache),
+):
+    """Fetch one page of employees, ordered by id.
+
+    Pass the returned next_cursor as after_id to get the next page; it is
+    null on the last page. Each page is an index range scan (on the
+    primary key, or on the department / name index when filtering), so
+    late pages cost the same as the first. Pages are cached until the next
+    write (see cache.py).
+    """
+
+    async def build() -> bytes:
+        query = select(Employee).order_by(Employee.id).limit(limit + 1)
+        if after_id is not None:
+            query = query.where(Employee.id > after_id)
+        if department is not None:
+            query = query.where(Employee.department == department)
+        if name_prefix is not None:
+            # a literal pattern (not prefix || '%') so the planner sees the prefix
+            escaped = re.sub(r"([\\%_])", r"\\\1", name_prefix)
+            query = query.where(Employee.name.like(escaped + "%", escape="\\"))
+        results = (await db.scalars(query)).all()
+
+        # the extra row only tells us whether another page exists
+        next_cursor = results[limit - 1].id if len(results) > limit else None
+        page = All_Employees_Response.model_validate(
+            {"employees": results[:limit], "next_cursor": next_cursor},
+            from_attributes=True,
+        )
+        return page.model_dump_json().encode()
+
+    # JSON keeps None apart from "None" and values containing separators
+    key = "list:" + json.dumps([department, name_prefix, after_id, limit])
+    return await cached_json(request, cache, key, build)
+
+
+async def _export_rows(export_format: str) -> AsyncIterator[str]:
+    """Serialises employees straight from a server-side cursor.
+
+    Rows are read EXPORT_BATCH_SIZE at a time and dumped as plain dicts,
+    so memory stays flat however large the table is. The stream owns its
+    session, which lives until the last row is sent.
+    """
+
+    columns = select(Employee.id, Employee.name, Employee.department).order_by(
+        Employee.id
+    )
+    async with get_sessionmaker()() as session:
+        result = await session.stream(
+            columns.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        first = True
+        if export_format == "json":
+            yield "["
+        async for batch in result.partitions():
+            rows = [json.dumps(dict(row._mapping)) for row in batch]
+            if export_format == "json":
+                yield ("" if first else ",") + ",".join(rows)
+            else:
+                yield "\n".join(rows) + "\n"
+            first = False
+        if export_format == "json":
+            yield "]"
+
+
+@app.get("/employee/export")
+async def export_employees(
+    export_format: Literal["ndjson", "json"] = Query("ndjson", alias="format"),
+):
+    """Stream every employee as NDJSON (default) or a single JSON array."""
+
+    return StreamingResponse(
+        _export_rows(export_format), media_type=EXPORT_MEDIA_TYPES[export_format]
+    )
+
+
+@app.get("/employee/departments", response_model=Department_Counts_Response)
+async def get_department_counts(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    cache: Cache = Depends(get_cache),
+):
+    """Headcount per department, counted in the database.
+
+    The GROUP BY walks the department index, so no rows reach Python.
+    """
+
+    async def build() -> bytes:
+        query = (
+            select(Employee.department, func.count().label("count"))
+            .group_by(Employee.department)
+            .order_by(Employee.department)
+        )
+        rows = (await db.execute(query)).all()
+        counts = Department_Counts_Response(
+            departments=[dict(row._mapping) for row in rows]
+        )
+        return counts.model_dump_json().encode()
+
+    return await cached_json(request, cache, "departments", build)
 
-    employee = db.query(Employee)
-    results = employee.all()
-    return {"employees": results}
+
+# declared after the static /employee/... routes so they match first
+@app.get("/employee/{employee_id}", response_model=Employee_Response)
+async def get_employee(
+    employee_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    cache: Cache = Depends(get_cache),
+):
+    """Fetch one employee by id (a primary key lookup)."""
+
+    async def build() -> bytes:
+        employee = await db.get(Employee, employee_id)
+        if employee is None:
+            raise HTTPException(status_code=404, detail="Employee not found")
+        found = Employee_Response.model_validate(employee, from_attributes=True)
+        return found.model_dump_json().encode()
+
+    return await cached_json(request, cache, f"employee:{employee_id}", build)
 
 
 @app.post("/employee", response_model=Employee_Response)
-def add_employee(request_data: Add_Employee, db: Session = Depends(get_db_session)):
+async def add_employee(
+    request_data: Add_Employee,
+    db: AsyncSession = Depends(get_db_session),
+    cache: Cache = Depends(get_cache),
+):
     """Add a new employee to the database."""
 
     new_employee = Employee(name=request_data.name, department=request_data.department)
     db.add(new_employee)
-    db.commit()
-    db.refresh(new_employee)
+    await db.commit()
+    await cache.invalidate()
+    await db.refresh(new_employee)
     return new_employee
+
+
+@app.get("/metrics/pool", response_model=Pool_Status_Response)
+async def get_pool_metrics():
+    """Connection pool occupancy and checkout counters."""
+
+    return pool_status()
+
+
+async def _bulk_items(request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    """Yields (row index, raw item) from a JSON array or an NDJSON body.
+
+    NDJSON is split as it arrives, so its rows reach the database before
+    the upload has finished; NDJSON items are the undecoded lines.
+    """
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != EXPORT_MEDIA_TYPES["ndjson"]:
+        try:
+            items = json.loads(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body is not valid JSON")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=422, detail="Expected a JSON array")
+        for index, item in enumerate(items):
+            yield index, item
+        return
+
+    index, pending = 0, b""
+    async for data in request.stream():
+        *lines, pending = (pending + data).split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield index, line
+                index += 1
+    if pending.strip():
+        yield index, pending
+
+
+async def _insert_chunk(
+    db: AsyncSession, cache: Cache, chunk: List[Tuple[int, Dict]], report: Dict
+) -> None:
+    """Inserts one chunk with a single INSERT ... RETURNING and commits it.
+
+    A failing chunk is rolled back and reported; earlier chunks stay.
+    """
+
+    statement = insert(Employee).returning(Employee.id, sort_by_parameter_order=True)
+    try:
+        ids = (await db.scalars(statement, [row for _, row in chunk])).all()
+        await db.commit()
+        await cache.invalidate()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        report["failed_chunks"].append(
+            {
+                "first_index": chunk[0][0],
+                "last_index": chunk[-1][0],
+                "count": len(chunk),
+                "error": str(getattr(exc, "orig", None) or exc),
+            }
+        )
+        return
+    report["ids"].extend(ids)
+    report["inserted"] += len(ids)
+
+
+@app.post("/employee/bulk", response_model=Bulk_Employees_Response)
+async def add_employees_bulk(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    cache: Cache = Depends(get_cache),
+):
+    """Add many employees from a JSON array or an NDJSON body.
+
+    Each item has the POST /employee fields. Valid rows are inserted
+    BULK_CHUNK_SIZE at a time, one statement and commit per chunk. Invalid
+    rows and failed chunks are listed in the response instead of failing
+    the whole request.
+    """
+
+    report = {"inserted": 0, "ids": [], "invalid_rows": [], "failed_chunks": []}
+    chunk: List[Tuple[int, Dict]] = []
+    async for index, item in _bulk_items(request):
+        try:
+            if isinstance(item, bytes):
+                employee = Add_Employee.model_validate_json(item)
+            else:
+                employee = Add_Employee.model_validate(item)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            message = error["msg"]
+            if error["loc"]:
+                message = ".".join(map(str, error["loc"])) + ": " + message
+            report["invalid_rows"].append({"index": index, "error": message})
+            continue
+
+        chunk.append(
+            (index, {"name": employee.name, "department": employee.department})
+        )
+        if len(chunk) >= BULK_CHUNK_SIZE:
+            await _insert_chunk(db, cache, chunk, report)
+            chunk = []
+    if chunk:
+        await _insert_chunk(db, cache, chunk, report)
+    return report
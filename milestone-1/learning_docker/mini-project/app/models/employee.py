@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from sqlalchemy.orm import declarative_base
 
 base = declarative_base()
@@ -8,6 +8,18 @@ class Employee(base):
     """Model for the employees table."""
 
     __tablename__ = "employees"
+    # (column, id) pairs serve the filters in id order for keyset paging;
+    # text_pattern_ops lets PostgreSQL use the name index for LIKE 'x%'
+    # whatever the database collation. Mirrored in db/script.sql.
+    __table_args__ = (
+        Index("ix_employees_department_id", "department", "id"),
+        Index(
+            "ix_employees_name_id",
+            "name",
+            "id",
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, nullable=False)
     name = Column(String, nullable=False)
@@ -20,9 +20,25 @@ class All_Employees_Response(BaseModel):
     """Schema for all employees response."""
 
     employees: list[Employee_Response]
+    next_cursor: Optional[int] = Field(
+        None, description="after_id for the next page; null on the last page"
+    )
 
     def __repr__(self):
-        return f"All_Employees_Response(employees={self.employees})"
+        return f"All_Employees_Response(employees={self.employees}, next_cursor={self.next_cursor})"
+
+
+class Department_Count(BaseModel):
+    """Schema for one department's headcount."""
+
+    department: str
+    count: int
+
+
+class Department_Counts_Response(BaseModel):
+    """Schema for the per-department headcounts."""
+
+    departments: list[Department_Count]
 
 
 class Add_Employee(BaseModel):
@@ -34,3 +50,28 @@ class Add_Employee(BaseModel):
 
     def __repr__(self):
         return f"Add_Employee(name={self.name}, department={self.department}, id={self.id})"
+
+
+class Bulk_Row_Error(BaseModel):
+    """Schema for a bulk item that failed validation."""
+
+    index: int = Field(..., description="Position of the item in the body")
+    error: str
+
+
+class Bulk_Chunk_Failure(BaseModel):
+    """Schema for a bulk chunk the database rejected (none of it was saved)."""
+
+    first_index: int
+    last_index: int
+    count: int
+    error: str
+
+
+class Bulk_Employees_Response(BaseModel):
+    """Schema for the bulk add report."""
+
+    inserted: int
+    ids: list[int] = Field(..., description="Assigned ids, in body order")
+    invalid_rows: list[Bulk_Row_Error]
+    failed_chunks: list[Bulk_Chunk_Failure]
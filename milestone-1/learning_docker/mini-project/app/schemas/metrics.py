@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class Pool_Status_Response(BaseModel):
+    """Schema for the connection pool metrics."""
+
+    pool: str
+    connects: int
+    checkouts: int
+    checkins: int
+    # occupancy, reported by sized pools only
+    size: Optional[int] = None
+    checkedin: Optional[int] = None
+    checkedout: Optional[int] = None
+    overflow: Optional[int] = None
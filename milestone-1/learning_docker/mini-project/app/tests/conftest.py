@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# the app imports its modules relative to app/, as uvicorn does in the image
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db import get_engine  # noqa: E402
+from main import app  # noqa: E402
+from models.employee import base  # noqa: E402
+from settings import get_settings  # noqa: E402
+
+
+async def create_tables() -> None:
+    async with get_engine().begin() as connection:
+        await connection.run_sync(base.metadata.create_all)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client over a fresh SQLite database (via aiosqlite)."""
+
+    monkeypatch.setenv(
+        "DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'employees.db'}"
+    )
+    monkeypatch.setenv("DB_POOL_SIZE", "2")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "1")
+    get_settings.cache_clear()
+    with TestClient(app) as test_client:
+        test_client.portal.call(create_tables)
+        yield test_client
+    get_settings.cache_clear()
@@ -0,0 +1,314 @@
+import asyncio
+import json
+
+from sqlalchemy import text
+
+import main
+from cache import MemoryCache, RedisCache, get_cache
+from db import engine_options, get_engine
+from settings import Settings
+
+
+class TestEmployeeEndpoints:
+    def test_add_then_list(self, client) -> None:
+        """Added employees come back from the list endpoint."""
+
+        response = client.post(
+            "/employee", json={"name": "Rohit", "department": "Engineering"}
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "id": 1,
+            "name": "Rohit",
+            "department": "Engineering",
+        }
+
+        assert client.get("/employee").json() == {
+            "employees": [response.json()],
+            "next_cursor": None,
+        }
+
+    def test_keyset_pages_cover_every_row_once(self, client) -> None:
+        """Following next_cursor walks the table in id order, without gaps."""
+
+        for i in range(7):
+            client.post("/employee", json={"name": f"E{i}", "department": "Ops"})
+
+        ids, params = [], {"limit": 3}
+        while True:
+            page = client.get("/employee", params=params).json()
+            ids.extend(employee["id"] for employee in page["employees"])
+            if page["next_cursor"] is None:
+                break
+            params["after_id"] = page["next_cursor"]
+
+        assert ids == list(range(1, 8))
+        assert client.get("/employee", params={"limit": 0}).status_code == 422
+
+    def test_export_streams_every_row(self, client) -> None:
+        """The export returns all rows as NDJSON or as one JSON array."""
+
+        for i in range(3):
+            client.post("/employee", json={"name": f"E{i}", "department": "Ops"})
+
+        response = client.get("/employee/export")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["name"] for row in lines] == ["E0", "E1", "E2"]
+
+        response = client.get("/employee/export", params={"format": "json"})
+        assert response.json() == lines
+
+
+class TestLookupsAndFilters:
+    EMPLOYEES = [
+        {"name": "Rohit", "department": "Engineering"},
+        {"name": "Rohan", "department": "Sales"},
+        {"name": "Asha", "department": "Engineering"},
+        {"name": "Ro_x", "department": "Engineering"},
+    ]
+
+    def test_get_by_id(self, client) -> None:
+        """One employee by id; unknown ids are a 404."""
+
+        client.post("/employee/bulk", json=self.EMPLOYEES)
+
+        assert client.get("/employee/3").json() == {
+            "id": 3,
+            "name": "Asha",
+            "department": "Engineering",
+        }
+        assert client.get("/employee/99").status_code == 404
+
+    def test_filters_combine_with_paging(self, client) -> None:
+        """department and name_prefix narrow the keyset pages."""
+
+        client.post("/employee/bulk", json=self.EMPLOYEES)
+
+        def names(**params):
+            page = client.get("/employee", params=params).json()
+            return [employee["name"] for employee in page["employees"]]
+
+        assert names(department="Engineering") == ["Rohit", "Asha", "Ro_x"]
+        assert names(department="Engineering", after_id=1, limit=1) == ["Asha"]
+        assert names(name_prefix="Ro") == ["Rohit", "Rohan", "Ro_x"]
+        # LIKE wildcards in the prefix match literally
+        assert names(name_prefix="Ro_") == ["Ro_x"]
+        assert names(name_prefix="Ro", department="Sales") == ["Rohan"]
+
+    def test_filter_values_get_their_own_cache_entries(self, client) -> None:
+        """Filter values that print alike are not served each other's pages."""
+
+        client.post("/employee/bulk", json=self.EMPLOYEES)
+        client.post("/employee/bulk", json=[{"name": "c", "department": "a:b"}])
+
+        def names(**params):
+            page = client.get("/employee", params=params).json()
+            return [employee["name"] for employee in page["employees"]]
+
+        assert len(names()) == 5
+        assert names(department="None") == []
+        assert names(department="a:b", name_prefix="c") == ["c"]
+        assert names(department="a", name_prefix="b:c") == []
+
+    def test_department_counts(self, client) -> None:
+        """Headcounts per department, and they follow writes."""
+
+        client.post("/employee/bulk", json=self.EMPLOYEES)
+        assert client.get("/employee/departments").json() == {
+            "departments": [
+                {"department": "Engineering", "count": 3},
+                {"department": "Sales", "count": 1},
+            ]
+        }
+
+        client.post("/employee", json={"name": "Meera", "department": "Sales"})
+        counts = client.get("/employee/departments").json()["departments"]
+        assert counts[1] == {"department": "Sales", "count": 2}
+
+    def test_queries_use_the_indexes(self, client) -> None:
+        """The department queries are index scans, not table scans."""
+
+        async def plans():
+            async with get_engine().connect() as connection:
+                return [
+                    " ".join(
+                        row[-1]
+                        for row in await connection.execute(
+                            text(f"EXPLAIN QUERY PLAN {query}")
+                        )
+                    )
+                    for query in (
+                        "SELECT * FROM employees WHERE department = 'Sales' "
+                        "AND id > 1 ORDER BY id LIMIT 10",
+                        "SELECT department, COUNT(*) FROM employees "
+                        "GROUP BY department",
+                    )
+                ]
+
+        for plan in client.portal.call(plans):
+            assert "ix_employees_department_id" in plan
+            assert "TEMP B-TREE" not in plan
+
+
+class TestBulkAdd:
+    def test_json_array(self, client) -> None:
+        """A JSON array is stored in chunks; invalid items are reported."""
+
+        body = [{"name": f"E{i}", "department": "Ops"} for i in range(5)]
+        body.insert(2, {"name": "No department"})
+
+        report = client.post("/employee/bulk", json=body).json()
+
+        assert report["inserted"] == 5
+        assert report["ids"] == [1, 2, 3, 4, 5]
+        assert report["invalid_rows"] == [
+            {"index": 2, "error": "department: Field required"}
+        ]
+        assert report["failed_chunks"] == []
+        assert len(client.get("/employee").json()["employees"]) == 5
+
+    def test_ndjson_with_failing_chunk(self, client, monkeypatch) -> None:
+        """A chunk the database rejects is rolled back and reported alone."""
+
+        async def reject_bad_names() -> None:
+            async with get_engine().begin() as connection:
+                await connection.execute(
+                    text(
+                        "CREATE TRIGGER reject_bad BEFORE INSERT ON employees "
+                        "WHEN NEW.name = 'BAD' "
+                        "BEGIN SELECT RAISE(ABORT, 'bad name'); END"
+                    )
+                )
+
+        client.portal.call(reject_bad_names)
+        monkeypatch.setattr(main, "BULK_CHUNK_SIZE", 2)
+        names = ["A", "B", "C", "BAD", "E"]
+        body = "\n".join(
+            json.dumps({"name": name, "department": "Ops"}) for name in names
+        )
+
+        report = client.post(
+            "/employee/bulk",
+            content=body + "\nnot json\n",
+            headers={"content-type": "application/x-ndjson"},
+        ).json()
+
+        assert report["inserted"] == 3
+        assert report["failed_chunks"] == [
+            {"first_index": 2, "last_index": 3, "count": 2, "error": "bad name"}
+        ]
+        assert [row["index"] for row in report["invalid_rows"]] == [5]
+        stored = client.get("/employee").json()["employees"]
+        assert [employee["name"] for employee in stored] == ["A", "B", "E"]
+
+
+class FakeRedis:
+    """The part of the redis.asyncio client RedisCache uses."""
+
+    def __init__(self) -> None:
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def aclose(self):
+        pass
+
+
+class TestResponseCache:
+    def test_hits_skip_the_database(self, client) -> None:
+        """Repeated reads are served from the cache until a write."""
+
+        client.post("/employee", json={"name": "A", "department": "Ops"})
+        first = client.get("/employee").json()
+        checkouts = client.get("/metrics/pool").json()["checkouts"]
+
+        assert client.get("/employee").json() == first
+        assert client.get("/metrics/pool").json()["checkouts"] == checkouts
+
+        client.post("/employee/bulk", json=[{"name": "B", "department": "Ops"}])
+        assert len(client.get("/employee").json()["employees"]) == 2
+
+    def test_if_none_match_returns_304(self, client) -> None:
+        """A client holding the current ETag gets an empty 304."""
+
+        response = client.get("/employee")
+        etag = response.headers["etag"]
+
+        unchanged = client.get("/employee", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+
+        client.post("/employee", json={"name": "A", "department": "Ops"})
+        changed = client.get("/employee", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_redis_backend(self, client) -> None:
+        """The shared backend works with any Redis-compatible client."""
+
+        fake = FakeRedis()
+        main.app.dependency_overrides[get_cache] = lambda: RedisCache(fake, ttl=30)
+        try:
+            client.get("/employee")
+            client.post("/employee", json={"name": "A", "department": "Ops"})
+            names = [e["name"] for e in client.get("/employee").json()["employees"]]
+        finally:
+            main.app.dependency_overrides.clear()
+
+        assert names == ["A"]
+        assert fake.data["employee-cache:generation"] == 1
+        assert "employee-cache:1:list:[null, null, null, 100]" in fake.data
+
+    def test_memory_cache_expiry_and_eviction(self) -> None:
+        """Entries expire after the TTL; the least recently used go first."""
+
+        now = [0.0]
+        cache = MemoryCache(max_entries=2, ttl=10, clock=lambda: now[0])
+
+        async def scenario():
+            await cache.set("a", b"1")
+            await cache.set("b", b"2")
+            await cache.get("a")
+            await cache.set("c", b"3")
+            evicted = await cache.get("b")
+            now[0] = 11
+            return evicted, await cache.get("a")
+
+        assert asyncio.run(scenario()) == (None, None)
+
+
+class TestPool:
+    def test_connections_are_reused(self, client) -> None:
+        """Requests check connections out of the pool instead of reconnecting."""
+
+        client.get("/employee")
+        before = client.get("/metrics/pool").json()
+        # distinct pages, so every request misses the response cache
+        for limit in range(1, 6):
+            client.get("/employee", params={"limit": limit})
+        after = client.get("/metrics/pool").json()
+
+        assert after["checkouts"] - before["checkouts"] == 5
+        assert after["connects"] == before["connects"]
+        assert after["size"] == 2
+        assert after["checkedout"] == 0
+
+    def test_settings_reach_the_engine(self) -> None:
+        """Pool sizing is passed through, except for in-memory SQLite."""
+
+        settings = Settings(pool_size=3, max_overflow=4, pool_recycle=60)
+        assert engine_options(settings)["pool_size"] == 3
+        assert engine_options(settings)["max_overflow"] == 4
+        assert engine_options(settings)["pool_recycle"] == 60
+
+        memory = Settings(database_url="sqlite+aiosqlite://")
+        assert "pool_size" not in engine_options(memory)
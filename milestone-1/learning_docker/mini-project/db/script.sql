@@ -1,7 +1,12 @@
 create table employees(
-    id int primary key, 
+    id int generated by default as identity primary key,
     name varchar(50),
     department varchar(50)
 );
 
-insert into employees (id, name, department) values (1, 'Rohit', 'Engineering');
\ No newline at end of file
+-- ids come from the identity column, as for rows the app inserts
+insert into employees (name, department) values ('Rohit', 'Engineering');
+
+-- keep in step with Employee.__table_args__ in app/models/employee.py
+create index ix_employees_department_id on employees (department, id);
+create index ix_employees_name_id on employees (name text_pattern_ops, id);